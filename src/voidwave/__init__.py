@@ -4,7 +4,22 @@ __version__ = "2.0.0"
 __author__ = "VOIDWAVE Team"
 __license__ = "Apache-2.0"
 
-from . import config, core, db, detection, safety
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from . import config, core, db, detection, safety
+
+# Subpackages load on first access, so importing e.g. voidwave.chaining does
+# not pull in the settings (pydantic) and database layers
+_SUBPACKAGES = frozenset({"config", "core", "db", "detection", "safety"})
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _SUBPACKAGES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return import_module(f"{__name__}.{name}")
+
 
 __all__ = [
     "__version__",
@@ -37,6 +37,14 @@ class Requirement:
     fix: Callable[[], bool] | None = None
     alternatives: list[str] = field(default_factory=list)
     auto_label: str = ""
+    # check/fix touch the filesystem or spawn processes; run them off the loop
+    blocking: bool = False
+
+    _has_fix: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute fixability so status checks skip the callable test."""
+        self._has_fix = self.fix is not None
 
     def check_status(self) -> RequirementStatus:
         """Check the status of this requirement."""
@@ -46,7 +54,7 @@ class Requirement:
         except Exception:
             pass
 
-        if self.fix:
+        if self._has_fix:
             return RequirementStatus.FIXABLE
         return RequirementStatus.MANUAL
 
@@ -82,12 +90,10 @@ class PreflightResult:
         if self.all_met:
             return f"All requirements met for {self.action}"
 
-        parts = []
-        if self.fixable:
-            parts.append(f"{len(self.fixable)} fixable")
-        if self.manual:
-            parts.append(f"{len(self.manual)} manual")
-        if self.missing:
-            parts.append(f"{len(self.missing)} missing")
-
-        return f"{self.action}: {', '.join(parts)}"
+        counts = (
+            (len(self.fixable), "fixable"),
+            (len(self.manual), "manual"),
+            (len(self.missing), "missing"),
+        )
+        parts = ", ".join(f"{n} {label}" for n, label in counts if n)
+        return f"{self.action}: {parts}"
@@ -1,40 +1,60 @@
 """Tool fallback management."""
 
+import functools
 import shutil
+from collections.abc import Iterable
+from types import MappingProxyType
 from typing import Any
 
 
 # If primary fails, try these in order
-FALLBACK_CHAINS: dict[str, list[str]] = {
-    "nmap": ["rustscan", "masscan"],
-    "aircrack-ng": ["cowpatty", "hashcat"],
-    "reaver": ["bully"],
-    "hashcat": ["john"],
-    "wireshark": ["tshark", "tcpdump"],
-    "enum4linux-ng": ["enum4linux", "smbclient"],
-    "dnsenum": ["dnsrecon", "dig"],
-    "sslscan": ["sslyze", "openssl"],
-    "gobuster": ["ffuf", "dirsearch"],
-    "subfinder": ["amass", "sublist3r"],
-    "theHarvester": ["theharvester"],  # Different casing
-    "nikto": ["whatweb"],
-    "wpscan": ["nuclei"],
+_FALLBACK_CHAINS: dict[str, tuple[str, ...]] = {
+    "nmap": ("rustscan", "masscan"),
+    "aircrack-ng": ("cowpatty", "hashcat"),
+    "reaver": ("bully",),
+    "hashcat": ("john",),
+    "wireshark": ("tshark", "tcpdump"),
+    "enum4linux-ng": ("enum4linux", "smbclient"),
+    "dnsenum": ("dnsrecon", "dig"),
+    "sslscan": ("sslyze", "openssl"),
+    "gobuster": ("ffuf", "dirsearch"),
+    "subfinder": ("amass", "sublist3r"),
+    "theHarvester": ("theharvester",),  # Different casing
+    "nikto": ("whatweb",),
+    "wpscan": ("nuclei",),
 }
 
+FALLBACK_CHAINS = MappingProxyType(_FALLBACK_CHAINS)
+
+
+@functools.lru_cache(maxsize=256)
+def which(name: str) -> str | None:
+    """Resolve a binary on PATH, cached per process."""
+    return shutil.which(name)
+
+
+def which_many(names: Iterable[str]) -> dict[str, str | None]:
+    """Resolve several binaries through the shared lookup cache.
+
+    Returns a mapping of each name to its full path, or None if not found.
+    """
+    return {name: which(name) for name in names}
+
 
 class FallbackManager:
     """Manages tool fallbacks when primary tools are unavailable."""
 
     def __init__(self) -> None:
-        self.chains = FALLBACK_CHAINS.copy()
+        # Only chains changed through add_chain; defaults are shared
+        self._overrides: dict[str, tuple[str, ...]] = {}
 
     def get_available_tool(self, primary: str) -> str | None:
         """Get the first available tool from the chain."""
-        if shutil.which(primary):
+        if which(primary):
             return primary
 
-        for fallback in self.chains.get(primary, []):
-            if shutil.which(fallback):
+        for fallback in self.get_chain(primary):
+            if which(fallback):
                 return fallback
 
         return None
@@ -44,16 +64,23 @@ class FallbackManager:
         available = self.get_available_tool(primary)
         return {
             "primary": primary,
-            "primary_available": shutil.which(primary) is not None,
+            "primary_available": which(primary) is not None,
             "using": available,
             "is_fallback": available != primary if available else False,
-            "chain": self.chains.get(primary, []),
+            "chain": self.get_chain(primary),
         }
 
-    def add_chain(self, primary: str, fallbacks: list[str]) -> None:
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        """Forget cached PATH lookups, e.g. after installing a tool."""
+        which.cache_clear()
+
+    def add_chain(self, primary: str, fallbacks: Iterable[str]) -> None:
         """Add or update a fallback chain."""
-        self.chains[primary] = fallbacks
+        self._overrides[primary] = tuple(fallbacks)
 
-    def get_chain(self, primary: str) -> list[str]:
+    def get_chain(self, primary: str) -> tuple[str, ...]:
         """Get the fallback chain for a tool."""
-        return self.chains.get(primary, [])
+        if primary in self._overrides:
+            return self._overrides[primary]
+        return FALLBACK_CHAINS.get(primary, ())
@@ -1,18 +1,50 @@
-"""AUTO-* handlers for the automation framework."""
-
-from voidwave.automation.handlers.install import AutoInstallHandler
-from voidwave.automation.handlers.privilege import AutoPrivHandler
-from voidwave.automation.handlers.monitor import AutoMonHandler
-from voidwave.automation.handlers.iface import AutoIfaceHandler
-from voidwave.automation.handlers.acquire import AutoAcquireHandler
-from voidwave.automation.handlers.data import AutoDataHandler
-from voidwave.automation.handlers.keys import AutoKeysHandler
-from voidwave.automation.handlers.setup import AutoSetupHandler
-from voidwave.automation.handlers.fallback import AutoFallbackHandler
-from voidwave.automation.handlers.guide import AutoGuideHandler
-from voidwave.automation.handlers.cleanup import AutoCleanupHandler
-from voidwave.automation.handlers.validate import AutoValidateHandler
-from voidwave.automation.handlers.update import AutoUpdateHandler
+"""AUTO-* handlers for the automation framework.
+
+Handler classes are imported on first access so that using one handler
+does not load every handler module.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from voidwave.automation.handlers.install import AutoInstallHandler
+    from voidwave.automation.handlers.privilege import AutoPrivHandler
+    from voidwave.automation.handlers.monitor import AutoMonHandler
+    from voidwave.automation.handlers.iface import AutoIfaceHandler
+    from voidwave.automation.handlers.acquire import AutoAcquireHandler
+    from voidwave.automation.handlers.data import AutoDataHandler
+    from voidwave.automation.handlers.keys import AutoKeysHandler
+    from voidwave.automation.handlers.setup import AutoSetupHandler
+    from voidwave.automation.handlers.fallback import AutoFallbackHandler
+    from voidwave.automation.handlers.guide import AutoGuideHandler
+    from voidwave.automation.handlers.cleanup import AutoCleanupHandler
+    from voidwave.automation.handlers.validate import AutoValidateHandler
+    from voidwave.automation.handlers.update import AutoUpdateHandler
+
+_HANDLER_MODULES = {
+    "AutoInstallHandler": "install",
+    "AutoPrivHandler": "privilege",
+    "AutoMonHandler": "monitor",
+    "AutoIfaceHandler": "iface",
+    "AutoAcquireHandler": "acquire",
+    "AutoDataHandler": "data",
+    "AutoKeysHandler": "keys",
+    "AutoSetupHandler": "setup",
+    "AutoFallbackHandler": "fallback",
+    "AutoGuideHandler": "guide",
+    "AutoCleanupHandler": "cleanup",
+    "AutoValidateHandler": "validate",
+    "AutoUpdateHandler": "update",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _HANDLER_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(f"{__name__}.{module}"), name)
+
 
 __all__ = [
     "AutoInstallHandler",
@@ -1,18 +1,66 @@
 """AUTO-ACQUIRE handler for acquiring missing inputs."""
 
+from types import MappingProxyType
 from typing import Any
+from weakref import WeakValueDictionary
 
 from voidwave.automation.labels import AUTO_REGISTRY
 from voidwave.automation.subflows import SubflowManager, SubflowType
 
+_PROMPTS = MappingProxyType(
+    {
+        "target": "No target selected. Scan for networks?",
+        "target_wifi": "No WiFi target selected. Scan for networks?",
+        "target_host": "No host target specified. Enter target IP/hostname?",
+        "client": "No client selected. Scan for clients?",
+        "handshake": "No handshake captured. Capture now?",
+        "pmkid": "No PMKID captured. Capture now?",
+        "wordlist": "No wordlist selected. Download default?",
+        "portal": "No portal assets. Generate defaults?",
+        "certs": "No certificates found. Generate self-signed?",
+        "capture_file": "No capture file selected. Browse for file?",
+        "hash_file": "No hash file selected. Browse for file?",
+    }
+)
 
+_SUBFLOW_MAP = MappingProxyType(
+    {
+        "target": SubflowType.SCAN_NETWORKS,
+        "target_wifi": SubflowType.SCAN_NETWORKS,
+        "target_host": SubflowType.ENTER_TARGET,
+        "client": SubflowType.SCAN_CLIENTS,
+        "handshake": SubflowType.CAPTURE_HANDSHAKE,
+        "pmkid": SubflowType.CAPTURE_PMKID,
+        "wordlist": SubflowType.DOWNLOAD_WORDLIST,
+        "portal": SubflowType.GENERATE_PORTAL,
+        "certs": SubflowType.GENERATE_CERTS,
+    }
+)
+
+# One SubflowManager per live session, shared by all acquire handlers.
+# Managers hold their session, so an id() key cannot be reused while cached.
+_MANAGERS: WeakValueDictionary[int, SubflowManager] = WeakValueDictionary()
+
+
+def _manager_for(session: Any) -> SubflowManager | None:
+    """Get the shared SubflowManager for a session."""
+    if not session:
+        return None
+    manager = _MANAGERS.get(id(session))
+    if manager is None:
+        manager = SubflowManager(session)
+        _MANAGERS[id(session)] = manager
+    return manager
+
+
+@AUTO_REGISTRY.auto("AUTO-ACQUIRE")
 class AutoAcquireHandler:
     """Handles AUTO-ACQUIRE for acquiring missing inputs through subflows."""
 
     def __init__(self, input_type: str = "", session: Any = None) -> None:
         self.input_type = input_type
         self.session = session
-        self.subflow_manager = SubflowManager(session) if session else None
+        self.subflow_manager = _manager_for(session)
 
     async def can_fix(self) -> bool:
         """Acquisition subflows are always available."""
@@ -33,36 +81,8 @@ class AutoAcquireHandler:
 
     async def get_ui_prompt(self) -> str:
         """Get the UI prompt for this fix."""
-        prompts = {
-            "target": "No target selected. Scan for networks?",
-            "target_wifi": "No WiFi target selected. Scan for networks?",
-            "target_host": "No host target specified. Enter target IP/hostname?",
-            "client": "No client selected. Scan for clients?",
-            "handshake": "No handshake captured. Capture now?",
-            "pmkid": "No PMKID captured. Capture now?",
-            "wordlist": "No wordlist selected. Download default?",
-            "portal": "No portal assets. Generate defaults?",
-            "certs": "No certificates found. Generate self-signed?",
-            "capture_file": "No capture file selected. Browse for file?",
-            "hash_file": "No hash file selected. Browse for file?",
-        }
-        return prompts.get(self.input_type, f"Acquire {self.input_type}?")
+        return _PROMPTS.get(self.input_type, f"Acquire {self.input_type}?")
 
     def get_subflow_type(self) -> SubflowType:
         """Get the subflow type for this input."""
-        mapping = {
-            "target": SubflowType.SCAN_NETWORKS,
-            "target_wifi": SubflowType.SCAN_NETWORKS,
-            "target_host": SubflowType.ENTER_TARGET,
-            "client": SubflowType.SCAN_CLIENTS,
-            "handshake": SubflowType.CAPTURE_HANDSHAKE,
-            "pmkid": SubflowType.CAPTURE_PMKID,
-            "wordlist": SubflowType.DOWNLOAD_WORDLIST,
-            "portal": SubflowType.GENERATE_PORTAL,
-            "certs": SubflowType.GENERATE_CERTS,
-        }
-        return mapping.get(self.input_type, SubflowType.ENTER_TARGET)
-
-
-# Register the handler
-AUTO_REGISTRY.register("AUTO-ACQUIRE", AutoAcquireHandler)
+        return _SUBFLOW_MAP.get(self.input_type, SubflowType.ENTER_TARGET)
@@ -1,28 +1,61 @@
 """AUTO-CLEANUP handler for restoring system state."""
 
 import asyncio
+import bisect
+import inspect
+import itertools
 from dataclasses import dataclass, field
-from typing import Callable, Any
+from typing import Awaitable, Callable, Any
 
 from voidwave.automation.labels import AUTO_REGISTRY
 from voidwave.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Static cleanup command lines
+_RESTORE_NM_ARGV = ("systemctl", "start", "NetworkManager")
+_DISABLE_IP_FORWARD_ARGV = ("sysctl", "-w", "net.ipv4.ip_forward=0")
+_STOP_HOSTAPD_ARGV = ("killall", "hostapd")
+_STOP_DNSMASQ_ARGV = ("killall", "dnsmasq")
+
+# -w waits for the xtables lock so the flushes can run concurrently
+_FLUSH_IPTABLES_ARGV: tuple[tuple[str, ...], ...] = (
+    ("iptables", "-w", "-F"),
+    ("iptables", "-w", "-t", "nat", "-F"),
+    ("iptables", "-w", "-t", "mangle", "-F"),
+)
+
+
+async def _run(*argv: str) -> int:
+    """Run a command without a shell, discarding output."""
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *argv,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+    except OSError as e:
+        logger.debug(f"Cleanup command {argv[0]} could not start: {e}")
+        return 127
+    return await proc.wait()
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CleanupAction:
     """A cleanup action to be performed."""
 
     name: str
     action: Callable[[], Any]
     priority: int = 0  # Higher = execute first
+    is_async: bool = False  # Coroutine function, resolved at registration
 
 
+@AUTO_REGISTRY.auto("AUTO-CLEANUP")
 class AutoCleanupHandler:
     """Handles AUTO-CLEANUP for restoring system state after operations."""
 
-    # Class-level cleanup stack shared across instances
+    # Class-level cleanup stack shared across instances, kept in
+    # execution order (highest priority first, FIFO within a priority)
     _cleanup_stack: list[CleanupAction] = []
 
     def __init__(self) -> None:
@@ -51,33 +84,62 @@ class AutoCleanupHandler:
         priority: int = 0,
     ) -> None:
         """Register a cleanup action to be performed later."""
-        cls._cleanup_stack.append(
-            CleanupAction(name=name, action=action, priority=priority)
+        bisect.insort(
+            cls._cleanup_stack,
+            CleanupAction(
+                name=name,
+                action=action,
+                priority=priority,
+                is_async=inspect.iscoroutinefunction(action),
+            ),
+            key=lambda x: -x.priority,
         )
 
     @classmethod
     async def cleanup_all(cls) -> bool:
-        """Perform all cleanup actions in order."""
-        # Sort by priority (higher first)
-        actions = sorted(cls._cleanup_stack, key=lambda x: x.priority, reverse=True)
+        """Perform all cleanup actions in order.
+
+        Actions sharing a priority are independent and run concurrently;
+        priority bands still execute from highest to lowest.
+        """
+        actions = cls._cleanup_stack[:]
         cls._cleanup_stack.clear()
 
         success = True
-        for action in actions:
-            try:
-                result = action.action()
+        for _, band in itertools.groupby(actions, key=lambda x: x.priority):
+            pending: list[tuple[CleanupAction, Awaitable[Any]]] = []
+            for action in band:
+                if action.is_async:
+                    pending.append((action, action.action()))
+                    continue
+                try:
+                    result = action.action()
+                except Exception as e:
+                    logger.warning(f"Cleanup action failed: {action.name}: {e}")
+                    success = False
+                    continue
+                # Sync callables may still hand back a coroutine (lambdas)
                 if asyncio.iscoroutine(result):
-                    await result
-                logger.debug(f"Cleanup action completed: {action.name}")
-            except Exception as e:
-                logger.warning(f"Cleanup action failed: {action.name}: {e}")
-                success = False
+                    pending.append((action, result))
+                else:
+                    logger.debug(f"Cleanup action completed: {action.name}")
+
+            results = await asyncio.gather(
+                *(coro for _, coro in pending),
+                return_exceptions=True,
+            )
+            for (action, _), result in zip(pending, results, strict=True):
+                if isinstance(result, BaseException):
+                    logger.warning(f"Cleanup action failed: {action.name}: {result}")
+                    success = False
+                else:
+                    logger.debug(f"Cleanup action completed: {action.name}")
 
         return success
 
     @classmethod
     def get_pending_actions(cls) -> list[str]:
-        """Get list of pending cleanup action names."""
+        """Get list of pending cleanup action names in execution order."""
         return [action.name for action in cls._cleanup_stack]
 
     @classmethod
@@ -89,85 +151,36 @@ class AutoCleanupHandler:
     @classmethod
     async def restore_network_manager(cls) -> bool:
         """Restore NetworkManager service."""
-        proc = await asyncio.create_subprocess_shell(
-            "systemctl start NetworkManager",
-            stdout=asyncio.subprocess.DEVNULL,
-            stderr=asyncio.subprocess.DEVNULL,
-        )
-        await proc.wait()
-        return proc.returncode == 0
+        return await _run(*_RESTORE_NM_ARGV) == 0
 
     @classmethod
     async def restore_managed_mode(cls, interface: str) -> bool:
         """Restore interface to managed mode."""
-        commands = [
-            f"ip link set {interface} down",
-            f"iw dev {interface} set type managed",
-            f"ip link set {interface} up",
-        ]
-
-        for cmd in commands:
-            proc = await asyncio.create_subprocess_shell(
-                cmd,
-                stdout=asyncio.subprocess.DEVNULL,
-                stderr=asyncio.subprocess.DEVNULL,
-            )
-            await proc.wait()
-
+        await _run("ip", "link", "set", interface, "down")
+        await _run("iw", "dev", interface, "set", "type", "managed")
+        await _run("ip", "link", "set", interface, "up")
         return True
 
     @classmethod
     async def disable_ip_forwarding(cls) -> bool:
         """Disable IP forwarding."""
-        proc = await asyncio.create_subprocess_shell(
-            "sysctl -w net.ipv4.ip_forward=0",
-            stdout=asyncio.subprocess.DEVNULL,
-            stderr=asyncio.subprocess.DEVNULL,
-        )
-        await proc.wait()
-        return proc.returncode == 0
+        return await _run(*_DISABLE_IP_FORWARD_ARGV) == 0
 
     @classmethod
     async def flush_iptables(cls) -> bool:
         """Flush iptables rules."""
-        commands = [
-            "iptables -F",
-            "iptables -t nat -F",
-            "iptables -t mangle -F",
-        ]
-
-        for cmd in commands:
-            proc = await asyncio.create_subprocess_shell(
-                cmd,
-                stdout=asyncio.subprocess.DEVNULL,
-                stderr=asyncio.subprocess.DEVNULL,
-            )
-            await proc.wait()
-
+        await asyncio.gather(*(_run(*argv) for argv in _FLUSH_IPTABLES_ARGV))
         return True
 
     @classmethod
     async def stop_hostapd(cls) -> bool:
         """Stop hostapd service."""
-        proc = await asyncio.create_subprocess_shell(
-            "killall hostapd 2>/dev/null; true",
-            stdout=asyncio.subprocess.DEVNULL,
-            stderr=asyncio.subprocess.DEVNULL,
-        )
-        await proc.wait()
+        # Non-zero exit just means nothing was running
+        await _run(*_STOP_HOSTAPD_ARGV)
         return True
 
     @classmethod
     async def stop_dnsmasq(cls) -> bool:
         """Stop dnsmasq service."""
-        proc = await asyncio.create_subprocess_shell(
-            "killall dnsmasq 2>/dev/null; true",
-            stdout=asyncio.subprocess.DEVNULL,
-            stderr=asyncio.subprocess.DEVNULL,
-        )
-        await proc.wait()
+        await _run(*_STOP_DNSMASQ_ARGV)
         return True
-
-
-# Register the handler
-AUTO_REGISTRY.register("AUTO-CLEANUP", AutoCleanupHandler)
@@ -1,16 +1,20 @@
 """AUTO-DATA handler for downloading data files."""
 
 import asyncio
+import functools
+import importlib.util
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
+from voidwave.automation.fallbacks import which
 from voidwave.automation.labels import AUTO_REGISTRY
 from voidwave.core.constants import VOIDWAVE_DATA_DIR, VOIDWAVE_WORDLISTS_DIR
 
 
-def _get_data_sources() -> dict[str, dict[str, Any]]:
-    """Get data sources with resolved paths."""
-    return {
+# Downloadable data sources, resolved once at import
+DATA_SOURCES: MappingProxyType[str, dict[str, Any]] = MappingProxyType(
+    {
         "rockyou": {
             "url": "https://github.com/brannondorsey/naive-hashcat/releases/download/data/rockyou.txt",
             "dest": str(VOIDWAVE_WORDLISTS_DIR / "rockyou.txt"),
@@ -30,8 +34,65 @@ def _get_data_sources() -> dict[str, dict[str, Any]]:
             "description": "Common subdomain names",
         },
     }
+)
+
+# Seconds allowed to connect, and between reads, for in-process downloads;
+# no total limit, so large wordlists can finish on slow links
+_CONNECT_TIMEOUT = 30.0
+_READ_TIMEOUT = 60.0
+
+
+@functools.cache
+def _has_aiohttp() -> bool:
+    """Check whether aiohttp is installed for in-process downloads."""
+    return importlib.util.find_spec("aiohttp") is not None
+
+
+async def _download_http(url: str, dest: Path) -> bool:
+    """Stream a URL to disk with aiohttp, avoiding a curl/wget fork."""
+    import aiohttp
+
+    partial = dest.with_name(dest.name + ".part")
+    timeout = aiohttp.ClientTimeout(
+        total=None, sock_connect=_CONNECT_TIMEOUT, sock_read=_READ_TIMEOUT
+    )
+    try:
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            async with session.get(url) as response:
+                if response.status != 200:
+                    return False
+                with partial.open("wb") as fh:
+                    async for chunk in response.content.iter_chunked(1 << 16):
+                        # Keep disk writes off the event loop
+                        await asyncio.to_thread(fh.write, chunk)
+        partial.replace(dest)
+        return True
+    except (aiohttp.ClientError, TimeoutError, OSError):
+        return False
+    finally:
+        partial.unlink(missing_ok=True)
+
+
+async def _download_subprocess(url: str, dest: Path) -> bool:
+    """Download a URL with curl or wget."""
+    if which("curl"):
+        argv = ["curl", "-L", "-o", str(dest), url]
+    else:
+        argv = ["wget", "-O", str(dest), url]
+
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *argv,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+    except OSError:
+        return False
+    await proc.communicate()
+    return proc.returncode == 0
 
 
+@AUTO_REGISTRY.auto("AUTO-DATA")
 class AutoDataHandler:
     """Handles AUTO-DATA for downloading data files."""
 
@@ -42,15 +103,14 @@ class AutoDataHandler:
 
     async def can_fix(self) -> bool:
         """Check if we can download the data."""
-        # Need curl or wget
-        import shutil
-
-        return shutil.which("curl") is not None or shutil.which("wget") is not None
+        # Need aiohttp, curl or wget
+        if _has_aiohttp():
+            return True
+        return which("curl") is not None or which("wget") is not None
 
     async def fix(self) -> bool:
         """Download the data file."""
-        data_sources = _get_data_sources()
-        source = data_sources.get(self.data_type)
+        source = DATA_SOURCES.get(self.data_type)
         if source:
             url = source["url"]
             dest = Path(source["dest"])
@@ -64,21 +124,12 @@ class AutoDataHandler:
         dest.parent.mkdir(parents=True, exist_ok=True)
 
         # Download
-        import shutil
-
-        if shutil.which("curl"):
-            cmd = f"curl -L -o {dest} {url}"
+        if _has_aiohttp():
+            ok = await _download_http(url, dest)
         else:
-            cmd = f"wget -O {dest} {url}"
-
-        proc = await asyncio.create_subprocess_shell(
-            cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        await proc.wait()
+            ok = await _download_subprocess(url, dest)
 
-        if proc.returncode == 0 and dest.exists():
+        if ok and dest.exists():
             self.dest_path = dest
             return True
 
@@ -86,8 +137,7 @@ class AutoDataHandler:
 
     async def get_ui_prompt(self) -> str:
         """Get the UI prompt for this fix."""
-        data_sources = _get_data_sources()
-        source = data_sources.get(self.data_type)
+        source = DATA_SOURCES.get(self.data_type)
         if source:
             return f"Download {self.data_type} ({source['size']}) - {source['description']}?"
         return f"Download {self.data_type}?"
@@ -95,21 +145,14 @@ class AutoDataHandler:
     @staticmethod
     def list_available_data() -> list[dict[str, Any]]:
         """List available data sources for download."""
-        data_sources = _get_data_sources()
-        result = []
-        for key, source in data_sources.items():
-            result.append(
-                {
-                    "name": key,
-                    "url": source["url"],
-                    "dest": source["dest"],
-                    "size": source["size"],
-                    "description": source["description"],
-                    "exists": Path(source["dest"]).exists(),
-                }
-            )
-        return result
-
-
-# Register the handler
-AUTO_REGISTRY.register("AUTO-DATA", AutoDataHandler)
+        return [
+            {
+                "name": key,
+                "url": source["url"],
+                "dest": source["dest"],
+                "size": source["size"],
+                "description": source["description"],
+                "exists": Path(source["dest"]).exists(),
+            }
+            for key, source in DATA_SOURCES.items()
+        ]
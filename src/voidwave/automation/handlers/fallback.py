@@ -1,11 +1,10 @@
 """AUTO-FALLBACK handler for switching to alternate tools."""
 
-import shutil
-
 from voidwave.automation.labels import AUTO_REGISTRY
-from voidwave.automation.fallbacks import FALLBACK_CHAINS
+from voidwave.automation.fallbacks import FALLBACK_CHAINS, which, which_many
 
 
+@AUTO_REGISTRY.auto("AUTO-FALLBACK")
 class AutoFallbackHandler:
     """Handles AUTO-FALLBACK for switching to alternate tools."""
 
@@ -19,9 +18,9 @@ class AutoFallbackHandler:
         if not self.primary:
             return False
 
-        chain = FALLBACK_CHAINS.get(self.primary, [])
-        for tool in chain:
-            if shutil.which(tool):
+        resolved = which_many(FALLBACK_CHAINS.get(self.primary, ()))
+        for tool, path in resolved.items():
+            if path:
                 self.fallback = tool
                 return True
 
@@ -29,7 +28,7 @@ class AutoFallbackHandler:
 
     async def fix(self) -> bool:
         """Switch to the fallback tool."""
-        if self.fallback and shutil.which(self.fallback):
+        if self.fallback and which(self.fallback):
             self.selected_tool = self.fallback
             return True
         return False
@@ -45,13 +44,9 @@ class AutoFallbackHandler:
         if not self.primary:
             return []
 
-        chain = FALLBACK_CHAINS.get(self.primary, [])
-        return [tool for tool in chain if shutil.which(tool)]
+        resolved = which_many(FALLBACK_CHAINS.get(self.primary, ()))
+        return [tool for tool, path in resolved.items() if path]
 
-    def get_fallback_chain(self) -> list[str]:
+    def get_fallback_chain(self) -> tuple[str, ...]:
         """Get the full fallback chain for the primary tool."""
-        return FALLBACK_CHAINS.get(self.primary, [])
-
-
-# Register the handler
-AUTO_REGISTRY.register("AUTO-FALLBACK", AutoFallbackHandler)
+        return FALLBACK_CHAINS.get(self.primary, ())
@@ -1,79 +1,91 @@
 """AUTO-GUIDE handler for displaying manual steps."""
 
+from collections.abc import Mapping, Sequence
+from types import MappingProxyType
 from typing import Any
 
 from voidwave.automation.labels import AUTO_REGISTRY
 
 
 # Guidance for common issues
-GUIDES: dict[str, dict[str, Any]] = {
+_GUIDES: dict[str, dict[str, Any]] = {
     "wireless_adapter": {
         "title": "Wireless Adapter Required",
-        "steps": [
+        "steps": (
             "Connect a monitor-mode capable USB WiFi adapter",
             "Recommended: Alfa AWUS036ACH (dual-band)",
             "Alternative: Alfa AWUS036AXML (WiFi 6E)",
             "Install drivers if required (rtl8812au, rtl8814au)",
             "Click Rescan to detect the adapter",
-        ],
-        "links": [
+        ),
+        "links": (
             ("Driver installation guide", "https://github.com/aircrack-ng/rtl8812au"),
             ("Recommended adapters", "https://www.aircrack-ng.org/doku.php?id=compatible_cards"),
-        ],
+        ),
     },
     "gpu_hashcat": {
         "title": "GPU Required for Hashcat",
-        "steps": [
+        "steps": (
             "Install GPU drivers (NVIDIA: CUDA, AMD: ROCm)",
             "For NVIDIA: sudo apt install nvidia-cuda-toolkit",
             "For AMD: Follow ROCm installation guide",
             "Verify with: hashcat -I",
-        ],
-        "links": [
+        ),
+        "links": (
             ("NVIDIA CUDA installation", "https://developer.nvidia.com/cuda-downloads"),
             ("AMD ROCm installation", "https://rocm.docs.amd.com/"),
-        ],
+        ),
     },
     "metasploit_db": {
         "title": "Metasploit Database Setup",
-        "steps": [
+        "steps": (
             "Initialize database: msfdb init",
             "Start PostgreSQL: sudo systemctl start postgresql",
             "Connect in msfconsole: db_connect",
-        ],
-        "links": [],
+        ),
+        "links": (),
     },
     "gui_tool": {
         "title": "GUI Tool Required",
-        "steps": [
+        "steps": (
             "This tool requires a graphical interface",
             "Connect via VNC or X11 forwarding if remote",
             "Or use the CLI alternative if available",
-        ],
-        "links": [],
+        ),
+        "links": (),
     },
     "hostapd_wpe": {
         "title": "hostapd-wpe Installation",
-        "steps": [
+        "steps": (
             "Clone the repository: git clone https://github.com/aircrack-ng/hostapd-wpe",
             "Install dependencies: sudo apt install libssl-dev libnl-3-dev",
             "Build: cd hostapd-wpe && make",
             "Install: sudo make install",
-        ],
-        "links": [
+        ),
+        "links": (
             ("hostapd-wpe GitHub", "https://github.com/aircrack-ng/hostapd-wpe"),
-        ],
+        ),
     },
 }
 
+GUIDES: Mapping[str, Mapping[str, Any]] = MappingProxyType(
+    {name: MappingProxyType(guide) for name, guide in _GUIDES.items()}
+)
 
+# Shared defaults so misses don't allocate
+_EMPTY_GUIDE: Mapping[str, Any] = MappingProxyType({})
+_EMPTY_STEPS: tuple[str, ...] = ()
+_EMPTY_LINKS: tuple[tuple[str, str], ...] = ()
+
+
+@AUTO_REGISTRY.auto("AUTO-GUIDE")
 class AutoGuideHandler:
     """Handles AUTO-GUIDE for displaying manual steps."""
 
     def __init__(self, guide_type: str = "", custom_steps: list[str] | None = None) -> None:
         self.guide_type = guide_type
-        self.custom_steps = custom_steps or []
-        self.guide = GUIDES.get(guide_type, {})
+        self.custom_steps = tuple(custom_steps) if custom_steps else _EMPTY_STEPS
+        self.guide = GUIDES.get(guide_type, _EMPTY_GUIDE)
 
     async def can_fix(self) -> bool:
         """Guidance is always available but doesn't fix anything."""
@@ -89,15 +101,15 @@ class AutoGuideHandler:
             return self.guide.get("title", "Manual Steps Required")
         return "Manual configuration required."
 
-    def get_steps(self) -> list[str]:
+    def get_steps(self) -> Sequence[str]:
         """Get the guidance steps."""
         if self.custom_steps:
             return self.custom_steps
-        return self.guide.get("steps", [])
+        return self.guide.get("steps", _EMPTY_STEPS)
 
-    def get_links(self) -> list[tuple[str, str]]:
+    def get_links(self) -> Sequence[tuple[str, str]]:
         """Get related documentation links."""
-        return self.guide.get("links", [])
+        return self.guide.get("links", _EMPTY_LINKS)
 
     def get_title(self) -> str:
         """Get the guide title."""
@@ -107,7 +119,3 @@ class AutoGuideHandler:
     def list_guides() -> list[str]:
         """List available guide types."""
         return list(GUIDES.keys())
-
-
-# Register the handler
-AUTO_REGISTRY.register("AUTO-GUIDE", AutoGuideHandler)
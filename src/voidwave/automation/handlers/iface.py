@@ -1,11 +1,65 @@
 """AUTO-IFACE handler for interface selection."""
 
 import asyncio
-from pathlib import Path
+import os
 from dataclasses import dataclass
 
 from voidwave.automation.labels import AUTO_REGISTRY
 
+_SYS_NET = "/sys/class/net"
+
+# ARPHRD_IEEE80211_RADIOTAP, reported by interfaces in monitor mode
+_ARPHRD_IEEE80211_RADIOTAP = 803
+
+
+def is_monitor_mode(interface: str) -> bool:
+    """Check if an interface is in monitor mode via its sysfs link type."""
+    try:
+        with open(os.path.join(_SYS_NET, interface, "type"), "rb") as f:
+            return int(f.read()) == _ARPHRD_IEEE80211_RADIOTAP
+    except (OSError, ValueError):
+        return False
+
+
+def scan_interfaces() -> list[tuple[str, str, bool]]:
+    """List (name, sysfs path, is_wireless) for every non-loopback interface."""
+    try:
+        with os.scandir(_SYS_NET) as it:
+            return [
+                (entry.name, entry.path, os.path.isdir(entry.path + "/wireless"))
+                for entry in it
+                if entry.name != "lo"
+            ]
+    except OSError:
+        return []
+
+
+def _read_attr(iface_path: str, attr: str, default: str) -> str:
+    """Read a single sysfs attribute of an interface."""
+    try:
+        with open(f"{iface_path}/{attr}", "rb") as f:
+            return f.read().strip().decode()
+    except (OSError, UnicodeDecodeError):
+        return default
+
+
+def _read_driver(iface_path: str) -> str:
+    """Get the driver for an interface."""
+    try:
+        return os.path.basename(os.readlink(f"{iface_path}/device/driver"))
+    except OSError:
+        return "unknown"
+
+
+def _read_mac(iface_path: str) -> str:
+    """Get the MAC address for an interface."""
+    return _read_attr(iface_path, "address", "00:00:00:00:00:00")
+
+
+def _read_state(iface_path: str) -> str:
+    """Get the operational state of an interface."""
+    return _read_attr(iface_path, "operstate", "unknown")
+
 
 @dataclass
 class InterfaceInfo:
@@ -18,6 +72,7 @@ class InterfaceInfo:
     state: str  # up, down
 
 
+@AUTO_REGISTRY.auto("AUTO-IFACE")
 class AutoIfaceHandler:
     """Handles AUTO-IFACE for interface selection."""
 
@@ -59,92 +114,43 @@ class AutoIfaceHandler:
 
     async def get_interfaces(self, iface_type: str = "all") -> list[InterfaceInfo]:
         """Get available network interfaces."""
-        interfaces = []
-        net_path = Path("/sys/class/net")
-
-        if not net_path.exists():
-            return interfaces
-
-        for iface_path in net_path.iterdir():
-            name = iface_path.name
-
-            # Skip loopback
-            if name == "lo":
-                continue
-
-            # Determine type
-            is_wireless = (iface_path / "wireless").exists()
-            is_monitor = await self._is_monitor_mode(name)
-
-            if is_monitor:
-                interface_type = "monitor"
-            elif is_wireless:
-                interface_type = "wireless"
-            else:
-                interface_type = "wired"
-
-            # Filter by type
-            if iface_type != "all" and interface_type != iface_type:
-                if not (iface_type == "wireless" and interface_type == "monitor"):
-                    continue
-
-            # Get additional info
-            driver = await self._get_driver(iface_path)
-            mac = await self._get_mac(iface_path)
-            state = await self._get_state(iface_path)
-
-            interfaces.append(
-                InterfaceInfo(
-                    name=name,
-                    type=interface_type,
-                    driver=driver,
-                    mac=mac,
-                    state=state,
-                )
+        # Probe every interface concurrently (skip loopback)
+        results = await asyncio.gather(
+            *(
+                self._probe(name, iface_path, is_wireless, iface_type)
+                for name, iface_path, is_wireless in scan_interfaces()
             )
-
-        return interfaces
-
-    async def _is_monitor_mode(self, interface: str) -> bool:
-        """Check if interface is in monitor mode."""
-        proc = await asyncio.create_subprocess_shell(
-            f"iw dev {interface} info 2>/dev/null | grep -q 'type monitor'",
-            stdout=asyncio.subprocess.DEVNULL,
-            stderr=asyncio.subprocess.DEVNULL,
         )
-        await proc.wait()
-        return proc.returncode == 0
-
-    async def _get_driver(self, iface_path: Path) -> str:
-        """Get the driver for an interface."""
-        driver_link = iface_path / "device" / "driver"
-        try:
-            if driver_link.exists():
-                return driver_link.resolve().name
-        except Exception:
-            pass
-        return "unknown"
-
-    async def _get_mac(self, iface_path: Path) -> str:
-        """Get the MAC address for an interface."""
-        address_file = iface_path / "address"
-        try:
-            if address_file.exists():
-                return address_file.read_text().strip()
-        except Exception:
-            pass
-        return "00:00:00:00:00:00"
-
-    async def _get_state(self, iface_path: Path) -> str:
-        """Get the operational state of an interface."""
-        operstate_file = iface_path / "operstate"
-        try:
-            if operstate_file.exists():
-                return operstate_file.read_text().strip()
-        except Exception:
-            pass
-        return "unknown"
-
+        return [info for info in results if info is not None]
+
+    async def _probe(
+        self, name: str, iface_path: str, is_wireless: bool, iface_type: str
+    ) -> InterfaceInfo | None:
+        """Gather metadata for one interface, or None if filtered out."""
+        is_monitor = is_monitor_mode(name)
+        driver, mac, state = await asyncio.gather(
+            asyncio.to_thread(_read_driver, iface_path),
+            asyncio.to_thread(_read_mac, iface_path),
+            asyncio.to_thread(_read_state, iface_path),
+        )
 
-# Register the handler
-AUTO_REGISTRY.register("AUTO-IFACE", AutoIfaceHandler)
+        # Determine type
+        if is_monitor:
+            interface_type = "monitor"
+        elif is_wireless:
+            interface_type = "wireless"
+        else:
+            interface_type = "wired"
+
+        # Filter by type
+        if iface_type != "all" and interface_type != iface_type:
+            if not (iface_type == "wireless" and interface_type == "monitor"):
+                return None
+
+        return InterfaceInfo(
+            name=name,
+            type=interface_type,
+            driver=driver,
+            mac=mac,
+            state=state,
+        )
@@ -1,9 +1,10 @@
 """AUTO-INSTALL handler for installing missing tools."""
 
 import asyncio
-import shutil
-from pathlib import Path
+import functools
+import sys
 
+from voidwave.automation.fallbacks import which
 from voidwave.automation.labels import AUTO_REGISTRY
 
 
@@ -49,29 +50,115 @@ PACKAGE_MAP: dict[str, dict[str, str]] = {
     "searchsploit": {"debian": "exploitdb", "arch": "exploitdb", "fedora": "exploitdb"},
 }
 
+# Install argv (minus the package name) per package manager
+_INSTALL_ARGV: dict[str, tuple[str, ...]] = {
+    "apt": ("sudo", "apt-get", "install", "-y"),
+    "dnf": ("sudo", "dnf", "install", "-y"),
+    "pacman": ("sudo", "pacman", "-S", "--noconfirm"),
+    "zypper": ("sudo", "zypper", "install", "-y"),
+    "apk": ("sudo", "apk", "add"),
+}
+
+# Flattened (tool, distro) -> package index; package names repeat heavily
+_PKG_FLAT: dict[tuple[str, str], str] = {
+    (tool, distro): sys.intern(pkg)
+    for tool, by_distro in PACKAGE_MAP.items()
+    for distro, pkg in by_distro.items()
+}
+
+
+# Query argv listing installed package names, one per line, per manager
+_INSTALLED_QUERY_ARGV: dict[str, tuple[str, ...]] = {
+    "apt": ("dpkg-query", "-W", "-f=${db:Status-Abbrev} ${Package}\n"),
+    "dnf": ("rpm", "-qa", "--qf", "%{NAME}\n"),
+    "pacman": ("pacman", "-Qq"),
+    "zypper": ("rpm", "-qa", "--qf", "%{NAME}\n"),
+    "apk": ("apk", "info"),
+}
+
+# Installed package names, queried once and dropped after an install
+_installed: frozenset[str] | None = None
+
+
+async def _installed_packages(package_manager: str) -> frozenset[str]:
+    """Get the set of installed package names with a single query."""
+    global _installed
+    if _installed is not None:
+        return _installed
+
+    argv = _INSTALLED_QUERY_ARGV.get(package_manager)
+    if argv is None:
+        return frozenset()
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *argv,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+    except OSError:
+        return frozenset()
+    stdout, _ = await proc.communicate()
+
+    lines = stdout.decode(errors="replace").splitlines()
+    if package_manager == "apt":
+        # Skip removed packages whose config files are still around
+        names = (line.split()[-1] for line in lines if line.startswith("ii"))
+    else:
+        names = (line.strip() for line in lines)
+    _installed = frozenset(name for name in names if name)
+    return _installed
+
 
+def _invalidate_installed() -> None:
+    """Forget the installed package set and PATH lookups after an install."""
+    global _installed
+    _installed = None
+    which.cache_clear()
+
+
+# Package installs currently running, keyed by package name
+_in_progress: dict[str, asyncio.Task[None]] = {}
+
+
+async def _run_install(cmd: list[str]) -> None:
+    """Run a package-manager install command to completion."""
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+    except OSError:
+        return
+    await proc.communicate()
+
+
+@functools.lru_cache(maxsize=1)
 def _detect_distro() -> str:
-    """Detect the Linux distribution family."""
-    os_release = Path("/etc/os-release")
-    if os_release.exists():
-        content = os_release.read_text()
-        content_lower = content.lower()
-        if "arch" in content_lower or "manjaro" in content_lower:
-            return "arch"
-        elif "fedora" in content_lower or "rhel" in content_lower or "centos" in content_lower:
-            return "fedora"
+    """Detect the Linux distribution family from /etc/os-release ID fields."""
+    try:
+        with open("/etc/os-release") as f:
+            data = dict(line.rstrip().split("=", 1) for line in f if "=" in line)
+    except OSError:
+        return "debian"
+
+    ids = f"{data.get('ID_LIKE', '')} {data.get('ID', '')}"
+    families = set(ids.replace('"', " ").replace("'", " ").lower().split())
+    if families & {"arch", "manjaro"}:
+        return "arch"
+    elif families & {"fedora", "rhel", "centos"}:
+        return "fedora"
     return "debian"  # Default to Debian-based
 
 
+@functools.lru_cache(maxsize=1)
 def _get_package_manager() -> str | None:
     """Get the system package manager."""
-    managers = ["apt", "dnf", "pacman", "zypper", "apk"]
-    for pm in managers:
-        if shutil.which(pm):
-            return pm
-    return None
+    # Checked in preference order, stopping at the first one found
+    return next((pm for pm in _INSTALL_ARGV if which(pm)), None)
 
 
+@AUTO_REGISTRY.auto("AUTO-INSTALL")
 class AutoInstallHandler:
     """Handles AUTO-INSTALL for missing tools."""
 
@@ -89,21 +176,33 @@ class AutoInstallHandler:
         if not self.tool_name:
             return False
 
+        # Installed meanwhile by another fix or by the user
+        if which(self.tool_name):
+            return True
+
         pkg_name = self._get_package_name()
-        cmd = self._build_install_cmd(pkg_name)
 
-        if not cmd:
+        # Package is present but does not provide the tool on PATH;
+        # reinstalling would not change that
+        if self.package_manager and pkg_name in await _installed_packages(
+            self.package_manager
+        ):
             return False
 
-        proc = await asyncio.create_subprocess_shell(
-            cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        await proc.wait()
-
-        # Verify installation
-        return shutil.which(self.tool_name) is not None
+        # Join an install of the same package that is already running
+        install = _in_progress.get(pkg_name)
+        if install is None:
+            cmd = self._build_install_cmd(pkg_name)
+            if not cmd:
+                return False
+            install = asyncio.ensure_future(_run_install(cmd))
+            _in_progress[pkg_name] = install
+            install.add_done_callback(lambda _: _in_progress.pop(pkg_name, None))
+            install.add_done_callback(lambda _: _invalidate_installed())
+        await asyncio.shield(install)
+
+        # Verify installation; the install cleared the lookup cache
+        return which(self.tool_name) is not None
 
     async def get_ui_prompt(self) -> str:
         """Get the UI prompt for this fix."""
@@ -112,20 +211,11 @@ class AutoInstallHandler:
 
     def _get_package_name(self) -> str:
         """Get the package name for this distro."""
-        tool_map = PACKAGE_MAP.get(self.tool_name, {})
-        return tool_map.get(self.distro, self.tool_name)
-
-    def _build_install_cmd(self, pkg: str) -> str | None:
-        """Build the install command."""
-        commands = {
-            "apt": f"sudo apt-get install -y {pkg}",
-            "dnf": f"sudo dnf install -y {pkg}",
-            "pacman": f"sudo pacman -S --noconfirm {pkg}",
-            "zypper": f"sudo zypper install -y {pkg}",
-            "apk": f"sudo apk add {pkg}",
-        }
-        return commands.get(self.package_manager)
-
-
-# Register the handler
-AUTO_REGISTRY.register("AUTO-INSTALL", AutoInstallHandler)
+        return _PKG_FLAT.get((self.tool_name, self.distro), self.tool_name)
+
+    def _build_install_cmd(self, pkg: str) -> list[str] | None:
+        """Build the install command argv."""
+        base = _INSTALL_ARGV.get(self.package_manager or "")
+        if base is None:
+            return None
+        return [*base, pkg]
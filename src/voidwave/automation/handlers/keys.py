@@ -1,14 +1,18 @@
 """AUTO-KEYS handler for API key configuration."""
 
 import os
+import tempfile
 from pathlib import Path
-from typing import Any
 
 from voidwave.automation.labels import AUTO_REGISTRY
+from voidwave.core.constants import VOIDWAVE_HOME
+
+# Directory holding stored <service>.key files
+_KEYS_DIR = VOIDWAVE_HOME / "keys"
 
 
 # API key configuration
-API_KEYS: dict[str, dict[str, Any]] = {
+API_KEYS: dict[str, dict[str, str]] = {
     "shodan": {
         "env_var": "SHODAN_API_KEY",
         "url": "https://account.shodan.io/",
@@ -48,6 +52,7 @@ API_KEYS: dict[str, dict[str, Any]] = {
 }
 
 
+@AUTO_REGISTRY.auto("AUTO-KEYS")
 class AutoKeysHandler:
     """Handles AUTO-KEYS for API key configuration."""
 
@@ -76,9 +81,6 @@ class AutoKeysHandler:
 
     def is_configured(self) -> bool:
         """Check if this service's API key is configured."""
-        if not self.config:
-            return False
-
         env_var = self.config.get("env_var")
         if not env_var:
             return False
@@ -88,40 +90,42 @@ class AutoKeysHandler:
             return True
 
         # Check stored keys
-        key_path = Path.home() / ".voidwave" / "keys" / f"{self.service}.key"
-        return key_path.exists()
+        return (_KEYS_DIR / f"{self.service}.key").exists()
 
     def get_key(self) -> str | None:
         """Get the API key for this service."""
         if not self.config:
             return None
 
-        env_var = self.config.get("env_var")
-
         # Check environment first
-        if env_var and os.environ.get(env_var):
-            return os.environ[env_var]
+        env_var = self.config.get("env_var")
+        if env_var and (value := os.environ.get(env_var)):
+            return value
 
         # Check stored keys
-        key_path = Path.home() / ".voidwave" / "keys" / f"{self.service}.key"
-        if key_path.exists():
-            return key_path.read_text().strip()
-
-        return None
+        try:
+            return (_KEYS_DIR / f"{self.service}.key").read_text().strip()
+        except FileNotFoundError:
+            return None
 
     def save_key(self, key: str) -> bool:
-        """Save an API key."""
-        key_dir = Path.home() / ".voidwave" / "keys"
-        key_dir.mkdir(parents=True, exist_ok=True)
-
-        # Set restrictive permissions on directory
-        key_dir.chmod(0o700)
+        """Save an API key.
 
-        key_path = key_dir / f"{self.service}.key"
-        key_path.write_text(key)
-
-        # Set restrictive permissions on key file
-        key_path.chmod(0o600)
+        The key is written to a 0600 temp file and renamed into place, so it
+        is never readable by others, even briefly.
+        """
+        _KEYS_DIR.mkdir(parents=True, exist_ok=True, mode=0o700)
+        # mkdir() leaves an existing directory's mode alone
+        _KEYS_DIR.chmod(0o700)
+
+        fd, tmp_path = tempfile.mkstemp(dir=_KEYS_DIR, prefix=f".{self.service}.")
+        try:
+            with os.fdopen(fd, "w") as fh:
+                fh.write(key)
+            os.replace(tmp_path, _KEYS_DIR / f"{self.service}.key")
+        except OSError:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
 
         return True
 
@@ -132,21 +136,26 @@ class AutoKeysHandler:
         return None
 
     @staticmethod
-    def list_services() -> list[dict[str, Any]]:
+    def list_services() -> list[dict[str, str | bool]]:
         """List all configurable API services."""
+        # One directory listing instead of a stat per service
+        try:
+            stored = {p.stem for p in _KEYS_DIR.iterdir() if p.suffix == ".key"}
+        except OSError:
+            stored = set()
+
         result = []
         for name, config in API_KEYS.items():
-            handler = AutoKeysHandler(name)
+            env_var = config.get("env_var")
+            configured = bool(env_var) and (
+                bool(os.environ.get(env_var)) or name in stored
+            )
             result.append(
                 {
                     "name": name,
                     "description": config["description"],
                     "url": config["url"],
-                    "configured": handler.is_configured(),
+                    "configured": configured,
                 }
             )
         return result
-
-
-# Register the handler
-AUTO_REGISTRY.register("AUTO-KEYS", AutoKeysHandler)
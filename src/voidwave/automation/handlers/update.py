@@ -1,39 +1,51 @@
 """AUTO-UPDATE handler for refreshing data sources."""
 
 import asyncio
-from datetime import datetime, timedelta
+import os
+import time
+from collections.abc import Mapping
+from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from voidwave.automation.fallbacks import which
 from voidwave.automation.labels import AUTO_REGISTRY
 
 
+# Updates are network-bound; cap how many run at once
+_MAX_CONCURRENT_UPDATES = 3
+
+_SECONDS_PER_DAY = 86400
+
+# Timestamp file path -> (mtime_ns, parsed timestamp), reread on mtime change
+_LAST_UPDATE_CACHE: dict[str, tuple[int, float | None]] = {}
+
 # Update sources configuration
 UPDATE_SOURCES: dict[str, dict[str, Any]] = {
     "nuclei-templates": {
-        "command": "nuclei -update-templates",
-        "check_cmd": "nuclei -version",
+        "command": ("nuclei", "-update-templates"),
+        "check_cmd": ("nuclei", "-version"),
         "frequency_days": 7,
         "last_update_file": "/voidwave/data/.nuclei_updated",
         "description": "Nuclei vulnerability templates",
     },
     "exploitdb": {
-        "command": "searchsploit -u",
-        "check_cmd": "searchsploit -v",
+        "command": ("searchsploit", "-u"),
+        "check_cmd": ("searchsploit", "-v"),
         "frequency_days": 7,
         "last_update_file": "/voidwave/data/.exploitdb_updated",
         "description": "Exploit database",
     },
     "nmap-scripts": {
-        "command": "nmap --script-updatedb",
-        "check_cmd": "nmap --version",
+        "command": ("nmap", "--script-updatedb"),
+        "check_cmd": ("nmap", "--version"),
         "frequency_days": 30,
         "last_update_file": "/voidwave/data/.nmap_scripts_updated",
         "description": "Nmap NSE scripts database",
     },
     "wpscan-db": {
-        "command": "wpscan --update",
-        "check_cmd": "wpscan --version",
+        "command": ("wpscan", "--update"),
+        "check_cmd": ("wpscan", "--version"),
         "frequency_days": 1,
         "last_update_file": "/voidwave/data/.wpscan_updated",
         "description": "WPScan vulnerability database",
@@ -41,6 +53,87 @@ UPDATE_SOURCES: dict[str, dict[str, Any]] = {
 }
 
 
+def _last_update_ts(config: Mapping[str, Any]) -> float | None:
+    """Get the last update time recorded for a source, as a POSIX timestamp."""
+    update_file = config.get("last_update_file")
+    if not update_file:
+        return None
+
+    try:
+        mtime = os.stat(update_file).st_mtime_ns
+    except OSError:
+        return None
+
+    cached = _LAST_UPDATE_CACHE.get(update_file)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    try:
+        with open(update_file) as f:
+            last_update: float | None = float(f.read().strip())
+    except (OSError, ValueError):
+        last_update = None
+
+    _LAST_UPDATE_CACHE[update_file] = (mtime, last_update)
+    return last_update
+
+
+def _to_datetime(timestamp: float | None) -> datetime | None:
+    """Convert a recorded timestamp to local time, or None if out of range."""
+    if timestamp is None:
+        return None
+    try:
+        return datetime.fromtimestamp(timestamp)
+    except (ValueError, OverflowError, OSError):
+        return None
+
+
+def _last_update(config: Mapping[str, Any]) -> datetime | None:
+    """Get the last update time recorded for a source."""
+    return _to_datetime(_last_update_ts(config))
+
+
+def _is_stale(
+    config: Mapping[str, Any], last_update: float | None, now: float
+) -> bool:
+    """Check if a source last updated at last_update is due again."""
+    if last_update is None:
+        return True
+
+    frequency = config.get("frequency_days", 7)
+    return last_update < now - frequency * _SECONDS_PER_DAY
+
+
+def _age_string(last_update: float | None, now: float) -> str:
+    """Get a human-readable age string."""
+    if last_update is None:
+        return "never updated"
+
+    days, seconds = divmod(now - last_update, _SECONDS_PER_DAY)
+    if days > 0:
+        return f"{int(days)} days old"
+    elif seconds > 3600:
+        return f"{int(seconds // 3600)} hours old"
+    else:
+        return "recent"
+
+
+def _source_status(
+    name: str, config: Mapping[str, Any], now: float
+) -> dict[str, Any]:
+    """Describe one source, reading its timestamp file once."""
+    last_update = _last_update_ts(config)
+    return {
+        "name": name,
+        "description": config.get("description", name),
+        "frequency_days": config.get("frequency_days", 7),
+        "needs_update": _is_stale(config, last_update, now),
+        "last_update": _to_datetime(last_update),
+        "age": _age_string(last_update, now),
+    }
+
+
+@AUTO_REGISTRY.auto("AUTO-UPDATE")
 class AutoUpdateHandler:
     """Handles AUTO-UPDATE for refreshing data sources."""
 
@@ -54,10 +147,8 @@ class AutoUpdateHandler:
             return False
 
         # Check if the tool exists
-        import shutil
-
-        check_cmd = self.config.get("check_cmd", "").split()[0]
-        return shutil.which(check_cmd) is not None
+        check_cmd = self.config.get("check_cmd")
+        return bool(check_cmd) and which(check_cmd[0]) is not None
 
     async def fix(self) -> bool:
         """Update the data source."""
@@ -68,12 +159,15 @@ class AutoUpdateHandler:
         if not command:
             return False
 
-        proc = await asyncio.create_subprocess_shell(
-            command,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        await proc.wait()
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *command,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        except OSError:
+            return False
+        await proc.communicate()
 
         if proc.returncode == 0:
             # Record update time
@@ -94,31 +188,11 @@ class AutoUpdateHandler:
         """Check if this source needs updating."""
         if not self.config:
             return False
-
-        last_update = self._get_last_update()
-        if last_update is None:
-            return True
-
-        frequency = self.config.get("frequency_days", 7)
-        threshold = datetime.now() - timedelta(days=frequency)
-
-        return last_update < threshold
+        return _is_stale(self.config, _last_update_ts(self.config), time.time())
 
     def _get_last_update(self) -> datetime | None:
         """Get the last update time."""
-        update_file = self.config.get("last_update_file")
-        if not update_file:
-            return None
-
-        path = Path(update_file)
-        if path.exists():
-            try:
-                timestamp = float(path.read_text().strip())
-                return datetime.fromtimestamp(timestamp)
-            except Exception:
-                pass
-
-        return None
+        return _last_update(self.config)
 
     def _record_update(self) -> None:
         """Record the current update time."""
@@ -128,50 +202,44 @@ class AutoUpdateHandler:
 
         path = Path(update_file)
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(str(datetime.now().timestamp()))
+        path.write_text(str(time.time()))
+        # Don't rely on the mtime changing within the filesystem's resolution
+        _LAST_UPDATE_CACHE.pop(update_file, None)
 
     def _get_age_string(self) -> str:
         """Get a human-readable age string."""
-        last_update = self._get_last_update()
-        if last_update is None:
-            return "never updated"
-
-        age = datetime.now() - last_update
-        if age.days > 0:
-            return f"{age.days} days old"
-        elif age.seconds > 3600:
-            return f"{age.seconds // 3600} hours old"
-        else:
-            return "recent"
+        return _age_string(_last_update_ts(self.config), time.time())
 
     @staticmethod
     def list_sources() -> list[dict[str, Any]]:
         """List all update sources and their status."""
-        result = []
-        for name, config in UPDATE_SOURCES.items():
-            handler = AutoUpdateHandler(name)
-            result.append(
-                {
-                    "name": name,
-                    "description": config.get("description", name),
-                    "frequency_days": config.get("frequency_days", 7),
-                    "needs_update": handler.needs_update(),
-                    "last_update": handler._get_last_update(),
-                    "age": handler._get_age_string(),
-                }
-            )
-        return result
+        # One clock read so every source is judged against the same moment
+        now = time.time()
+        return [
+            _source_status(name, config, now) for name, config in UPDATE_SOURCES.items()
+        ]
 
     @staticmethod
     async def update_all_stale() -> dict[str, bool]:
-        """Update all stale sources."""
-        results = {}
-        for name in UPDATE_SOURCES:
-            handler = AutoUpdateHandler(name)
-            if handler.needs_update() and await handler.can_fix():
-                results[name] = await handler.fix()
-        return results
-
-
-# Register the handler
-AUTO_REGISTRY.register("AUTO-UPDATE", AutoUpdateHandler)
+        """Update all stale sources concurrently."""
+        stale = [
+            handler
+            for handler in map(AutoUpdateHandler, UPDATE_SOURCES)
+            if handler.needs_update()
+        ]
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_UPDATES)
+
+        async def _update(handler: AutoUpdateHandler) -> bool | None:
+            if not await handler.can_fix():
+                return None
+            async with semaphore:
+                return await handler.fix()
+
+        outcomes = await asyncio.gather(
+            *(_update(handler) for handler in stale), return_exceptions=True
+        )
+        return {
+            handler.source: outcome is True
+            for handler, outcome in zip(stale, outcomes, strict=True)
+            if outcome is not None
+        }
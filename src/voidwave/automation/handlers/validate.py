@@ -3,10 +3,61 @@
 import re
 import ipaddress
 from typing import Any
+from urllib.parse import urlsplit
 
 from voidwave.automation.labels import AUTO_REGISTRY
 
-
+# Precompiled validation patterns
+_MAC_RE = re.compile(r"^([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})$")
+_BCRYPT_RE = re.compile(r"^\$2[aby]?\$[0-9]{2}\$.{53}$")
+
+# Networks with more host bits than this (over 65536 addresses) get a warning
+_MAX_QUIET_HOST_BITS = 16
+
+# Lowercase hex digits, and the lengths of md5/ntlm, sha1, sha256 and sha512
+_HEX_DIGITS = b"0123456789abcdef"
+_HEX_HASH_LENGTHS = frozenset({32, 40, 64, 128})
+
+
+def _is_domain_label(label: str) -> bool:
+    """Check a single DNS label: 1-63 ASCII letters, digits or inner hyphens."""
+    return (
+        0 < len(label) <= 63
+        and label.isascii()
+        and label.replace("-", "").isalnum()
+        and label[0] != "-"
+        and label[-1] != "-"
+    )
+
+
+def _port_token_error(token: str, in_list: bool) -> str | None:
+    """Check one port or low-high range from a port spec."""
+    low, sep, high = token.partition("-")
+    try:
+        first = int(low)
+        last = int(high) if sep else first
+    except ValueError:
+        return "Invalid port list format" if in_list else "Invalid port range format"
+
+    if not 1 <= first <= last <= 65535:
+        return "Invalid port range" if sep else "All ports must be between 1 and 65535"
+    return None
+
+
+def _port_spec_error(spec: str) -> str | None:
+    """Scan a comma-separated port spec, stopping at the first bad entry."""
+    in_list = "," in spec
+    start = 0
+    while True:
+        end = spec.find(",", start)
+        token = spec[start:] if end < 0 else spec[start:end]
+        error = _port_token_error(token, in_list)
+        if error or end < 0:
+            return error
+        start = end + 1
+
+
+@AUTO_REGISTRY.auto("AUTO-VALIDATE")
 class AutoValidateHandler:
     """Handles AUTO-VALIDATE for input validation and safety checks."""
 
@@ -66,44 +117,57 @@ class AutoValidateHandler:
         """Validate CIDR notation."""
         try:
             network = ipaddress.ip_network(self.value, strict=False)
-
-            # Check for overly broad scope
-            if network.num_addresses > 65536:
-                self.warning = f"Very broad scope: {network.num_addresses:,} addresses"
-
-            if str(network) in ["0.0.0.0/0", "::/0"]:
-                self.error = "Cannot target entire internet"
-                return False
-
-            return True
         except ValueError:
             self.error = "Invalid CIDR notation"
             return False
 
+        if network.prefixlen == 0:
+            self.error = "Cannot target entire internet"
+            return False
+
+        # Check for overly broad scope (more than a /16 worth of addresses)
+        host_bits = network.max_prefixlen - network.prefixlen
+        if host_bits > _MAX_QUIET_HOST_BITS:
+            self.warning = f"Very broad scope: {network.num_addresses:,} addresses"
+
+        return True
+
     def _validate_bssid(self) -> bool:
         """Validate BSSID (MAC address)."""
         return self._validate_mac()
 
     def _validate_mac(self) -> bool:
         """Validate MAC address."""
-        pattern = r"^([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})$"
-        if re.match(pattern, self.value):
+        if _MAC_RE.match(self.value):
             return True
         self.error = "Invalid MAC address format (expected XX:XX:XX:XX:XX:XX)"
         return False
 
     def _validate_url(self) -> bool:
         """Validate URL."""
-        pattern = r"^https?://[^\s/$.?#].[^\s]*$"
-        if re.match(pattern, self.value, re.IGNORECASE):
+        try:
+            parts = urlsplit(self.value)
+        except ValueError:
+            parts = None
+        if (
+            parts is not None
+            and parts.scheme in ("http", "https")
+            and parts.hostname
+            and not any(c.isspace() for c in self.value)
+        ):
             return True
         self.error = "Invalid URL format"
         return False
 
     def _validate_domain(self) -> bool:
         """Validate domain name."""
-        pattern = r"^[a-zA-Z0-9]([a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?(\.[a-zA-Z]{2,})+$"
-        if re.match(pattern, self.value):
+        labels = self.value.split(".")
+        if (
+            len(labels) >= 2
+            and all(_is_domain_label(label) for label in labels)
+            and len(labels[-1]) >= 2
+            and labels[-1].isalpha()
+        ):
             return True
         self.error = "Invalid domain format"
         return False
@@ -122,46 +186,27 @@ class AutoValidateHandler:
 
     def _validate_port_range(self) -> bool:
         """Validate port range."""
-        # Format: 1-1000 or 22,80,443
-        if "-" in self.value:
-            try:
-                start, end = self.value.split("-")
-                start, end = int(start), int(end)
-                if 1 <= start <= 65535 and 1 <= end <= 65535 and start <= end:
-                    return True
-                self.error = "Invalid port range"
-                return False
-            except ValueError:
-                self.error = "Invalid port range format"
-                return False
-        elif "," in self.value:
-            try:
-                ports = [int(p.strip()) for p in self.value.split(",")]
-                if all(1 <= p <= 65535 for p in ports):
-                    return True
-                self.error = "All ports must be between 1 and 65535"
-                return False
-            except ValueError:
-                self.error = "Invalid port list format"
-                return False
-        else:
+        # Format: 1-1000, 22,80,443 or a mix such as 22,80,8000-9000
+        if "-" not in self.value and "," not in self.value:
             return self._validate_port()
 
+        error = _port_spec_error(self.value)
+        if error:
+            self.error = error
+            return False
+        return True
+
     def _validate_hash(self) -> bool:
         """Validate hash format."""
         value = self.value.lower()
-        hash_patterns = {
-            "md5": (32, r"^[a-f0-9]{32}$"),
-            "sha1": (40, r"^[a-f0-9]{40}$"),
-            "sha256": (64, r"^[a-f0-9]{64}$"),
-            "sha512": (128, r"^[a-f0-9]{128}$"),
-            "ntlm": (32, r"^[a-f0-9]{32}$"),
-            "bcrypt": (60, r"^\$2[aby]?\$[0-9]{2}\$.{53}$"),
-        }
 
-        for hash_type, (length, pattern) in hash_patterns.items():
-            if len(value) == length or re.match(pattern, value):
-                return True
+        # Hex digests: right length, and nothing left once hex digits are removed
+        raw = value.encode("ascii", "replace")
+        if len(raw) in _HEX_HASH_LENGTHS and not raw.translate(None, _HEX_DIGITS):
+            return True
+
+        if _BCRYPT_RE.match(value):
+            return True
 
         self.warning = "Unknown hash format"
         return True  # Allow unknown formats
@@ -172,7 +217,3 @@ class AutoValidateHandler:
         handler = AutoValidateHandler(input_type, value)
         is_valid = handler.validate()
         return is_valid, handler.error or handler.warning
-
-
-# Register the handler
-AUTO_REGISTRY.register("AUTO-VALIDATE", AutoValidateHandler)
@@ -1,6 +1,9 @@
 """AUTO-* label registry and handler protocol."""
 
-from typing import Protocol, runtime_checkable
+import importlib
+from collections.abc import Callable, Mapping
+from types import MappingProxyType
+from typing import Protocol, TypeVar, runtime_checkable
 
 
 @runtime_checkable
@@ -20,24 +23,97 @@ class AutoFixHandler(Protocol):
         ...
 
 
+_H = TypeVar("_H", bound=type[AutoFixHandler])
+
+
 class AutoLabelRegistry:
     """Registry of all AUTO-* handlers."""
 
     def __init__(self) -> None:
-        self.handlers: dict[str, type[AutoFixHandler]] = {}
+        self._table: dict[str, type[AutoFixHandler]] = {}
+        self.handlers: Mapping[str, type[AutoFixHandler]] = self._table
+        self._lazy: dict[str, str] = {}
+        self._labels: tuple[str, ...] | None = None
+        self._frozen = False
 
     def register(self, label: str, handler: type[AutoFixHandler]) -> None:
         """Register a handler for a label."""
-        self.handlers[label] = handler
+        if label not in self.handlers and label not in self._lazy:
+            self._labels = None
+
+        if self._frozen:
+            # Copy-on-write so readers never see a partially updated view
+            self._table = {**self._table, label: handler}
+            self.handlers = MappingProxyType(self._table)
+        else:
+            self._table[label] = handler
+
+    def register_lazy(self, label: str, target: str) -> None:
+        """Register a handler by ``"module:Class"`` path, imported on first use."""
+        if label not in self.handlers:
+            self._lazy[label] = target
+            self._labels = None
+
+    def auto(self, label: str) -> Callable[[_H], _H]:
+        """Class decorator registering a handler under ``label``."""
+
+        def decorator(handler: _H) -> _H:
+            self.register(label, handler)
+            return handler
+
+        return decorator
+
+    def freeze(self) -> None:
+        """Swap the handler table for a read-only view once bootstrap is done."""
+        if not self._frozen:
+            self.handlers = MappingProxyType(self._table)
+            self._frozen = True
 
     def get(self, label: str) -> type[AutoFixHandler] | None:
         """Get the handler class for a label."""
+        handler = self.handlers.get(label)
+        if handler is None and label in self._lazy:
+            handler = self._resolve(label)
+        return handler
+
+    def _resolve(self, label: str) -> type[AutoFixHandler] | None:
+        """Import a lazily registered handler and register it."""
+        module_name, _, attr = self._lazy[label].partition(":")
+        module = importlib.import_module(module_name)
+        if label not in self.handlers:
+            self.register(label, getattr(module, attr))
+        self._lazy.pop(label, None)
         return self.handlers.get(label)
 
     def list_labels(self) -> list[str]:
         """List all registered labels."""
-        return list(self.handlers.keys())
+        if self._labels is None:
+            # A lazy label stays listed once, even if its module was imported
+            self._labels = tuple(dict.fromkeys((*self.handlers, *self._lazy)))
+        return list(self._labels)
 
 
 # Global registry instance
 AUTO_REGISTRY = AutoLabelRegistry()
+
+# Built-in handlers are imported only when their label is first looked up
+_BUILTIN_HANDLERS = {
+    "AUTO-INSTALL": "voidwave.automation.handlers.install:AutoInstallHandler",
+    "AUTO-PRIV": "voidwave.automation.handlers.privilege:AutoPrivHandler",
+    "AUTO-MON": "voidwave.automation.handlers.monitor:AutoMonHandler",
+    "AUTO-IFACE": "voidwave.automation.handlers.iface:AutoIfaceHandler",
+    "AUTO-ACQUIRE": "voidwave.automation.handlers.acquire:AutoAcquireHandler",
+    "AUTO-DATA": "voidwave.automation.handlers.data:AutoDataHandler",
+    "AUTO-KEYS": "voidwave.automation.handlers.keys:AutoKeysHandler",
+    "AUTO-SETUP": "voidwave.automation.handlers.setup:AutoSetupHandler",
+    "AUTO-FALLBACK": "voidwave.automation.handlers.fallback:AutoFallbackHandler",
+    "AUTO-GUIDE": "voidwave.automation.handlers.guide:AutoGuideHandler",
+    "AUTO-CLEANUP": "voidwave.automation.handlers.cleanup:AutoCleanupHandler",
+    "AUTO-VALIDATE": "voidwave.automation.handlers.validate:AutoValidateHandler",
+    "AUTO-UPDATE": "voidwave.automation.handlers.update:AutoUpdateHandler",
+}
+for _label, _target in _BUILTIN_HANDLERS.items():
+    AUTO_REGISTRY.register_lazy(_label, _target)
+
+# Later registrations (handler imports, plugins) go through copy-on-write
+AUTO_REGISTRY.freeze()
@@ -1,8 +1,12 @@
 """Preflight checker for validating requirements before actions."""
 
 import asyncio
-import shutil
-from typing import Any
+import dataclasses
+import functools
+import time
+from collections import OrderedDict
+from typing import Any, ClassVar
+from weakref import WeakKeyDictionary
 
 from voidwave.core.logging import get_logger
 from voidwave.automation.engine import (
@@ -10,7 +14,13 @@ from voidwave.automation.engine import (
     RequirementStatus,
     PreflightResult,
 )
-from voidwave.automation.requirements import ATTACK_REQUIREMENTS
+from voidwave.automation.fallbacks import which
+from voidwave.automation.requirements import (
+    ATTACK_REQUIREMENTS,
+    invalidate_tool_cache,
+    session_check_state,
+    set_session_check,
+)
 from voidwave.automation.labels import AUTO_REGISTRY
 
 logger = get_logger(__name__)
@@ -19,14 +29,23 @@ logger = get_logger(__name__)
 class PreflightChecker:
     """Checks requirements before executing actions."""
 
+    # Seconds a check() result is reused for the same session state; 0 disables
+    CACHE_TTL: ClassVar[float] = 2.0
+
+    # Most check() results kept; least recently used are dropped first
+    CACHE_SIZE: ClassVar[int] = 128
+
+    # (action, session state) -> (timestamp, result); shared by all checkers
+    _result_cache: ClassVar[
+        OrderedDict[tuple[Any, ...], tuple[float, PreflightResult]]
+    ] = OrderedDict()
+
     def __init__(self, session: Any = None) -> None:
         self.session = session
         self._update_session_checks()
 
     def _update_session_checks(self) -> None:
         """Update session-based checks from current session state."""
-        from voidwave.automation.requirements import set_session_check
-
         if self.session is None:
             return
 
@@ -54,7 +73,29 @@ class PreflightChecker:
         """Check all requirements for an action."""
         self._update_session_checks()
 
-        requirements = ATTACK_REQUIREMENTS.get(action, [])
+        key = (action, session_check_state())
+        cached = self._result_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self.CACHE_TTL:
+            self._result_cache.move_to_end(key)
+            return _copy_result(cached[1])
+
+        result = await self._check(action)
+        if self.CACHE_TTL:
+            self._result_cache[key] = (time.monotonic(), _copy_result(result))
+            self._result_cache.move_to_end(key)
+            while len(self._result_cache) > self.CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+        return result
+
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        """Drop cached check() results, e.g. after the environment changed."""
+        cls._result_cache.clear()
+        invalidate_tool_cache()
+
+    async def _check(self, action: str) -> PreflightResult:
+        """Check all requirements for an action without the result cache."""
+        requirements = ATTACK_REQUIREMENTS.get(action, ())
         result = PreflightResult(
             action=action,
             requirements=requirements,
@@ -85,7 +126,7 @@ class PreflightChecker:
         """Check a single requirement, considering alternatives."""
         # Check primary requirement
         try:
-            met = await asyncio.to_thread(req.check)
+            met = await asyncio.to_thread(req.check) if req.blocking else req.check()
             if met:
                 return RequirementStatus.MET
         except Exception as e:
@@ -93,7 +134,7 @@ class PreflightChecker:
 
         # Check alternatives (for tools)
         for alt_name in req.alternatives:
-            if shutil.which(alt_name):
+            if which(alt_name):
                 return RequirementStatus.MET
 
         # Not met - can we fix it?
@@ -106,10 +147,11 @@ class PreflightChecker:
 
     async def fix_all(self, result: PreflightResult) -> PreflightResult:
         """Attempt to fix all fixable requirements."""
-        for req in result.fixable[:]:  # Copy list to allow modification
-            success = await self._try_fix(req)
-            if success:
-                result.fixable.remove(req)
+        remaining = [req for req in result.fixable if not await self._try_fix(req)]
+        result.fixable[:] = remaining
+
+        # Fixes change the environment that cached results describe
+        self.invalidate_cache()
 
         # Re-check to update all_met status
         result.all_met = (
@@ -136,7 +178,9 @@ class PreflightChecker:
         # Try requirement's own fix method
         if req.fix:
             try:
-                return await asyncio.to_thread(req.fix)
+                if req.blocking:
+                    return await asyncio.to_thread(req.fix)
+                return req.fix()
             except Exception as e:
                 logger.debug(f"Fix method failed for {req.name}: {e}")
 
@@ -144,7 +188,33 @@ class PreflightChecker:
 
     def check_sync(self, action: str) -> PreflightResult:
         """Synchronous version of check for non-async contexts."""
-        return asyncio.get_event_loop().run_until_complete(self.check(action))
+        return asyncio.run(self.check(action))
+
+
+def _copy_result(result: PreflightResult) -> PreflightResult:
+    """Copy a result so callers can mutate its lists without touching the cache."""
+    return dataclasses.replace(
+        result,
+        requirements=list(result.requirements),
+        missing=list(result.missing),
+        fixable=list(result.fixable),
+        manual=list(result.manual),
+    )
+
+
+# Checker reused per decorated object, so repeated actions skip construction
+_CHECKERS: "WeakKeyDictionary[Any, PreflightChecker]" = WeakKeyDictionary()
+
+
+def _checker_for(owner: Any, session: Any) -> PreflightChecker:
+    """Get the cached checker for an object, rebuilding it if its session changed."""
+    try:
+        checker = _CHECKERS.get(owner)
+    except TypeError:  # not weak-referenceable
+        return PreflightChecker(session)
+    if checker is None or checker.session is not session:
+        checker = _CHECKERS[owner] = PreflightChecker(session)
+    return checker
 
 
 def with_preflight(action_name: str):
@@ -158,18 +228,17 @@ def with_preflight(action_name: str):
     """
 
     def decorator(func):
+        @functools.wraps(func)
         async def wrapper(self, *args, **kwargs):
             # Get session from self if available
             session = getattr(self, "session", None)
-            checker = PreflightChecker(session)
+            checker = _checker_for(self, session)
             result = await checker.check(action_name)
 
             if not result.all_met:
                 # Emit event for TUI to show modal
                 if hasattr(self, "app"):
-                    self.app.post_message_no_wait(
-                        PreflightRequired(result)  # Custom message type
-                    )
+                    self.app.post_message(_preflight_required_class()(result))
                     return None
 
             return await func(self, *args, **kwargs)
@@ -179,8 +248,26 @@ def with_preflight(action_name: str):
     return decorator
 
 
-class PreflightRequired:
-    """Message indicating preflight check failed and user action needed."""
+@functools.cache
+def _preflight_required_class() -> type:
+    """Build the PreflightRequired message class on first use.
+
+    Deferred so that importing the preflight checker does not pull in Textual.
+    """
+    from textual.message import Message
+
+    class PreflightRequired(Message):
+        """Message indicating preflight check failed and user action needed."""
+
+        def __init__(self, result: PreflightResult) -> None:
+            super().__init__()
+            self.result = result
+
+    PreflightRequired.__module__ = __name__
+    return PreflightRequired
+
 
-    def __init__(self, result: PreflightResult) -> None:
-        self.result = result
+def __getattr__(name: str) -> Any:
+    if name == "PreflightRequired":
+        return _preflight_required_class()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,66 +1,85 @@
 """Attack requirements definitions ported from preflight.sh."""
 
+import functools
 import os
-import shutil
-from pathlib import Path
+import sys
+from collections.abc import Callable, Mapping
+from types import MappingProxyType
 from typing import Any
 
 from voidwave.automation.engine import Requirement, RequirementType
+from voidwave.automation.fallbacks import which
+from voidwave.core.constants import VOIDWAVE_WORDLISTS_DIR
 
 
+@functools.cache
 def _check_root() -> bool:
-    """Check if running as root."""
+    """Check if running as root (the effective UID is fixed for the process)."""
     return os.geteuid() == 0
 
 
 def _check_tool(name: str) -> bool:
-    """Check if a tool is available."""
-    return shutil.which(name) is not None
+    """Check if a tool is available (PATH lookups are cached per process)."""
+    return which(name) is not None
 
 
-def _check_wordlist() -> bool:
-    """Check if default wordlist exists."""
-    paths = [
-        Path("/usr/share/wordlists/rockyou.txt"),
-        Path("/usr/share/seclists/Passwords/rockyou.txt"),
-        Path.home() / ".voidwave/wordlists/rockyou.txt",
-        Path("/voidwave/wordlists/rockyou.txt"),
-    ]
-    return any(p.exists() for p in paths)
+def invalidate_tool_cache() -> None:
+    """Forget cached tool and wordlist lookups so the next check re-probes."""
+    global _wordlist_found
+    which.cache_clear()
+    _wordlist_found = False
 
 
-# Check functions - will be populated by session at runtime
-_session_checks: dict[str, Any] = {}
+# Default wordlist locations, plus the per-user one resolved at check time
+_WORDLIST_PATHS = (
+    "/usr/share/wordlists/rockyou.txt",
+    "/usr/share/seclists/Passwords/rockyou.txt",
+    "/voidwave/wordlists/rockyou.txt",
+    # Where AUTO-DATA downloads it
+    os.path.join(VOIDWAVE_WORDLISTS_DIR, "rockyou.txt"),
+)
+
 
+# Set once a default wordlist is found; a miss is re-probed on every check,
+# so a wordlist downloaded by any fix path is seen without invalidation
+_wordlist_found = False
 
-def _check_interface() -> bool:
-    """Check if interface is selected."""
-    return _session_checks.get("interface", False)
 
+def _check_wordlist() -> bool:
+    """Check if default wordlist exists (a hit is cached until invalidated)."""
+    global _wordlist_found
+    if not _wordlist_found:
+        _wordlist_found = any(os.path.exists(p) for p in _WORDLIST_PATHS) or (
+            os.path.exists(os.path.expanduser("~/.voidwave/wordlists/rockyou.txt"))
+        )
+    return _wordlist_found
 
-def _check_monitor_mode() -> bool:
-    """Check if monitor mode is enabled."""
-    return _session_checks.get("monitor_mode", False)
 
+# API key requirement name -> environment variable holding the key
+_API_KEY_ENV = MappingProxyType({"shodan_api_key": "SHODAN_API_KEY"})
 
-def _check_target() -> bool:
-    """Check if target is selected."""
-    return _session_checks.get("target", False)
 
+def _check_api_key(key: str) -> bool:
+    """Check if an API key is set in the environment."""
+    return bool(os.environ.get(_API_KEY_ENV[key]))
 
-def _check_capture_file() -> bool:
-    """Check if capture file exists."""
-    return _session_checks.get("capture_file", False)
 
+# Check functions - will be populated by session at runtime
+_session_checks: dict[str, Any] = {}
 
-def _check_hash_file() -> bool:
-    """Check if hash file exists."""
-    return _session_checks.get("hash_file", False)
 
+def _session_check(key: str) -> Callable[[], bool]:
+    """Make a check that reads a session flag, defaulting to False."""
+    # A partial over dict.get avoids a Python-level frame per check
+    return functools.partial(_session_checks.get, key, False)
 
-def _check_handshake() -> bool:
-    """Check if handshake is captured."""
-    return _session_checks.get("handshake", False)
+
+_check_interface = _session_check("interface")
+_check_monitor_mode = _session_check("monitor_mode")
+_check_target = _session_check("target")
+_check_capture_file = _session_check("capture_file")
+_check_hash_file = _session_check("hash_file")
+_check_handshake = _session_check("handshake")
 
 
 def set_session_check(name: str, value: bool) -> None:
@@ -68,9 +87,15 @@ def set_session_check(name: str, value: bool) -> None:
     _session_checks[name] = value
 
 
+def session_check_state() -> tuple[tuple[str, Any], ...]:
+    """Snapshot the session check values, for use as a cache key."""
+    return tuple(sorted(_session_checks.items()))
+
+
 def clear_session_checks() -> None:
-    """Clear all session checks."""
+    """Clear all session checks and re-probe tools on the next check."""
     _session_checks.clear()
+    invalidate_tool_cache()
 
 
 # Standard requirements that are reused
@@ -112,75 +137,85 @@ WORDLIST_REQ = Requirement(
     description="Wordlist file available",
     check=_check_wordlist,
     auto_label="AUTO-DATA",
+    blocking=True,
 )
 
 
-def tool_req(
-    name: str, description: str = "", alternatives: list[str] | None = None
+@functools.cache
+def _tool_req(
+    name: str, description: str, alternatives: tuple[str, ...]
 ) -> Requirement:
-    """Create a tool requirement."""
+    """Build the one shared Requirement for a tool/description/alternatives."""
     return Requirement(
         type=RequirementType.TOOL,
-        name=name,
-        description=description or f"{name} tool required",
-        check=lambda n=name: _check_tool(n),
-        alternatives=alternatives or [],
+        name=sys.intern(name),
+        description=sys.intern(description or f"{name} tool required"),
+        check=functools.partial(_check_tool, name),
+        alternatives=list(alternatives),
         auto_label="AUTO-INSTALL",
+        blocking=True,
     )
 
 
+def tool_req(
+    name: str, description: str = "", alternatives: list[str] | None = None
+) -> Requirement:
+    """Get a tool requirement, shared by every action that lists the same tool."""
+    return _tool_req(name, description, tuple(alternatives or ()))
+
+
 # Complete attack requirements dictionary
-ATTACK_REQUIREMENTS: dict[str, list[Requirement]] = {
+_ATTACK_REQUIREMENTS: dict[str, tuple[Requirement, ...]] = {
     # =========================================================================
     # WPS ATTACKS
     # =========================================================================
-    "wps_pixie": [
+    "wps_pixie": (
         ROOT_REQ,
         MONITOR_REQ,
         tool_req("reaver", "Reaver WPS attack tool", ["bully"]),
         tool_req("pixiewps", "Pixie-Dust offline attack"),
         TARGET_REQ,
-    ],
-    "wps_bruteforce": [
+    ),
+    "wps_bruteforce": (
         ROOT_REQ,
         MONITOR_REQ,
         tool_req("reaver", "Reaver WPS attack tool", ["bully"]),
         TARGET_REQ,
-    ],
-    "wps_known": [
+    ),
+    "wps_known": (
         ROOT_REQ,
         MONITOR_REQ,
         tool_req("reaver", "Reaver WPS attack tool", ["bully"]),
         TARGET_REQ,
-    ],
-    "wps_algorithm": [
+    ),
+    "wps_algorithm": (
         ROOT_REQ,
         MONITOR_REQ,
         tool_req("reaver", "Reaver WPS attack tool", ["bully"]),
         TARGET_REQ,
-    ],
-    "wps_scan": [
+    ),
+    "wps_scan": (
         ROOT_REQ,
         MONITOR_REQ,
         tool_req("wash", "WPS-enabled network scanner"),
-    ],
+    ),
     # =========================================================================
     # WPA ATTACKS
     # =========================================================================
-    "pmkid": [
+    "pmkid": (
         ROOT_REQ,
         MONITOR_REQ,
         tool_req("hcxdumptool", "PMKID capture tool"),
         TARGET_REQ,
-    ],
-    "handshake": [
+    ),
+    "handshake": (
         ROOT_REQ,
         MONITOR_REQ,
         tool_req("airodump-ng", "Wireless packet capture"),
         tool_req("aireplay-ng", "Wireless packet injection"),
         TARGET_REQ,
-    ],
-    "crack_aircrack": [
+    ),
+    "crack_aircrack": (
         tool_req("aircrack-ng", "WPA/WPA2 cracker"),
         Requirement(
             type=RequirementType.INPUT,
@@ -190,8 +225,8 @@ ATTACK_REQUIREMENTS: dict[str, list[Requirement]] = {
             auto_label="AUTO-ACQUIRE",
         ),
         WORDLIST_REQ,
-    ],
-    "crack_hashcat": [
+    ),
+    "crack_hashcat": (
         tool_req("hashcat", "GPU-accelerated password cracker"),
         Requirement(
             type=RequirementType.INPUT,
@@ -201,17 +236,17 @@ ATTACK_REQUIREMENTS: dict[str, list[Requirement]] = {
             auto_label="AUTO-ACQUIRE",
         ),
         WORDLIST_REQ,
-    ],
+    ),
     # =========================================================================
     # EVIL TWIN
     # =========================================================================
-    "eviltwin": [
+    "eviltwin": (
         ROOT_REQ,
         INTERFACE_REQ,
         tool_req("hostapd", "Access point daemon"),
         tool_req("dnsmasq", "DNS/DHCP server"),
-    ],
-    "eviltwin_full": [
+    ),
+    "eviltwin_full": (
         ROOT_REQ,
         INTERFACE_REQ,
         tool_req("hostapd", "Access point daemon"),
@@ -224,240 +259,245 @@ ATTACK_REQUIREMENTS: dict[str, list[Requirement]] = {
             check=_check_handshake,
             auto_label="AUTO-ACQUIRE",
         ),
-    ],
+    ),
     # =========================================================================
     # DoS ATTACKS
     # =========================================================================
-    "deauth": [
+    "deauth": (
         ROOT_REQ,
         MONITOR_REQ,
         tool_req("aireplay-ng", "Wireless packet injection"),
         TARGET_REQ,
-    ],
-    "amok": [
+    ),
+    "amok": (
         ROOT_REQ,
         MONITOR_REQ,
         tool_req("mdk4", "Wireless attack tool"),
-    ],
-    "beacon_flood": [
+    ),
+    "beacon_flood": (
         ROOT_REQ,
         MONITOR_REQ,
         tool_req("mdk4", "Wireless attack tool"),
-    ],
+    ),
     # =========================================================================
     # OTHER WIRELESS
     # =========================================================================
-    "wep": [
+    "wep": (
         ROOT_REQ,
         MONITOR_REQ,
         tool_req("aircrack-ng", "WEP cracker"),
         tool_req("aireplay-ng", "Wireless packet injection"),
         TARGET_REQ,
-    ],
-    "enterprise": [
+    ),
+    "enterprise": (
         ROOT_REQ,
         MONITOR_REQ,
         tool_req("hostapd", "Access point daemon", ["hostapd-wpe"]),
-    ],
-    "scan": [
+    ),
+    "scan": (
         ROOT_REQ,
         INTERFACE_REQ,
         tool_req("airodump-ng", "Wireless packet capture"),
-    ],
+    ),
     # =========================================================================
     # RECON
     # =========================================================================
-    "recon_dns": [
+    "recon_dns": (
         tool_req("dig", "DNS lookup utility", ["host"]),
-    ],
-    "recon_subdomain": [
+    ),
+    "recon_subdomain": (
         tool_req("subfinder", "Subdomain discovery", ["amass", "host"]),
-    ],
-    "recon_whois": [
+    ),
+    "recon_whois": (
         tool_req("whois", "WHOIS lookup"),
-    ],
-    "recon_email": [
+    ),
+    "recon_email": (
         tool_req("theHarvester", "Email harvester", ["theharvester"]),
-    ],
-    "recon_tech": [
+    ),
+    "recon_tech": (
         tool_req("whatweb", "Web technology detector", ["curl"]),
-    ],
-    "recon_full": [
+    ),
+    "recon_full": (
         tool_req("dig", "DNS lookup utility"),
         tool_req("whois", "WHOIS lookup"),
         tool_req("curl", "HTTP client"),
-    ],
+    ),
     # =========================================================================
     # SCANNING
     # =========================================================================
-    "scan_quick": [
+    "scan_quick": (
         tool_req("nmap", "Network scanner"),
         TARGET_REQ,
-    ],
-    "scan_full": [
+    ),
+    "scan_full": (
         tool_req("nmap", "Network scanner"),
         TARGET_REQ,
-    ],
-    "scan_version": [
+    ),
+    "scan_version": (
         tool_req("nmap", "Network scanner"),
         TARGET_REQ,
-    ],
-    "scan_os": [
+    ),
+    "scan_os": (
         ROOT_REQ,
         tool_req("nmap", "Network scanner"),
         TARGET_REQ,
-    ],
-    "scan_vuln": [
+    ),
+    "scan_vuln": (
         tool_req("nmap", "Network scanner"),
         TARGET_REQ,
-    ],
-    "scan_stealth": [
+    ),
+    "scan_stealth": (
         ROOT_REQ,
         tool_req("nmap", "Network scanner"),
         TARGET_REQ,
-    ],
-    "scan_udp": [
+    ),
+    "scan_udp": (
         ROOT_REQ,
         tool_req("nmap", "Network scanner"),
         TARGET_REQ,
-    ],
-    "scan_custom": [
+    ),
+    "scan_custom": (
         tool_req("nmap", "Network scanner"),
         TARGET_REQ,
-    ],
+    ),
     # =========================================================================
     # CREDENTIALS
     # =========================================================================
-    "creds_hydra": [
+    "creds_hydra": (
         tool_req("hydra", "Network login cracker"),
         TARGET_REQ,
-    ],
-    "creds_hashcat": [
+    ),
+    "creds_hashcat": (
         tool_req("hashcat", "GPU-accelerated password cracker"),
         WORDLIST_REQ,
-    ],
-    "creds_john": [
+    ),
+    "creds_john": (
         tool_req("john", "Password cracker"),
         WORDLIST_REQ,
-    ],
-    "creds_identify": [],
-    "creds_wordlist": [],
-    "creds_extract": [],
+    ),
+    "creds_identify": (),
+    "creds_wordlist": (),
+    "creds_extract": (),
     # =========================================================================
     # OSINT
     # =========================================================================
-    "osint_harvester": [
+    "osint_harvester": (
         tool_req("theHarvester", "Email/subdomain harvester", ["theharvester"]),
-    ],
-    "osint_shodan": [
+    ),
+    "osint_shodan": (
         tool_req("curl", "HTTP client"),
         Requirement(
             type=RequirementType.API_KEY,
             name="shodan_api_key",
             description="Shodan API key",
-            check=lambda: bool(os.environ.get("SHODAN_API_KEY")),
+            check=functools.partial(_check_api_key, "shodan_api_key"),
             auto_label="AUTO-KEYS",
         ),
-    ],
-    "osint_dorks": [],
-    "osint_social": [
+    ),
+    "osint_dorks": (),
+    "osint_social": (
         tool_req("curl", "HTTP client"),
-    ],
-    "osint_reputation": [
+    ),
+    "osint_reputation": (
         tool_req("whois", "WHOIS lookup", ["curl"]),
-    ],
-    "osint_domain": [
+    ),
+    "osint_domain": (
         tool_req("whois", "WHOIS lookup"),
         tool_req("dig", "DNS lookup utility"),
         tool_req("curl", "HTTP client"),
-    ],
-    "osint_full": [
+    ),
+    "osint_full": (
         tool_req("whois", "WHOIS lookup"),
         tool_req("dig", "DNS lookup utility"),
         tool_req("curl", "HTTP client"),
-    ],
+    ),
     # =========================================================================
     # TRAFFIC
     # =========================================================================
-    "traffic_tcpdump": [
+    "traffic_tcpdump": (
         ROOT_REQ,
         tool_req("tcpdump", "Packet capture"),
-    ],
-    "traffic_wireshark": [
+    ),
+    "traffic_wireshark": (
         tool_req("wireshark", "GUI packet analyzer"),
-    ],
-    "traffic_arpspoof": [
+    ),
+    "traffic_arpspoof": (
         ROOT_REQ,
         tool_req("arpspoof", "ARP spoofing tool"),
-    ],
-    "traffic_dnsspoof": [
+    ),
+    "traffic_dnsspoof": (
         ROOT_REQ,
         tool_req("dnsspoof", "DNS spoofing tool"),
-    ],
-    "traffic_sniff": [
+    ),
+    "traffic_sniff": (
         ROOT_REQ,
         tool_req("tcpdump", "Packet capture"),
-    ],
-    "traffic_pcap": [
+    ),
+    "traffic_pcap": (
         tool_req("tcpdump", "Packet capture", ["tshark"]),
-    ],
+    ),
     # =========================================================================
     # EXPLOIT
     # =========================================================================
-    "exploit_msf": [
+    "exploit_msf": (
         tool_req("msfconsole", "Metasploit Framework"),
-    ],
-    "exploit_searchsploit": [
+    ),
+    "exploit_searchsploit": (
         tool_req("searchsploit", "Exploit database search"),
-    ],
-    "exploit_sqlmap": [
+    ),
+    "exploit_sqlmap": (
         tool_req("sqlmap", "SQL injection tool"),
         TARGET_REQ,
-    ],
-    "exploit_revshell": [],
-    "exploit_payload": [
+    ),
+    "exploit_revshell": (),
+    "exploit_payload": (
         tool_req("msfvenom", "Payload generator"),
-    ],
-    "exploit_nikto": [
+    ),
+    "exploit_nikto": (
         tool_req("nikto", "Web server scanner"),
         TARGET_REQ,
-    ],
+    ),
     # =========================================================================
     # STRESS TESTING
     # =========================================================================
-    "stress_http": [
+    "stress_http": (
         ROOT_REQ,
         tool_req("hping3", "Packet generator", ["curl"]),
         TARGET_REQ,
-    ],
-    "stress_syn": [
+    ),
+    "stress_syn": (
         ROOT_REQ,
         tool_req("hping3", "Packet generator"),
         TARGET_REQ,
-    ],
-    "stress_udp": [
+    ),
+    "stress_udp": (
         ROOT_REQ,
         tool_req("hping3", "Packet generator"),
         TARGET_REQ,
-    ],
-    "stress_icmp": [
+    ),
+    "stress_icmp": (
         ROOT_REQ,
         tool_req("hping3", "Packet generator", ["ping"]),
         TARGET_REQ,
-    ],
-    "stress_conn": [
+    ),
+    "stress_conn": (
         TARGET_REQ,
-    ],
-    "stress_bandwidth": [
+    ),
+    "stress_bandwidth": (
         tool_req("iperf3", "Network bandwidth tester"),
         TARGET_REQ,
-    ],
+    ),
 }
 
+# Keys are interned so lookups with interned names short-circuit on identity
+ATTACK_REQUIREMENTS: Mapping[str, tuple[Requirement, ...]] = MappingProxyType(
+    {sys.intern(action): reqs for action, reqs in _ATTACK_REQUIREMENTS.items()}
+)
+
 
-def get_requirements(action: str) -> list[Requirement]:
+def get_requirements(action: str) -> tuple[Requirement, ...]:
     """Get requirements for an action."""
-    return ATTACK_REQUIREMENTS.get(action, [])
+    return ATTACK_REQUIREMENTS.get(action, ())
 
 
 def list_actions() -> list[str]:
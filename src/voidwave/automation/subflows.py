@@ -1,7 +1,9 @@
 """Subflow acquisition system for acquiring missing inputs."""
 
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
+from types import MappingProxyType
 from typing import Any, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -23,7 +25,39 @@ class SubflowType(Enum):
     ENTER_API_KEY = "enter_api_key"
 
 
-@dataclass
+# Input type -> subflow that acquires it; anything else is typed in
+_INPUT_TO_SUBFLOW = MappingProxyType(
+    {
+        "target": SubflowType.SCAN_NETWORKS,
+        "target_wifi": SubflowType.SCAN_NETWORKS,
+        "target_host": SubflowType.ENTER_TARGET,
+        "client": SubflowType.SCAN_CLIENTS,
+        "handshake": SubflowType.CAPTURE_HANDSHAKE,
+        "pmkid": SubflowType.CAPTURE_PMKID,
+        "pixie": SubflowType.CAPTURE_PIXIE,
+        "portal": SubflowType.GENERATE_PORTAL,
+        "certs": SubflowType.GENERATE_CERTS,
+        "wordlist": SubflowType.DOWNLOAD_WORDLIST,
+        "target_ip": SubflowType.ENTER_TARGET,
+        "target_url": SubflowType.ENTER_TARGET,
+        "api_key": SubflowType.ENTER_API_KEY,
+    }
+)
+
+# Subflow -> session attribute its result is stored in
+_RESULT_ATTRS = MappingProxyType(
+    {
+        SubflowType.SCAN_NETWORKS: "selected_target",
+        SubflowType.SCAN_CLIENTS: "selected_client",
+        SubflowType.CAPTURE_HANDSHAKE: "capture_file",
+        SubflowType.CAPTURE_PMKID: "capture_file",
+        SubflowType.DOWNLOAD_WORDLIST: "wordlist",
+        SubflowType.ENTER_TARGET: "target",
+    }
+)
+
+
+@dataclass(slots=True)
 class SubflowContext:
     """Context passed to and from subflows."""
 
@@ -37,9 +71,12 @@ class SubflowContext:
 class SubflowManager:
     """Manages subflow execution and return."""
 
+    # Managers are cached in a WeakValueDictionary, so keep weakref support
+    __slots__ = ("__weakref__", "session", "stack")
+
     def __init__(self, session: "Session") -> None:
         self.session = session
-        self.stack: list[SubflowContext] = []
+        self.stack: deque[SubflowContext] = deque()
 
     async def acquire(self, input_type: str, parent_action: str) -> SubflowContext:
         """Start an acquisition subflow."""
@@ -75,22 +112,7 @@ class SubflowManager:
 
     def _map_input_to_subflow(self, input_type: str) -> SubflowType:
         """Map input type to subflow type."""
-        mapping = {
-            "target": SubflowType.SCAN_NETWORKS,
-            "target_wifi": SubflowType.SCAN_NETWORKS,
-            "target_host": SubflowType.ENTER_TARGET,
-            "client": SubflowType.SCAN_CLIENTS,
-            "handshake": SubflowType.CAPTURE_HANDSHAKE,
-            "pmkid": SubflowType.CAPTURE_PMKID,
-            "pixie": SubflowType.CAPTURE_PIXIE,
-            "portal": SubflowType.GENERATE_PORTAL,
-            "certs": SubflowType.GENERATE_CERTS,
-            "wordlist": SubflowType.DOWNLOAD_WORDLIST,
-            "target_ip": SubflowType.ENTER_TARGET,
-            "target_url": SubflowType.ENTER_TARGET,
-            "api_key": SubflowType.ENTER_API_KEY,
-        }
-        return mapping.get(input_type, SubflowType.ENTER_TARGET)
+        return _INPUT_TO_SUBFLOW.get(input_type, SubflowType.ENTER_TARGET)
 
     def _store_result(self, ctx: SubflowContext) -> None:
         """Store subflow result in session."""
@@ -98,21 +120,6 @@ class SubflowManager:
             return
 
         # Map results to session attributes
-        if ctx.subflow_type == SubflowType.SCAN_NETWORKS:
-            if hasattr(self.session, "selected_target"):
-                self.session.selected_target = ctx.result
-        elif ctx.subflow_type == SubflowType.SCAN_CLIENTS:
-            if hasattr(self.session, "selected_client"):
-                self.session.selected_client = ctx.result
-        elif ctx.subflow_type in (
-            SubflowType.CAPTURE_HANDSHAKE,
-            SubflowType.CAPTURE_PMKID,
-        ):
-            if hasattr(self.session, "capture_file"):
-                self.session.capture_file = ctx.result
-        elif ctx.subflow_type == SubflowType.DOWNLOAD_WORDLIST:
-            if hasattr(self.session, "wordlist"):
-                self.session.wordlist = ctx.result
-        elif ctx.subflow_type == SubflowType.ENTER_TARGET:
-            if hasattr(self.session, "target"):
-                self.session.target = ctx.result
+        attr = _RESULT_ATTRS.get(ctx.subflow_type)
+        if attr is not None and hasattr(self.session, attr):
+            setattr(self.session, attr, ctx.result)
@@ -1,12 +1,14 @@
 """Tool requirements configuration - defines what each tool needs to run."""
 
-from dataclasses import dataclass, field
-from typing import Any
+import sys
+from collections.abc import Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
 
-from voidwave.automation.fallbacks import FALLBACK_CHAINS
+from voidwave.automation.fallbacks import which
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ToolRequirement:
     """Requirements for a specific tool."""
 
@@ -39,28 +41,28 @@ class ToolRequirement:
     needs_gpu: bool = False  # For hashcat
 
     # Fallback tools if this one isn't available
-    fallbacks: list[str] = field(default_factory=list)
+    fallbacks: tuple[str, ...] = ()
 
     # Description for UI
     description: str = ""
 
 
 # Tool requirements registry
-TOOL_REQUIREMENTS: dict[str, ToolRequirement] = {
+_TOOL_REQUIREMENTS: dict[str, ToolRequirement] = {
     # === SCANNING TOOLS ===
     "nmap": ToolRequirement(
         tool="nmap",
         needs_root=True,  # For SYN scans, OS detection
         needs_target=True,
         target_type="cidr",
-        fallbacks=["rustscan", "masscan"],
+        fallbacks=("rustscan", "masscan"),
         description="Network scanner",
     ),
     "rustscan": ToolRequirement(
         tool="rustscan",
         needs_target=True,
         target_type="cidr",
-        fallbacks=["nmap", "masscan"],
+        fallbacks=("nmap", "masscan"),
         description="Fast port scanner",
     ),
     "masscan": ToolRequirement(
@@ -68,7 +70,7 @@ TOOL_REQUIREMENTS: dict[str, ToolRequirement] = {
         needs_root=True,
         needs_target=True,
         target_type="cidr",
-        fallbacks=["nmap", "rustscan"],
+        fallbacks=("nmap", "rustscan"),
         description="Mass IP port scanner",
     ),
 
@@ -112,7 +114,7 @@ TOOL_REQUIREMENTS: dict[str, ToolRequirement] = {
         interface_type="monitor",
         needs_target=True,
         target_type="bssid",
-        fallbacks=["bully"],
+        fallbacks=("bully",),
         description="WPS attack tool",
     ),
     "bully": ToolRequirement(
@@ -122,7 +124,7 @@ TOOL_REQUIREMENTS: dict[str, ToolRequirement] = {
         interface_type="monitor",
         needs_target=True,
         target_type="bssid",
-        fallbacks=["reaver"],
+        fallbacks=("reaver",),
         description="WPS brute force",
     ),
     "hcxdumptool": ToolRequirement(
@@ -146,14 +148,14 @@ TOOL_REQUIREMENTS: dict[str, ToolRequirement] = {
         tool="hashcat",
         needs_wordlist=True,
         needs_gpu=True,
-        fallbacks=["john"],
+        fallbacks=("john",),
         description="GPU password cracker",
     ),
     "john": ToolRequirement(
         tool="john",
         package="john-the-ripper",
         needs_wordlist=True,
-        fallbacks=["hashcat"],
+        fallbacks=("hashcat",),
         description="Password cracker",
     ),
     "hydra": ToolRequirement(
@@ -168,7 +170,7 @@ TOOL_REQUIREMENTS: dict[str, ToolRequirement] = {
         needs_target=True,
         target_type="ip",
         needs_wordlist=True,
-        fallbacks=["hydra"],
+        fallbacks=("hydra",),
         description="Network authentication cracker",
     ),
 
@@ -177,14 +179,14 @@ TOOL_REQUIREMENTS: dict[str, ToolRequirement] = {
         tool="subfinder",
         needs_target=True,
         target_type="domain",
-        fallbacks=["amass", "sublist3r"],
+        fallbacks=("amass", "sublist3r"),
         description="Subdomain finder",
     ),
     "amass": ToolRequirement(
         tool="amass",
         needs_target=True,
         target_type="domain",
-        fallbacks=["subfinder"],
+        fallbacks=("subfinder",),
         description="Attack surface mapper",
     ),
     "theHarvester": ToolRequirement(
@@ -197,7 +199,7 @@ TOOL_REQUIREMENTS: dict[str, ToolRequirement] = {
         tool="dnsenum",
         needs_target=True,
         target_type="domain",
-        fallbacks=["dnsrecon", "dig"],
+        fallbacks=("dnsrecon", "dig"),
         description="DNS enumeration",
     ),
 
@@ -207,7 +209,7 @@ TOOL_REQUIREMENTS: dict[str, ToolRequirement] = {
         needs_target=True,
         target_type="url",
         needs_wordlist=True,
-        fallbacks=["ffuf", "dirsearch"],
+        fallbacks=("ffuf", "dirsearch"),
         description="Directory/file brute forcer",
     ),
     "ffuf": ToolRequirement(
@@ -215,7 +217,7 @@ TOOL_REQUIREMENTS: dict[str, ToolRequirement] = {
         needs_target=True,
         target_type="url",
         needs_wordlist=True,
-        fallbacks=["gobuster"],
+        fallbacks=("gobuster",),
         description="Fast web fuzzer",
     ),
     "nikto": ToolRequirement(
@@ -264,7 +266,7 @@ TOOL_REQUIREMENTS: dict[str, ToolRequirement] = {
         needs_root=True,
         needs_interface=True,
         interface_type="all",
-        fallbacks=["tshark"],
+        fallbacks=("tshark",),
         description="Packet capture",
     ),
     "tshark": ToolRequirement(
@@ -273,7 +275,7 @@ TOOL_REQUIREMENTS: dict[str, ToolRequirement] = {
         needs_root=True,
         needs_interface=True,
         interface_type="all",
-        fallbacks=["tcpdump"],
+        fallbacks=("tcpdump",),
         description="Terminal Wireshark",
     ),
     "wireshark": ToolRequirement(
@@ -305,7 +307,7 @@ TOOL_REQUIREMENTS: dict[str, ToolRequirement] = {
         tool="enum4linux-ng",
         needs_target=True,
         target_type="ip",
-        fallbacks=["enum4linux", "smbclient"],
+        fallbacks=("enum4linux", "smbclient"),
         description="Windows/Samba enumeration",
     ),
     "smbclient": ToolRequirement(
@@ -316,6 +318,12 @@ TOOL_REQUIREMENTS: dict[str, ToolRequirement] = {
     ),
 }
 
+# Names with "-" or other non-identifier characters are not interned as
+# literals; intern them so lookups with interned names compare by identity
+TOOL_REQUIREMENTS: Mapping[str, ToolRequirement] = MappingProxyType(
+    {sys.intern(tool): req for tool, req in _TOOL_REQUIREMENTS.items()}
+)
+
 
 def get_tool_requirements(tool: str) -> ToolRequirement | None:
     """Get requirements for a tool."""
@@ -324,14 +332,12 @@ def get_tool_requirements(tool: str) -> ToolRequirement | None:
 
 def get_fallback_tool(tool: str) -> str | None:
     """Get first available fallback for a tool."""
-    import shutil
-
     req = TOOL_REQUIREMENTS.get(tool)
     if not req:
         return None
 
     for fallback in req.fallbacks:
-        if shutil.which(fallback):
+        if which(fallback):
             return fallback
 
     return None
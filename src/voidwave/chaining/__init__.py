@@ -17,7 +17,7 @@ Example:
         id="my_chain",
         name="My Custom Chain",
         description="Example chain",
-        steps=[
+        steps=(
             ChainStep(
                 id="scan",
                 tool="nmap",
@@ -35,7 +35,7 @@ Example:
                 options={"service_detection": True},
                 depends_on=["scan"],
             ),
-        ],
+        ),
     )
 
     # Register and execute
@@ -44,34 +44,78 @@ Example:
     result = await executor.execute(chain, target="192.168.1.0/24")
 """
 
-from voidwave.chaining.models import (
-    ChainDefinition,
-    ChainResult,
-    ChainStep,
-    Condition,
-    DataBinding,
-    OnErrorBehavior,
-    StepResult,
-    StepStatus,
-)
-from voidwave.chaining.executor import ChainExecutor
-from voidwave.chaining.registry import ChainRegistry, chain_registry
-from voidwave.chaining.paths import resolve_path, format_path
-from voidwave.chaining.transforms import (
-    TRANSFORMS,
-    apply_transform,
-    get_transform,
-    flatten_ips,
-    filter_open_ports,
-    extract_services,
-    extract_ports,
-    first,
-    last,
-    join,
-    unique,
-    to_cidr,
-    to_port_list,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from voidwave.chaining.models import (
+        ChainDefinition,
+        ChainResult,
+        ChainStep,
+        Condition,
+        DataBinding,
+        OnErrorBehavior,
+        StepResult,
+        StepStatus,
+    )
+    from voidwave.chaining.executor import ChainExecutor
+    from voidwave.chaining.registry import ChainRegistry, chain_registry
+    from voidwave.chaining.paths import resolve_path, format_path
+    from voidwave.chaining.transforms import (
+        TRANSFORMS,
+        apply_transform,
+        get_transform,
+        flatten_ips,
+        filter_open_ports,
+        extract_services,
+        extract_ports,
+        first,
+        last,
+        join,
+        unique,
+        to_cidr,
+        to_port_list,
+    )
+
+# Public name -> submodule defining it; submodules load on first access
+_LAZY_MODULES = {
+    "ChainDefinition": "models",
+    "ChainResult": "models",
+    "ChainStep": "models",
+    "Condition": "models",
+    "DataBinding": "models",
+    "OnErrorBehavior": "models",
+    "StepResult": "models",
+    "StepStatus": "models",
+    "ChainExecutor": "executor",
+    "ChainRegistry": "registry",
+    "chain_registry": "registry",
+    "resolve_path": "paths",
+    "format_path": "paths",
+    "TRANSFORMS": "transforms",
+    "apply_transform": "transforms",
+    "get_transform": "transforms",
+    "flatten_ips": "transforms",
+    "filter_open_ports": "transforms",
+    "extract_services": "transforms",
+    "extract_ports": "transforms",
+    "first": "transforms",
+    "last": "transforms",
+    "join": "transforms",
+    "unique": "transforms",
+    "to_cidr": "transforms",
+    "to_port_list": "transforms",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     # Models
@@ -1,16 +1,70 @@
-"""Built-in chain definitions."""
+"""Built-in chain definitions.
 
-from voidwave.chaining.builtin.credentials import register_credential_chains
-from voidwave.chaining.builtin.recon import register_recon_chains
-from voidwave.chaining.builtin.scanning import register_scanning_chains
-from voidwave.chaining.builtin.web import register_web_chains
-from voidwave.chaining.builtin.wireless import register_wireless_chains
+Each family of chains is imported on first use, so registering or
+importing one family does not build every other family's definitions.
+"""
+
+import functools
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+from voidwave.chaining.models import ChainDefinition
+from voidwave.chaining.registry import chain_registry
+
+if TYPE_CHECKING:
+    from voidwave.chaining.builtin.credentials import register_credential_chains
+    from voidwave.chaining.builtin.recon import register_recon_chains
+    from voidwave.chaining.builtin.scanning import register_scanning_chains
+    from voidwave.chaining.builtin.web import register_web_chains
+    from voidwave.chaining.builtin.wireless import register_wireless_chains
+
+# Register function -> submodule defining it, in registration order
+_BUILTIN_MODULES = {
+    "register_scanning_chains": "scanning",
+    "register_wireless_chains": "wireless",
+    "register_credential_chains": "credentials",
+    "register_recon_chains": "recon",
+    "register_web_chains": "web",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _BUILTIN_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(f"{__name__}.{module}"), name)
+
+
+@functools.cache
+def _all_chains() -> tuple[ChainDefinition, ...]:
+    """Every built-in chain, in registration order, collected once."""
+    return tuple(
+        chain
+        for module in _BUILTIN_MODULES.values()
+        for chain in import_module(f"{__name__}.{module}")._CHAINS
+    )
 
 
 def register_all_builtin_chains() -> None:
-    """Register all built-in chains with the registry."""
-    register_scanning_chains()
-    register_wireless_chains()
-    register_credential_chains()
-    register_recon_chains()
-    register_web_chains()
+    """Register all built-in chains with the registry.
+
+    Chains already registered are skipped, so calling this again on
+    startup or screen load does no work. The rest go to the registry as
+    one batch, so its table grows once for all of them instead of
+    resizing chain by chain.
+    """
+    pending = [
+        chain for chain in _all_chains() if chain_registry.get(chain.id) is not chain
+    ]
+    if pending:
+        chain_registry.register_many(pending)
+
+
+__all__ = [
+    "register_all_builtin_chains",
+    "register_credential_chains",
+    "register_recon_chains",
+    "register_scanning_chains",
+    "register_web_chains",
+    "register_wireless_chains",
+]
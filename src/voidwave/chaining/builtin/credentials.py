@@ -1,5 +1,8 @@
 """Built-in credential attack chains."""
 
+import sys
+from types import MappingProxyType
+
 from voidwave.chaining.models import (
     ChainDefinition,
     ChainStep,
@@ -8,6 +11,13 @@ from voidwave.chaining.models import (
     OnErrorBehavior,
 )
 from voidwave.chaining.registry import chain_registry
+from voidwave.chaining.transforms import TRANSFORMS
+
+# Wordlist paths, interned so every chain module shares one string per path
+_ROCKYOU = sys.intern("/usr/share/wordlists/rockyou.txt")
+_TOP_USERNAMES = sys.intern(
+    "/usr/share/seclists/Usernames/top-usernames-shortlist.txt"
+)
 
 
 # SSH Bruteforce Chain
@@ -17,15 +27,15 @@ ssh_bruteforce_chain = ChainDefinition(
     description="Discover SSH services and bruteforce credentials",
     target_type="cidr",
     tags=["credentials", "ssh", "bruteforce"],
-    steps=[
+    steps=(
         ChainStep(
             id="find_ssh",
             tool="nmap",
             description="Find SSH services",
-            options={
+            options=MappingProxyType({
                 "ports": "22,2222",
                 "service_detection": True,
-            },
+            }),
             timeout=300,
         ),
         ChainStep(
@@ -36,14 +46,14 @@ ssh_bruteforce_chain = ChainDefinition(
                 source_step="find_ssh",
                 source_path="hosts",
                 target_option="target",
-                transform="first_ssh",
+                transform=TRANSFORMS["first_ssh"],
             ),
-            options={
+            options=MappingProxyType({
                 "service": "ssh",
-                "user_list": "/usr/share/seclists/Usernames/top-usernames-shortlist.txt",
-                "pass_list": "/usr/share/wordlists/rockyou.txt",
+                "user_list": _TOP_USERNAMES,
+                "pass_list": _ROCKYOU,
                 "threads": 4,
-            },
+            }),
             depends_on=["find_ssh"],
             condition=Condition(
                 source_step="find_ssh",
@@ -53,7 +63,7 @@ ssh_bruteforce_chain = ChainDefinition(
             ),
             timeout=3600,
         ),
-    ],
+    ),
 )
 
 
@@ -64,15 +74,15 @@ web_bruteforce_chain = ChainDefinition(
     description="Discover web services and bruteforce login forms",
     target_type="ip",
     tags=["credentials", "web", "bruteforce"],
-    steps=[
+    steps=(
         ChainStep(
             id="find_web",
             tool="nmap",
             description="Find web services",
-            options={
+            options=MappingProxyType({
                 "ports": "80,443,8080,8443",
                 "service_detection": True,
-            },
+            }),
             timeout=300,
         ),
         ChainStep(
@@ -83,14 +93,14 @@ web_bruteforce_chain = ChainDefinition(
                 source_step="find_web",
                 source_path="hosts",
                 target_option="target",
-                transform="first_http",
+                transform=TRANSFORMS["first_http"],
             ),
-            options={
+            options=MappingProxyType({
                 "service": "http-get",
-                "user_list": "/usr/share/seclists/Usernames/top-usernames-shortlist.txt",
+                "user_list": _TOP_USERNAMES,
                 "pass_list": "/usr/share/seclists/Passwords/Common-Credentials/10k-most-common.txt",
                 "threads": 4,
-            },
+            }),
             depends_on=["find_web"],
             condition=Condition(
                 source_step="find_web",
@@ -100,7 +110,7 @@ web_bruteforce_chain = ChainDefinition(
             ),
             timeout=1800,
         ),
-    ],
+    ),
 )
 
 
@@ -111,20 +121,20 @@ hash_crack_chain = ChainDefinition(
     description="Identify and crack password hashes",
     target_type="file",
     tags=["credentials", "cracking", "hashes"],
-    steps=[
+    steps=(
         ChainStep(
             id="hashcat_crack",
             tool="hashcat",
             description="GPU-accelerated hash cracking",
-            options={
+            options=MappingProxyType({
                 "attack_mode": "dictionary",
-                "wordlist": "/usr/share/wordlists/rockyou.txt",
-            },
+                "wordlist": _ROCKYOU,
+            }),
             on_error=OnErrorBehavior.FALLBACK,
             fallback_tool="john",
             timeout=7200,
         ),
-    ],
+    ),
 )
 
 
@@ -135,15 +145,15 @@ credential_spray_chain = ChainDefinition(
     description="Crack hashes then spray credentials across services",
     target_type="cidr",
     tags=["credentials", "spray", "lateral"],
-    steps=[
+    steps=(
         ChainStep(
             id="discover_services",
             tool="nmap",
             description="Discover authentication services",
-            options={
+            options=MappingProxyType({
                 "ports": "22,23,21,445,3389,5985,5986",
                 "service_detection": True,
-            },
+            }),
             timeout=600,
         ),
         ChainStep(
@@ -154,12 +164,12 @@ credential_spray_chain = ChainDefinition(
                 source_step="discover_services",
                 source_path="hosts",
                 target_option="target",
-                transform="ssh_hosts_csv",
+                transform=TRANSFORMS["ssh_hosts_csv"],
             ),
-            options={
+            options=MappingProxyType({
                 "service": "ssh",
                 "threads": 2,  # Low and slow to avoid lockouts
-            },
+            }),
             depends_on=["discover_services"],
             condition=Condition(
                 source_step="discover_services",
@@ -177,12 +187,12 @@ credential_spray_chain = ChainDefinition(
                 source_step="discover_services",
                 source_path="hosts",
                 target_option="target",
-                transform="smb_hosts_csv",
+                transform=TRANSFORMS["smb_hosts_csv"],
             ),
-            options={
+            options=MappingProxyType({
                 "service": "smb",
                 "threads": 2,
-            },
+            }),
             depends_on=["discover_services"],
             parallel_with=["spray_ssh"],
             condition=Condition(
@@ -193,7 +203,7 @@ credential_spray_chain = ChainDefinition(
             ),
             timeout=1800,
         ),
-    ],
+    ),
 )
 
 
@@ -204,16 +214,16 @@ ftp_bruteforce_chain = ChainDefinition(
     description="Discover FTP services and bruteforce credentials",
     target_type="cidr",
     tags=["credentials", "ftp", "bruteforce"],
-    steps=[
+    steps=(
         ChainStep(
             id="find_ftp",
             tool="nmap",
             description="Find FTP services",
-            options={
+            options=MappingProxyType({
                 "ports": "21",
                 "service_detection": True,
                 "scripts": ["ftp-anon"],  # Check for anonymous access
-            },
+            }),
             timeout=300,
         ),
         ChainStep(
@@ -224,14 +234,14 @@ ftp_bruteforce_chain = ChainDefinition(
                 source_step="find_ftp",
                 source_path="hosts",
                 target_option="target",
-                transform="first_ftp",
+                transform=TRANSFORMS["first_ftp"],
             ),
-            options={
+            options=MappingProxyType({
                 "service": "ftp",
-                "user_list": "/usr/share/seclists/Usernames/top-usernames-shortlist.txt",
+                "user_list": _TOP_USERNAMES,
                 "pass_list": "/usr/share/seclists/Passwords/Common-Credentials/10-million-password-list-top-1000.txt",
                 "threads": 4,
-            },
+            }),
             depends_on=["find_ftp"],
             condition=Condition(
                 source_step="find_ftp",
@@ -241,14 +251,20 @@ ftp_bruteforce_chain = ChainDefinition(
             ),
             timeout=1800,
         ),
-    ],
+    ),
+)
+
+
+# Every chain defined here, in registration order
+_CHAINS: tuple[ChainDefinition, ...] = (
+    ssh_bruteforce_chain,
+    web_bruteforce_chain,
+    hash_crack_chain,
+    credential_spray_chain,
+    ftp_bruteforce_chain,
 )
 
 
 def register_credential_chains() -> None:
     """Register all credential chains."""
-    chain_registry.register(ssh_bruteforce_chain)
-    chain_registry.register(web_bruteforce_chain)
-    chain_registry.register(hash_crack_chain)
-    chain_registry.register(credential_spray_chain)
-    chain_registry.register(ftp_bruteforce_chain)
+    chain_registry.register_many(_CHAINS)
@@ -1,5 +1,8 @@
 """Built-in reconnaissance chains."""
 
+import sys
+from types import MappingProxyType
+
 from voidwave.chaining.models import (
     ChainDefinition,
     ChainStep,
@@ -8,6 +11,10 @@ from voidwave.chaining.models import (
     OnErrorBehavior,
 )
 from voidwave.chaining.registry import chain_registry
+from voidwave.chaining.transforms import TRANSFORMS
+
+# Wordlist paths, interned so every chain module shares one string per path
+_WEB_COMMON = sys.intern("/usr/share/seclists/Discovery/Web-Content/common.txt")
 
 
 # Web Reconnaissance Chain
@@ -17,15 +24,15 @@ web_recon_chain = ChainDefinition(
     description="Full web server reconnaissance with fingerprinting and directory discovery",
     target_type="ip",
     tags=["recon", "web", "fingerprinting", "discovery"],
-    steps=[
+    steps=(
         ChainStep(
             id="port_scan",
             tool="nmap",
             description="Find web ports",
-            options={
+            options=MappingProxyType({
                 "ports": "80,443,8080,8443,8000,8888,9000",
                 "service_detection": True,
-            },
+            }),
             timeout=300,
         ),
         ChainStep(
@@ -36,7 +43,7 @@ web_recon_chain = ChainDefinition(
                 source_step="port_scan",
                 source_path="hosts",
                 target_option="target",
-                transform="first_http_url",
+                transform=TRANSFORMS["first_http_url"],
             ),
             depends_on=["port_scan"],
             condition=Condition(
@@ -55,11 +62,11 @@ web_recon_chain = ChainDefinition(
                 source_step="port_scan",
                 source_path="hosts",
                 target_option="target",
-                transform="first_http_url",
+                transform=TRANSFORMS["first_http_url"],
             ),
-            options={
+            options=MappingProxyType({
                 "tuning": "12b",  # Interesting files, misconfig, software ID
-            },
+            }),
             depends_on=["fingerprint"],
             timeout=600,
         ),
@@ -71,18 +78,18 @@ web_recon_chain = ChainDefinition(
                 source_step="port_scan",
                 source_path="hosts",
                 target_option="target",
-                transform="first_http_url",
+                transform=TRANSFORMS["first_http_url"],
             ),
-            options={
+            options=MappingProxyType({
                 "mode": "dir",
-                "wordlist": "/usr/share/seclists/Discovery/Web-Content/common.txt",
+                "wordlist": _WEB_COMMON,
                 "threads": 10,
-            },
+            }),
             depends_on=["fingerprint"],
             parallel_with=["vuln_scan"],
             timeout=900,
         ),
-    ],
+    ),
 )
 
 
@@ -93,15 +100,15 @@ subdomain_enum_chain = ChainDefinition(
     description="Discover subdomains and map attack surface",
     target_type="domain",
     tags=["recon", "subdomain", "osint", "discovery"],
-    steps=[
+    steps=(
         ChainStep(
             id="passive_enum",
             tool="subfinder",
             description="Passive subdomain discovery",
-            options={
+            options=MappingProxyType({
                 "threads": 10,
                 "timeout": 30,
-            },
+            }),
             timeout=600,
         ),
         ChainStep(
@@ -112,13 +119,13 @@ subdomain_enum_chain = ChainDefinition(
                 source_step="passive_enum",
                 source_path="data",
                 target_option="target",
-                transform="subdomains_targets",
+                transform=TRANSFORMS["subdomains_targets"],
             ),
-            options={
+            options=MappingProxyType({
                 "ports": "80,443",
                 "service_detection": True,
                 "skip_discovery": True,
-            },
+            }),
             depends_on=["passive_enum"],
             condition=Condition(
                 source_step="passive_enum",
@@ -136,7 +143,7 @@ subdomain_enum_chain = ChainDefinition(
                 source_step="resolve_dns",
                 source_path="hosts",
                 target_option="target",
-                transform="hosts_to_urls",
+                transform=TRANSFORMS["hosts_to_urls"],
             ),
             depends_on=["resolve_dns"],
             condition=Condition(
@@ -147,7 +154,7 @@ subdomain_enum_chain = ChainDefinition(
             ),
             timeout=600,
         ),
-    ],
+    ),
 )
 
 
@@ -158,24 +165,24 @@ cms_detect_chain = ChainDefinition(
     description="Detect WordPress installations and run specialized scans",
     target_type="url",
     tags=["recon", "wordpress", "cms", "fingerprinting"],
-    steps=[
+    steps=(
         ChainStep(
             id="fingerprint",
             tool="whatweb",
             description="Technology fingerprinting",
-            options={
+            options=MappingProxyType({
                 "aggression": 3,  # More aggressive for CMS detection
-            },
+            }),
             timeout=300,
         ),
         ChainStep(
             id="nuclei_tech",
             tool="nuclei",
             description="Technology-based vulnerability scan",
-            options={
+            options=MappingProxyType({
                 "tags": ["tech", "panel", "config"],
                 "severity": ["info", "low", "medium", "high", "critical"],
-            },
+            }),
             depends_on=["fingerprint"],
             timeout=600,
         ),
@@ -183,17 +190,17 @@ cms_detect_chain = ChainDefinition(
             id="dir_enum",
             tool="gobuster",
             description="CMS directory enumeration",
-            options={
+            options=MappingProxyType({
                 "mode": "dir",
                 "wordlist": "/usr/share/seclists/Discovery/Web-Content/CMS/wordpress.fuzz.txt",
                 "extensions": "php,txt,html,bak",
                 "threads": 10,
-            },
+            }),
             depends_on=["fingerprint"],
             parallel_with=["nuclei_tech"],
             timeout=600,
         ),
-    ],
+    ),
 )
 
 
@@ -204,15 +211,15 @@ full_recon_chain = ChainDefinition(
     description="Comprehensive target reconnaissance combining all techniques",
     target_type="ip",
     tags=["recon", "comprehensive", "full"],
-    steps=[
+    steps=(
         ChainStep(
             id="port_discovery",
             tool="masscan",
             description="Fast port discovery",
-            options={
+            options=MappingProxyType({
                 "ports": "1-65535",
                 "rate": 10000,
-            },
+            }),
             on_error=OnErrorBehavior.FALLBACK,
             fallback_tool="nmap",
             timeout=300,
@@ -225,22 +232,22 @@ full_recon_chain = ChainDefinition(
                 source_step="port_discovery",
                 source_path="hosts",
                 target_option="target",
-                transform="hosts_to_ips",
+                transform=TRANSFORMS["hosts_to_ips"],
             ),
             option_bindings=[
                 DataBinding(
                     source_step="port_discovery",
                     source_path="hosts",
                     target_option="ports",
-                    transform="ports_csv",
+                    transform=TRANSFORMS["ports_csv"],
                     required=False,
                     default="1-1000",
                 ),
             ],
-            options={
+            options=MappingProxyType({
                 "service_detection": True,
                 "os_detection": True,
-            },
+            }),
             depends_on=["port_discovery"],
             condition=Condition(
                 source_step="port_discovery",
@@ -258,7 +265,7 @@ full_recon_chain = ChainDefinition(
                 source_step="service_enum",
                 source_path="hosts",
                 target_option="target",
-                transform="first_http_url",
+                transform=TRANSFORMS["first_http_url"],
             ),
             depends_on=["service_enum"],
             condition=Condition(
@@ -276,12 +283,12 @@ full_recon_chain = ChainDefinition(
                 source_step="service_enum",
                 source_path="hosts",
                 target_option="target",
-                transform="first_http_url",
+                transform=TRANSFORMS["first_http_url"],
             ),
-            options={
+            options=MappingProxyType({
                 "severity": ["medium", "high", "critical"],
                 "tags": ["cve", "vuln"],
-            },
+            }),
             depends_on=["web_fingerprint"],
             timeout=900,
         ),
@@ -293,24 +300,30 @@ full_recon_chain = ChainDefinition(
                 source_step="service_enum",
                 source_path="hosts",
                 target_option="target",
-                transform="first_http_url",
+                transform=TRANSFORMS["first_http_url"],
             ),
-            options={
+            options=MappingProxyType({
                 "mode": "dir",
                 "wordlist": "/usr/share/seclists/Discovery/Web-Content/directory-list-2.3-medium.txt",
                 "threads": 20,
-            },
+            }),
             depends_on=["web_fingerprint"],
             parallel_with=["vuln_scan"],
             timeout=1200,
         ),
-    ],
+    ),
+)
+
+
+# Every chain defined here, in registration order
+_CHAINS: tuple[ChainDefinition, ...] = (
+    web_recon_chain,
+    subdomain_enum_chain,
+    cms_detect_chain,
+    full_recon_chain,
 )
 
 
 def register_recon_chains() -> None:
     """Register all reconnaissance chains."""
-    chain_registry.register(web_recon_chain)
-    chain_registry.register(subdomain_enum_chain)
-    chain_registry.register(cms_detect_chain)
-    chain_registry.register(full_recon_chain)
+    chain_registry.register_many(_CHAINS)
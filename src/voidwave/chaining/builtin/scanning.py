@@ -1,5 +1,7 @@
 """Built-in scanning chains."""
 
+from types import MappingProxyType
+
 from voidwave.chaining.models import (
     ChainDefinition,
     ChainStep,
@@ -8,6 +10,10 @@ from voidwave.chaining.models import (
     OnErrorBehavior,
 )
 from voidwave.chaining.registry import chain_registry
+from voidwave.chaining.transforms import TRANSFORMS
+
+# Option sets used by several steps, shared read-only rather than copied
+_SERVICE_DETECTION_OPTIONS = MappingProxyType({"service_detection": True})
 
 
 # Fast-to-Detailed Scan Chain
@@ -17,15 +23,15 @@ fast_to_detailed_chain = ChainDefinition(
     description="Fast port discovery with masscan, then detailed service enumeration with nmap",
     target_type="cidr",
     tags=["scanning", "network", "recon"],
-    steps=[
+    steps=(
         ChainStep(
             id="fast_scan",
             tool="masscan",
             description="Fast TCP port discovery",
-            options={
+            options=MappingProxyType({
                 "ports": "1-65535",
                 "rate": 10000,
-            },
+            }),
             on_error=OnErrorBehavior.FALLBACK,
             fallback_tool="nmap",
             timeout=300,
@@ -38,22 +44,22 @@ fast_to_detailed_chain = ChainDefinition(
                 source_step="fast_scan",
                 source_path="hosts",
                 target_option="target",
-                transform="hosts_to_ips",
+                transform=TRANSFORMS["hosts_to_ips"],
             ),
             option_bindings=[
                 DataBinding(
                     source_step="fast_scan",
                     source_path="hosts",
                     target_option="ports",
-                    transform="ports_csv",
+                    transform=TRANSFORMS["ports_csv"],
                     required=False,
                     default="1-1000",
                 ),
             ],
-            options={
+            options=MappingProxyType({
                 "service_detection": True,
                 "os_detection": True,
-            },
+            }),
             depends_on=["fast_scan"],
             condition=Condition(
                 source_step="fast_scan",
@@ -63,7 +69,7 @@ fast_to_detailed_chain = ChainDefinition(
             ),
             timeout=600,
         ),
-    ],
+    ),
 )
 
 
@@ -74,15 +80,15 @@ vuln_scan_chain = ChainDefinition(
     description="Port scan → Service detection → Vulnerability scan",
     target_type="ip",
     tags=["scanning", "vulnerability", "security"],
-    steps=[
+    steps=(
         ChainStep(
             id="port_scan",
             tool="nmap",
             description="Initial port scan",
-            options={
+            options=MappingProxyType({
                 "scan_type": "standard",
                 "top_ports": 1000,
-            },
+            }),
             timeout=300,
         ),
         ChainStep(
@@ -93,19 +99,17 @@ vuln_scan_chain = ChainDefinition(
                 source_step="port_scan",
                 source_path="hosts",
                 target_option="target",
-                transform="hosts_to_ips",
+                transform=TRANSFORMS["hosts_to_ips"],
             ),
             option_bindings=[
                 DataBinding(
                     source_step="port_scan",
                     source_path="hosts",
                     target_option="ports",
-                    transform="ports_csv",
+                    transform=TRANSFORMS["ports_csv"],
                 ),
             ],
-            options={
-                "service_detection": True,
-            },
+            options=_SERVICE_DETECTION_OPTIONS,
             depends_on=["port_scan"],
             condition=Condition(
                 source_step="port_scan",
@@ -123,12 +127,12 @@ vuln_scan_chain = ChainDefinition(
                 source_step="service_scan",
                 source_path="hosts",
                 target_option="target",
-                transform="hosts_to_ips",
+                transform=TRANSFORMS["hosts_to_ips"],
             ),
-            options={
+            options=MappingProxyType({
                 "scan_type": "vuln",
                 "scripts": ["vuln"],
-            },
+            }),
             depends_on=["service_scan"],
             condition=Condition(
                 source_step="service_scan",
@@ -138,7 +142,7 @@ vuln_scan_chain = ChainDefinition(
             ),
             timeout=900,
         ),
-    ],
+    ),
 )
 
 
@@ -149,15 +153,15 @@ quick_recon_chain = ChainDefinition(
     description="Fast reconnaissance with top ports and basic service detection",
     target_type="ip",
     tags=["scanning", "recon", "quick"],
-    steps=[
+    steps=(
         ChainStep(
             id="quick_scan",
             tool="nmap",
             description="Quick top-ports scan",
-            options={
+            options=MappingProxyType({
                 "scan_type": "quick",
                 "top_ports": 100,
-            },
+            }),
             timeout=120,
         ),
         ChainStep(
@@ -168,19 +172,17 @@ quick_recon_chain = ChainDefinition(
                 source_step="quick_scan",
                 source_path="hosts",
                 target_option="target",
-                transform="hosts_to_ips",
+                transform=TRANSFORMS["hosts_to_ips"],
             ),
             option_bindings=[
                 DataBinding(
                     source_step="quick_scan",
                     source_path="hosts",
                     target_option="ports",
-                    transform="ports_csv",
+                    transform=TRANSFORMS["ports_csv"],
                 ),
             ],
-            options={
-                "service_detection": True,
-            },
+            options=_SERVICE_DETECTION_OPTIONS,
             depends_on=["quick_scan"],
             condition=Condition(
                 source_step="quick_scan",
@@ -190,7 +192,7 @@ quick_recon_chain = ChainDefinition(
             ),
             timeout=300,
         ),
-    ],
+    ),
 )
 
 
@@ -201,16 +203,16 @@ stealth_scan_chain = ChainDefinition(
     description="Low and slow scanning to avoid detection",
     target_type="ip",
     tags=["scanning", "stealth", "evasion"],
-    steps=[
+    steps=(
         ChainStep(
             id="stealth_discovery",
             tool="nmap",
             description="Stealthy host discovery",
-            options={
+            options=MappingProxyType({
                 "scan_type": "stealth",
                 "timing": 2,  # T2 - polite
                 "top_ports": 100,
-            },
+            }),
             timeout=600,
         ),
         ChainStep(
@@ -221,13 +223,13 @@ stealth_scan_chain = ChainDefinition(
                 source_step="stealth_discovery",
                 source_path="hosts",
                 target_option="target",
-                transform="hosts_to_ips",
+                transform=TRANSFORMS["hosts_to_ips"],
             ),
-            options={
+            options=MappingProxyType({
                 "scan_type": "stealth",
                 "service_detection": True,
                 "timing": 2,
-            },
+            }),
             depends_on=["stealth_discovery"],
             condition=Condition(
                 source_step="stealth_discovery",
@@ -237,13 +239,19 @@ stealth_scan_chain = ChainDefinition(
             ),
             timeout=900,
         ),
-    ],
+    ),
+)
+
+
+# Every chain defined here, in registration order
+_CHAINS: tuple[ChainDefinition, ...] = (
+    fast_to_detailed_chain,
+    vuln_scan_chain,
+    quick_recon_chain,
+    stealth_scan_chain,
 )
 
 
 def register_scanning_chains() -> None:
     """Register all scanning chains."""
-    chain_registry.register(fast_to_detailed_chain)
-    chain_registry.register(vuln_scan_chain)
-    chain_registry.register(quick_recon_chain)
-    chain_registry.register(stealth_scan_chain)
+    chain_registry.register_many(_CHAINS)
@@ -1,5 +1,8 @@
 """Built-in web attack chains."""
 
+import sys
+from types import MappingProxyType
+
 from voidwave.chaining.models import (
     ChainDefinition,
     ChainStep,
@@ -8,6 +11,10 @@ from voidwave.chaining.models import (
     OnErrorBehavior,
 )
 from voidwave.chaining.registry import chain_registry
+from voidwave.chaining.transforms import TRANSFORMS
+
+# Wordlist paths, interned so every chain module shares one string per path
+_WEB_COMMON = sys.intern("/usr/share/seclists/Discovery/Web-Content/common.txt")
 
 
 # SQL Injection Attack Chain
@@ -17,27 +24,27 @@ sqli_attack_chain = ChainDefinition(
     description="Automated SQL injection testing and exploitation",
     target_type="url",
     tags=["web", "sqli", "injection", "exploitation"],
-    steps=[
+    steps=(
         ChainStep(
             id="sqli_test",
             tool="sqlmap",
             description="Test for SQL injection vulnerabilities",
-            options={
+            options=MappingProxyType({
                 "level": 2,
                 "risk": 2,
                 "batch": True,
                 "threads": 4,
-            },
+            }),
             timeout=1800,
         ),
         ChainStep(
             id="enum_dbs",
             tool="sqlmap",
             description="Enumerate databases",
-            options={
+            options=MappingProxyType({
                 "dbs": True,
                 "batch": True,
-            },
+            }),
             depends_on=["sqli_test"],
             condition=Condition(
                 source_step="sqli_test",
@@ -51,10 +58,10 @@ sqli_attack_chain = ChainDefinition(
             id="enum_tables",
             tool="sqlmap",
             description="Enumerate tables",
-            options={
+            options=MappingProxyType({
                 "tables": True,
                 "batch": True,
-            },
+            }),
             depends_on=["enum_dbs"],
             condition=Condition(
                 source_step="enum_dbs",
@@ -64,7 +71,7 @@ sqli_attack_chain = ChainDefinition(
             ),
             timeout=600,
         ),
-    ],
+    ),
 )
 
 
@@ -75,28 +82,28 @@ web_fuzz_chain = ChainDefinition(
     description="Comprehensive web fuzzing for directories, parameters, and vulnerabilities",
     target_type="url",
     tags=["web", "fuzz", "discovery", "bruteforce"],
-    steps=[
+    steps=(
         ChainStep(
             id="dir_fuzz",
             tool="ffuf",
             description="Directory fuzzing",
-            options={
-                "wordlist": "/usr/share/seclists/Discovery/Web-Content/common.txt",
+            options=MappingProxyType({
+                "wordlist": _WEB_COMMON,
                 "threads": 40,
                 "match_status": "200,204,301,302,307,401,403,405",
                 "auto_calibrate": True,
-            },
+            }),
             timeout=600,
         ),
         ChainStep(
             id="extension_fuzz",
             tool="ffuf",
             description="File extension fuzzing",
-            options={
+            options=MappingProxyType({
                 "wordlist": "/usr/share/seclists/Discovery/Web-Content/web-extensions.txt",
                 "threads": 40,
                 "extensions": "php,asp,aspx,jsp,html,js,txt,bak",
-            },
+            }),
             depends_on=["dir_fuzz"],
             timeout=600,
         ),
@@ -104,15 +111,15 @@ web_fuzz_chain = ChainDefinition(
             id="vuln_scan",
             tool="nuclei",
             description="Vulnerability scanning on discovered paths",
-            options={
+            options=MappingProxyType({
                 "severity": ["low", "medium", "high", "critical"],
                 "tags": ["xss", "sqli", "lfi", "rce", "ssrf"],
-            },
+            }),
             depends_on=["dir_fuzz"],
             parallel_with=["extension_fuzz"],
             timeout=900,
         ),
-    ],
+    ),
 )
 
 
@@ -123,16 +130,16 @@ vuln_exploit_chain = ChainDefinition(
     description="Find vulnerabilities and map to potential exploits",
     target_type="ip",
     tags=["web", "vuln", "exploit", "cve"],
-    steps=[
+    steps=(
         ChainStep(
             id="port_scan",
             tool="nmap",
             description="Service version detection",
-            options={
+            options=MappingProxyType({
                 "ports": "80,443,8080,8443",
                 "service_detection": True,
                 "scripts": ["vuln", "http-enum"],
-            },
+            }),
             timeout=600,
         ),
         ChainStep(
@@ -143,12 +150,12 @@ vuln_exploit_chain = ChainDefinition(
                 source_step="port_scan",
                 source_path="hosts",
                 target_option="target",
-                transform="first_http_url",
+                transform=TRANSFORMS["first_http_url"],
             ),
-            options={
+            options=MappingProxyType({
                 "tags": ["cve"],
                 "severity": ["high", "critical"],
-            },
+            }),
             depends_on=["port_scan"],
             condition=Condition(
                 source_step="port_scan",
@@ -166,16 +173,16 @@ vuln_exploit_chain = ChainDefinition(
                 source_step="port_scan",
                 source_path="hosts",
                 target_option="target",
-                transform="first_http_url",
+                transform=TRANSFORMS["first_http_url"],
             ),
-            options={
+            options=MappingProxyType({
                 "tuning": "49",  # Injection, command exec, SQL injection
-            },
+            }),
             depends_on=["port_scan"],
             parallel_with=["nuclei_cve"],
             timeout=600,
         ),
-    ],
+    ),
 )
 
 
@@ -186,30 +193,30 @@ xss_test_chain = ChainDefinition(
     description="Cross-site scripting vulnerability detection",
     target_type="url",
     tags=["web", "xss", "injection"],
-    steps=[
+    steps=(
         ChainStep(
             id="param_discovery",
             tool="ffuf",
             description="Discover URL parameters",
-            options={
+            options=MappingProxyType({
                 "wordlist": "/usr/share/seclists/Discovery/Web-Content/burp-parameter-names.txt",
                 "threads": 40,
                 "auto_calibrate": True,
-            },
+            }),
             timeout=600,
         ),
         ChainStep(
             id="xss_scan",
             tool="nuclei",
             description="XSS vulnerability scan",
-            options={
+            options=MappingProxyType({
                 "tags": ["xss"],
                 "severity": ["low", "medium", "high", "critical"],
-            },
+            }),
             depends_on=["param_discovery"],
             timeout=600,
         ),
-    ],
+    ),
 )
 
 
@@ -220,27 +227,27 @@ api_recon_chain = ChainDefinition(
     description="Discover and enumerate API endpoints",
     target_type="url",
     tags=["web", "api", "recon", "discovery"],
-    steps=[
+    steps=(
         ChainStep(
             id="api_discovery",
             tool="ffuf",
             description="API endpoint discovery",
-            options={
+            options=MappingProxyType({
                 "wordlist": "/usr/share/seclists/Discovery/Web-Content/api/api-endpoints.txt",
                 "threads": 40,
                 "match_status": "200,201,204,301,302,307,400,401,403,405",
                 "auto_calibrate": True,
-            },
+            }),
             timeout=900,
         ),
         ChainStep(
             id="api_version",
             tool="ffuf",
             description="API version fuzzing",
-            options={
+            options=MappingProxyType({
                 "wordlist": "/usr/share/seclists/Discovery/Web-Content/api/api-seen-in-wild.txt",
                 "threads": 20,
-            },
+            }),
             depends_on=["api_discovery"],
             timeout=600,
         ),
@@ -248,15 +255,15 @@ api_recon_chain = ChainDefinition(
             id="api_vuln",
             tool="nuclei",
             description="API vulnerability scan",
-            options={
+            options=MappingProxyType({
                 "tags": ["api", "exposure"],
                 "severity": ["medium", "high", "critical"],
-            },
+            }),
             depends_on=["api_discovery"],
             parallel_with=["api_version"],
             timeout=600,
         ),
-    ],
+    ),
 )
 
 
@@ -267,26 +274,26 @@ full_web_attack_chain = ChainDefinition(
     description="Comprehensive web application attack chain",
     target_type="url",
     tags=["web", "comprehensive", "attack"],
-    steps=[
+    steps=(
         ChainStep(
             id="fingerprint",
             tool="whatweb",
             description="Technology fingerprinting",
-            options={
+            options=MappingProxyType({
                 "aggression": 3,
-            },
+            }),
             timeout=300,
         ),
         ChainStep(
             id="dir_enum",
             tool="gobuster",
             description="Directory enumeration",
-            options={
+            options=MappingProxyType({
                 "mode": "dir",
                 "wordlist": "/usr/share/seclists/Discovery/Web-Content/directory-list-2.3-small.txt",
                 "threads": 20,
                 "extensions": "php,asp,aspx,jsp,html",
-            },
+            }),
             depends_on=["fingerprint"],
             timeout=900,
         ),
@@ -294,9 +301,9 @@ full_web_attack_chain = ChainDefinition(
             id="vuln_scan",
             tool="nikto",
             description="Vulnerability scan",
-            options={
+            options=MappingProxyType({
                 "tuning": "123489",  # Full tuning
-            },
+            }),
             depends_on=["fingerprint"],
             parallel_with=["dir_enum"],
             timeout=900,
@@ -305,9 +312,9 @@ full_web_attack_chain = ChainDefinition(
             id="nuclei_scan",
             tool="nuclei",
             description="Template-based vulnerability scan",
-            options={
+            options=MappingProxyType({
                 "severity": ["medium", "high", "critical"],
-            },
+            }),
             depends_on=["vuln_scan", "dir_enum"],
             timeout=1200,
         ),
@@ -315,13 +322,13 @@ full_web_attack_chain = ChainDefinition(
             id="sqli_test",
             tool="sqlmap",
             description="SQL injection testing",
-            options={
+            options=MappingProxyType({
                 "level": 2,
                 "risk": 2,
                 "batch": True,
                 "forms": True,
                 "crawl": 2,
-            },
+            }),
             depends_on=["nuclei_scan"],
             condition=Condition(
                 source_step="nuclei_scan",
@@ -331,15 +338,21 @@ full_web_attack_chain = ChainDefinition(
             ),
             timeout=1800,
         ),
-    ],
+    ),
+)
+
+
+# Every chain defined here, in registration order
+_CHAINS: tuple[ChainDefinition, ...] = (
+    sqli_attack_chain,
+    web_fuzz_chain,
+    vuln_exploit_chain,
+    xss_test_chain,
+    api_recon_chain,
+    full_web_attack_chain,
 )
 
 
 def register_web_chains() -> None:
     """Register all web attack chains."""
-    chain_registry.register(sqli_attack_chain)
-    chain_registry.register(web_fuzz_chain)
-    chain_registry.register(vuln_exploit_chain)
-    chain_registry.register(xss_test_chain)
-    chain_registry.register(api_recon_chain)
-    chain_registry.register(full_web_attack_chain)
+    chain_registry.register_many(_CHAINS)
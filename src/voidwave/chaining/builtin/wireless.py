@@ -1,5 +1,8 @@
 """Built-in wireless attack chains."""
 
+import sys
+from types import MappingProxyType
+
 from voidwave.chaining.models import (
     ChainDefinition,
     ChainStep,
@@ -9,6 +12,12 @@ from voidwave.chaining.models import (
 )
 from voidwave.chaining.registry import chain_registry
 
+# Wordlist paths, interned so every chain module shares one string per path
+_ROCKYOU = sys.intern("/usr/share/wordlists/rockyou.txt")
+
+# Option sets used by several steps, shared read-only rather than copied
+_ROCKYOU_OPTIONS = MappingProxyType({"wordlist": _ROCKYOU})
+
 
 # WPA Handshake Capture Chain
 wpa_capture_chain = ChainDefinition(
@@ -18,16 +27,16 @@ wpa_capture_chain = ChainDefinition(
     target_type="interface",
     preflight_action="wireless_capture",
     tags=["wireless", "wpa", "handshake"],
-    steps=[
+    steps=(
         ChainStep(
             id="scan_networks",
             tool="airodump-ng",
             description="Discover wireless networks",
-            options={
+            options=MappingProxyType({
                 "band": "abg",
                 "write_interval": 1,
                 "output_format": "csv",
-            },
+            }),
             timeout=30,
         ),
         ChainStep(
@@ -46,9 +55,9 @@ wpa_capture_chain = ChainDefinition(
                     target_option="channel",
                 ),
             ],
-            options={
+            options=MappingProxyType({
                 "output_format": "pcap",
-            },
+            }),
             depends_on=["scan_networks"],
             parallel_with=["deauth_attack"],
             condition=Condition(
@@ -70,10 +79,10 @@ wpa_capture_chain = ChainDefinition(
                     target_option="bssid",
                 ),
             ],
-            options={
+            options=MappingProxyType({
                 "attack": "deauth",
                 "count": 10,
-            },
+            }),
             depends_on=["scan_networks"],
             condition=Condition(
                 source_step="scan_networks",
@@ -83,7 +92,7 @@ wpa_capture_chain = ChainDefinition(
             ),
             timeout=60,
         ),
-    ],
+    ),
 )
 
 
@@ -94,19 +103,17 @@ wpa_crack_chain = ChainDefinition(
     description="Crack captured WPA handshake with wordlist",
     target_type="file",
     tags=["wireless", "wpa", "cracking"],
-    steps=[
+    steps=(
         ChainStep(
             id="aircrack_attack",
             tool="aircrack-ng",
             description="Dictionary attack on handshake",
-            options={
-                "wordlist": "/usr/share/wordlists/rockyou.txt",
-            },
+            options=_ROCKYOU_OPTIONS,
             on_error=OnErrorBehavior.FALLBACK,
             fallback_tool="hashcat",
             timeout=3600,
         ),
-    ],
+    ),
 )
 
 
@@ -118,14 +125,14 @@ wpa_full_chain = ChainDefinition(
     target_type="interface",
     preflight_action="wireless_attack",
     tags=["wireless", "wpa", "full"],
-    steps=[
+    steps=(
         ChainStep(
             id="discover",
             tool="airodump-ng",
             description="Network discovery",
-            options={
+            options=MappingProxyType({
                 "band": "abg",
-            },
+            }),
             timeout=30,
         ),
         ChainStep(
@@ -159,10 +166,10 @@ wpa_full_chain = ChainDefinition(
                     target_option="bssid",
                 ),
             ],
-            options={
+            options=MappingProxyType({
                 "attack": "deauth",
                 "count": 20,
-            },
+            }),
             depends_on=["discover"],
             timeout=60,
         ),
@@ -177,9 +184,7 @@ wpa_full_chain = ChainDefinition(
                     target_option="capture_file",
                 ),
             ],
-            options={
-                "wordlist": "/usr/share/wordlists/rockyou.txt",
-            },
+            options=_ROCKYOU_OPTIONS,
             depends_on=["capture", "deauth"],
             condition=Condition(
                 source_step="capture",
@@ -188,7 +193,7 @@ wpa_full_chain = ChainDefinition(
             ),
             timeout=3600,
         ),
-    ],
+    ),
 )
 
 
@@ -200,14 +205,14 @@ wps_attack_chain = ChainDefinition(
     target_type="interface",
     preflight_action="wireless_wps",
     tags=["wireless", "wps", "reaver"],
-    steps=[
+    steps=(
         ChainStep(
             id="wps_scan",
             tool="wash",
             description="Scan for WPS-enabled APs",
-            options={
+            options=MappingProxyType({
                 "scan_time": 30,
-            },
+            }),
             timeout=45,
         ),
         ChainStep(
@@ -226,9 +231,9 @@ wps_attack_chain = ChainDefinition(
                     target_option="channel",
                 ),
             ],
-            options={
+            options=MappingProxyType({
                 "pixie_dust": True,
-            },
+            }),
             depends_on=["wps_scan"],
             condition=Condition(
                 source_step="wps_scan",
@@ -255,9 +260,9 @@ wps_attack_chain = ChainDefinition(
                     target_option="channel",
                 ),
             ],
-            options={
+            options=MappingProxyType({
                 "pixie_dust": False,
-            },
+            }),
             depends_on=["pixie_attack"],
             condition=Condition(
                 source_step="pixie_attack",
@@ -267,13 +272,19 @@ wps_attack_chain = ChainDefinition(
             ),
             timeout=7200,
         ),
-    ],
+    ),
+)
+
+
+# Every chain defined here, in registration order
+_CHAINS: tuple[ChainDefinition, ...] = (
+    wpa_capture_chain,
+    wpa_crack_chain,
+    wpa_full_chain,
+    wps_attack_chain,
 )
 
 
 def register_wireless_chains() -> None:
     """Register all wireless chains."""
-    chain_registry.register(wpa_capture_chain)
-    chain_registry.register(wpa_crack_chain)
-    chain_registry.register(wpa_full_chain)
-    chain_registry.register(wps_attack_chain)
+    chain_registry.register_many(_CHAINS)
@@ -1,7 +1,6 @@
 """Chain executor for running tool pipelines."""
 
 import asyncio
-from collections import defaultdict
 from datetime import datetime
 from typing import Any
 
@@ -16,6 +15,7 @@ from voidwave.chaining.models import (
     StepStatus,
 )
 from voidwave.chaining.paths import resolve_path
+from voidwave.chaining.plan import ChainExecutionError, execution_plan
 from voidwave.chaining.transforms import get_transform
 from voidwave.core.logging import get_logger
 from voidwave.orchestration.events import Events, event_bus
@@ -25,12 +25,6 @@ from voidwave.plugins.registry import plugin_registry
 logger = get_logger(__name__)
 
 
-class ChainExecutionError(Exception):
-    """Raised when chain execution fails due to configuration errors."""
-
-    pass
-
-
 class ChainExecutor:
     """Executes tool chains with dependency tracking and data binding."""
 
@@ -90,7 +84,7 @@ class ChainExecutor:
 
         # Build execution order with cycle detection
         try:
-            execution_order = self._build_execution_order(chain.steps)
+            execution_order = execution_plan(chain)
         except ChainExecutionError as e:
             result.success = False
             result.errors.append(str(e))
@@ -189,7 +183,7 @@ class ChainExecutor:
 
     async def _execute_group(
         self,
-        steps: list[ChainStep],
+        steps: tuple[ChainStep, ...],
         chain: ChainDefinition,
         target: str | None,
     ) -> dict[str, StepResult]:
@@ -436,109 +430,6 @@ class ChainExecutor:
 
         return result
 
-    def _build_execution_order(
-        self, steps: list[ChainStep]
-    ) -> list[list[ChainStep]]:
-        """Build topologically sorted execution groups.
-
-        Returns list of step groups. Steps in same group can run in parallel.
-
-        Raises:
-            ChainExecutionError: If cycles or unreachable steps detected
-        """
-        step_map = {s.id: s for s in steps}
-        all_step_ids = set(step_map.keys())
-
-        # Validate parallel_with references
-        for step in steps:
-            for peer_id in step.parallel_with:
-                if peer_id not in step_map:
-                    raise ChainExecutionError(
-                        f"Step '{step.id}' has parallel_with reference to unknown step '{peer_id}'"
-                    )
-
-        # Build dependency graph
-        dependencies: dict[str, set[str]] = defaultdict(set)
-        dependents: dict[str, set[str]] = defaultdict(set)
-
-        for step in steps:
-            for dep in step.depends_on:
-                if dep not in step_map:
-                    raise ChainExecutionError(
-                        f"Step '{step.id}' depends on unknown step '{dep}'"
-                    )
-                dependencies[step.id].add(dep)
-                dependents[dep].add(step.id)
-
-        # Validate parallel_with: peers must have same dependencies satisfied
-        for step in steps:
-            if step.parallel_with:
-                for peer_id in step.parallel_with:
-                    peer = step_map[peer_id]
-                    # Check that peer doesn't depend on this step (would create ordering conflict)
-                    if step.id in dependencies[peer_id]:
-                        raise ChainExecutionError(
-                            f"Step '{peer_id}' cannot be parallel_with '{step.id}' "
-                            f"because it depends on it"
-                        )
-
-        # Topological sort with cycle detection (Kahn's algorithm)
-        in_degree = {s.id: len(dependencies[s.id]) for s in steps}
-        ready = [s for s in steps if in_degree[s.id] == 0]
-        completed: set[str] = set()
-        order: list[list[ChainStep]] = []
-
-        while ready:
-            # Group steps that can run in parallel
-            parallel_group: list[ChainStep] = []
-            added_to_group: set[str] = set()
-            next_ready: list[ChainStep] = []
-
-            for step in ready:
-                if step.id in added_to_group:
-                    continue
-
-                # Check if all dependencies are complete
-                if all(d in completed for d in dependencies[step.id]):
-                    parallel_group.append(step)
-                    added_to_group.add(step.id)
-
-                    # Add parallel peers if their deps are also satisfied
-                    for peer_id in step.parallel_with:
-                        if peer_id not in added_to_group and peer_id not in completed:
-                            peer = step_map[peer_id]
-                            if all(d in completed for d in dependencies[peer_id]):
-                                parallel_group.append(peer)
-                                added_to_group.add(peer_id)
-                else:
-                    next_ready.append(step)
-
-            if parallel_group:
-                order.append(parallel_group)
-                for step in parallel_group:
-                    completed.add(step.id)
-                    # Decrease in-degree of dependents and add to ready if 0
-                    for dep_id in dependents[step.id]:
-                        in_degree[dep_id] -= 1
-                        if in_degree[dep_id] == 0:
-                            dep_step = step_map[dep_id]
-                            if dep_step not in next_ready:
-                                next_ready.append(dep_step)
-
-            ready = next_ready
-
-        # Check for cycles or unreachable steps
-        if len(completed) != len(all_step_ids):
-            missing = all_step_ids - completed
-            # Determine if it's a cycle or unreachable
-            # If remaining steps all have unsatisfied deps pointing to each other, it's a cycle
-            raise ChainExecutionError(
-                f"Chain has cycles or unreachable steps. "
-                f"Steps not executed: {', '.join(sorted(missing))}"
-            )
-
-        return order
-
     def _resolve_target(
         self, step: ChainStep, chain_target: str | None
     ) -> str | None:
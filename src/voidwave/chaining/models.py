@@ -1,8 +1,10 @@
 """Tool chaining data models."""
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from types import MappingProxyType
 from typing import Any, Callable
 
 
@@ -28,8 +30,15 @@ class StepStatus(str, Enum):
 # Type alias for transform specification
 TransformSpec = Callable[[Any], Any] | str | None
 
+# Read-only options shared by every step that configures none
+_NO_OPTIONS: Mapping[str, Any] = MappingProxyType({})
 
-@dataclass
+
+def _no_options() -> Mapping[str, Any]:
+    return _NO_OPTIONS
+
+
+@dataclass(slots=True)
 class DataBinding:
     """Maps output from one step to input of another.
 
@@ -58,7 +67,7 @@ class DataBinding:
     default: Any = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Condition:
     """Conditional execution of a step.
 
@@ -79,7 +88,7 @@ class Condition:
     negate: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ChainStep:
     """A single step in a tool chain."""
 
@@ -91,8 +100,8 @@ class ChainStep:
     target_binding: DataBinding | None = None
     target_static: str | None = None
 
-    # Options
-    options: dict[str, Any] = field(default_factory=dict)
+    # Options; may be a shared read-only mapping, the executor copies it per run
+    options: Mapping[str, Any] = field(default_factory=_no_options)
     option_bindings: list[DataBinding] = field(default_factory=list)
 
     # Execution control
@@ -111,14 +120,14 @@ class ChainStep:
     output_key: str | None = None  # Key to store output under (defaults to step id)
 
 
-@dataclass
+@dataclass(slots=True)
 class ChainDefinition:
     """Complete chain definition."""
 
     id: str
     name: str
     description: str
-    steps: list[ChainStep]
+    steps: tuple[ChainStep, ...]
 
     # Chain-level config
     target_type: str = "ip"
@@ -128,8 +137,17 @@ class ChainDefinition:
     tags: list[str] = field(default_factory=list)
     version: str = "1.0"
 
+    # (steps, step layout, plan) cached by chaining.plan.execution_plan
+    _plan: tuple[Any, Any, Any] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Accept steps as any iterable, such as the list older callers pass."""
+        self.steps = tuple(self.steps)
+
 
-@dataclass
+@dataclass(slots=True)
 class StepResult:
     """Result of executing a single step."""
 
@@ -144,7 +162,7 @@ class StepResult:
     ended_at: datetime | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ChainResult:
     """Result of executing an entire chain."""
 
@@ -1,8 +1,16 @@
 """JSONPath-like path resolution for data binding."""
 
+import functools
 import re
 from typing import Any
 
+# Array accessor [N], [*] or [?filter], and a plain key, each with a trailing dot
+_ARRAY_RE = re.compile(r"^\[(-?\d+|\*|\?[^\]]+)\]\.?")
+_KEY_RE = re.compile(r"^([^.\[\]]+)\.?")
+
+# Filter operators, two-character ones first so ">=" is not read as ">"
+_FILTER_OPS = ("==", "!=", ">=", "<=", ">", "<")
+
 
 def resolve_path(data: Any, path: str) -> Any:
     """Resolve a JSONPath-like expression against data.
@@ -37,14 +45,19 @@ def resolve_path(data: Any, path: str) -> Any:
     return _resolve_segments(data, segments)
 
 
-def _parse_path(path: str) -> list[dict[str, Any]]:
-    """Parse path string into segment list."""
+@functools.lru_cache(maxsize=256)
+def _parse_path(path: str) -> tuple[dict[str, Any], ...]:
+    """Parse path string into segments, once per distinct path.
+
+    Chain definitions reuse a small set of paths on every run, so parsed
+    segments are cached; callers must not modify them.
+    """
     segments = []
     remaining = path
 
     while remaining:
         # Match array accessor [N], [*], or [?filter]
-        array_match = re.match(r"^\[(-?\d+|\*|\?[^\]]+)\]\.?", remaining)
+        array_match = _ARRAY_RE.match(remaining)
         if array_match:
             accessor = array_match.group(1)
             if accessor == "*":
@@ -57,7 +70,7 @@ def _parse_path(path: str) -> list[dict[str, Any]]:
             continue
 
         # Match key accessor
-        key_match = re.match(r"^([^.\[\]]+)\.?", remaining)
+        key_match = _KEY_RE.match(remaining)
         if key_match:
             segments.append({"type": "key", "value": key_match.group(1)})
             remaining = remaining[key_match.end() :]
@@ -70,10 +83,10 @@ def _parse_path(path: str) -> list[dict[str, Any]]:
 
         break
 
-    return segments
+    return tuple(segments)
 
 
-def _resolve_segments(data: Any, segments: list[dict[str, Any]]) -> Any:
+def _resolve_segments(data: Any, segments: tuple[dict[str, Any], ...]) -> Any:
     """Recursively resolve path segments."""
     if not segments:
         return data
@@ -131,28 +144,33 @@ def _apply_filter(data: list, expr: str) -> list:
         - key>=value (greater or equal)
         - key<=value (less or equal)
     """
-    # Parse filter expression
-    for op in ["==", "!=", ">=", "<=", ">", "<"]:
+    parsed = _parse_filter(expr)
+    if parsed is None:
+        return data
+
+    key, op, value = parsed
+    return [
+        item
+        for item in data
+        if isinstance(item, dict) and _compare(item.get(key), op, value)
+    ]
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_filter(expr: str) -> tuple[str, str, Any] | None:
+    """Split a filter expression into key, operator and value, once per expr."""
+    for op in _FILTER_OPS:
         if op in expr:
-            parts = expr.split(op, 1)
-            if len(parts) == 2:
-                key = parts[0].strip()
-                value = parts[1].strip()
-
-                # Try to convert value to number
-                try:
-                    value = float(value)
-                    if value.is_integer():
-                        value = int(value)
-                except ValueError:
-                    pass
-
-                return [
-                    item
-                    for item in data
-                    if isinstance(item, dict) and _compare(item.get(key), op, value)
-                ]
-    return data
+            key, value = expr.split(op, 1)
+
+            # Try to convert value to number
+            value = value.strip()
+            try:
+                number = float(value)
+            except ValueError:
+                return key.strip(), op, value
+            return key.strip(), op, int(number) if number.is_integer() else number
+    return None
 
 
 def _compare(left: Any, op: str, right: Any) -> bool:
@@ -0,0 +1,141 @@
+"""Execution planning for chain step dependencies."""
+
+from collections import defaultdict
+from collections.abc import Sequence
+
+from voidwave.chaining.models import ChainDefinition, ChainStep
+
+# Steps grouped in execution order; steps in the same group can run in parallel
+ExecutionPlan = tuple[tuple[ChainStep, ...], ...]
+
+
+class ChainExecutionError(Exception):
+    """Raised when chain execution fails due to configuration errors."""
+
+    pass
+
+
+def execution_plan(chain: ChainDefinition) -> ExecutionPlan:
+    """Get the execution plan for a chain, building it once per step layout.
+
+    The plan is stored on the chain together with the steps and the step
+    ids and dependencies it was built from, so replacing ``chain.steps`` or
+    editing a step's ``depends_on``/``parallel_with`` rebuilds it on next use.
+
+    Raises:
+        ChainExecutionError: If cycles or unreachable steps detected
+    """
+    layout = _step_layout(chain.steps)
+    cached = chain._plan
+    if cached is not None and cached[0] is chain.steps and cached[1] == layout:
+        return cached[2]
+
+    plan = build_execution_plan(chain.steps)
+    chain._plan = (chain.steps, layout, plan)
+    return plan
+
+
+def _step_layout(steps: Sequence[ChainStep]) -> tuple[tuple[object, ...], ...]:
+    """Snapshot the step fields an execution plan depends on."""
+    return tuple(
+        (step.id, tuple(step.depends_on), tuple(step.parallel_with)) for step in steps
+    )
+
+
+def build_execution_plan(steps: Sequence[ChainStep]) -> ExecutionPlan:
+    """Build topologically sorted execution groups.
+
+    Returns a tuple of step groups. Steps in same group can run in parallel.
+
+    Raises:
+        ChainExecutionError: If cycles or unreachable steps detected
+    """
+    step_map = {s.id: s for s in steps}
+    all_step_ids = set(step_map.keys())
+
+    # Validate parallel_with references
+    for step in steps:
+        for peer_id in step.parallel_with:
+            if peer_id not in step_map:
+                raise ChainExecutionError(
+                    f"Step '{step.id}' has parallel_with reference to "
+                    f"unknown step '{peer_id}'"
+                )
+
+    # Build dependency graph
+    dependencies: dict[str, set[str]] = defaultdict(set)
+    dependents: dict[str, set[str]] = defaultdict(set)
+
+    for step in steps:
+        for dep in step.depends_on:
+            if dep not in step_map:
+                raise ChainExecutionError(
+                    f"Step '{step.id}' depends on unknown step '{dep}'"
+                )
+            dependencies[step.id].add(dep)
+            dependents[dep].add(step.id)
+
+    # Validate parallel_with: peers must have same dependencies satisfied
+    for step in steps:
+        for peer_id in step.parallel_with:
+            # Check that peer doesn't depend on this step (an ordering conflict)
+            if step.id in dependencies[peer_id]:
+                raise ChainExecutionError(
+                    f"Step '{peer_id}' cannot be parallel_with '{step.id}' "
+                    f"because it depends on it"
+                )
+
+    # Topological sort with cycle detection (Kahn's algorithm)
+    in_degree = {s.id: len(dependencies[s.id]) for s in steps}
+    ready = [s for s in steps if in_degree[s.id] == 0]
+    completed: set[str] = set()
+    order: list[tuple[ChainStep, ...]] = []
+
+    while ready:
+        # Group steps that can run in parallel
+        parallel_group: list[ChainStep] = []
+        added_to_group: set[str] = set()
+        next_ready: list[ChainStep] = []
+
+        for step in ready:
+            if step.id in added_to_group:
+                continue
+
+            # Check if all dependencies are complete
+            if all(d in completed for d in dependencies[step.id]):
+                parallel_group.append(step)
+                added_to_group.add(step.id)
+
+                # Add parallel peers if their deps are also satisfied
+                for peer_id in step.parallel_with:
+                    if peer_id not in added_to_group and peer_id not in completed:
+                        peer = step_map[peer_id]
+                        if all(d in completed for d in dependencies[peer_id]):
+                            parallel_group.append(peer)
+                            added_to_group.add(peer_id)
+            else:
+                next_ready.append(step)
+
+        if parallel_group:
+            order.append(tuple(parallel_group))
+            for step in parallel_group:
+                completed.add(step.id)
+                # Decrease in-degree of dependents and add to ready if 0
+                for dep_id in dependents[step.id]:
+                    in_degree[dep_id] -= 1
+                    if in_degree[dep_id] == 0:
+                        dep_step = step_map[dep_id]
+                        if dep_step not in next_ready:
+                            next_ready.append(dep_step)
+
+        ready = next_ready
+
+    # Check for cycles or unreachable steps
+    if len(completed) != len(all_step_ids):
+        missing = all_step_ids - completed
+        raise ChainExecutionError(
+            f"Chain has cycles or unreachable steps. "
+            f"Steps not executed: {', '.join(sorted(missing))}"
+        )
+
+    return tuple(order)
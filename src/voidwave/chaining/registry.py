@@ -1,9 +1,10 @@
 """Chain registry for managing reusable chain definitions."""
 
 import copy
-from typing import Iterator
+from typing import Iterable, Iterator
 
 from voidwave.chaining.models import ChainDefinition, ChainStep
+from voidwave.chaining.plan import ChainExecutionError, execution_plan
 from voidwave.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -23,6 +24,7 @@ class ChainRegistry:
             chain: Chain definition to register
         """
         self._chains[chain.id] = chain
+        _prepare_plan(chain)
 
         # Index by tags
         for tag in chain.tags:
@@ -32,6 +34,26 @@ class ChainRegistry:
 
         logger.debug(f"Registered chain: {chain.id} ({chain.name})")
 
+    def register_many(self, chains: Iterable[ChainDefinition]) -> None:
+        """Register several chain definitions at once.
+
+        Same semantics as calling register() for each chain, with a single
+        log record for the batch.
+
+        Args:
+            chains: Chain definitions to register
+        """
+        batch = {chain.id: chain for chain in chains}
+        self._chains.update(batch)
+
+        # Plan execution order and index by tags
+        for chain_id, chain in batch.items():
+            _prepare_plan(chain)
+            for tag in chain.tags:
+                self._tags.setdefault(tag, set()).add(chain_id)
+
+        logger.debug(f"Registered {len(batch)} chains: {', '.join(batch)}")
+
     def unregister(self, chain_id: str) -> bool:
         """Unregister a chain by ID.
 
@@ -131,7 +153,7 @@ class ChainRegistry:
 
             for step in chain.steps:
                 # Deep copy to avoid modifying original
-                new_step = copy.deepcopy(step)
+                new_step = _copy_step(step)
 
                 # Prefix step ID to avoid collision
                 new_step.id = f"{chain_id}.{step.id}"
@@ -170,7 +192,7 @@ class ChainRegistry:
             id=composed_id,
             name=f"Composed: {', '.join(chain_ids)}",
             description=f"Composed chain from: {', '.join(chain_ids)}",
-            steps=steps,
+            steps=tuple(steps),
             tags=list(all_tags) + ["composed"],
         )
 
@@ -198,14 +220,14 @@ class ChainRegistry:
             raise KeyError(f"Chain not found: {base_chain_id}")
 
         # Deep copy base steps
-        steps = [copy.deepcopy(s) for s in base.steps]
+        steps = [_copy_step(s) for s in base.steps]
 
         # Get last step IDs for dependency
         last_step_ids = [s.id for s in base.steps]
 
         # Add new steps with dependency on last steps
         for step in additional_steps:
-            new_step = copy.deepcopy(step)
+            new_step = _copy_step(step)
             if not new_step.depends_on:
                 new_step.depends_on = last_step_ids.copy()
             steps.append(new_step)
@@ -216,7 +238,7 @@ class ChainRegistry:
             id=extended_id,
             name=f"{base.name} (Extended)",
             description=f"Extended version of {base.name}",
-            steps=steps,
+            steps=tuple(steps),
             tags=base.tags + ["extended"],
             target_type=base.target_type,
             preflight_action=base.preflight_action,
@@ -235,5 +257,19 @@ class ChainRegistry:
         return iter(self._chains.values())
 
 
+def _prepare_plan(chain: ChainDefinition) -> None:
+    """Build a chain's execution plan up front so runs reuse it."""
+    try:
+        execution_plan(chain)
+    except ChainExecutionError:
+        pass  # Reported when the chain is executed
+
+
+def _copy_step(step: ChainStep) -> ChainStep:
+    """Deep copy a step, sharing its options if they are a read-only mapping."""
+    memo = {} if isinstance(step.options, dict) else {id(step.options): step.options}
+    return copy.deepcopy(step, memo)
+
+
 # Singleton registry
 chain_registry = ChainRegistry()
@@ -1,5 +1,6 @@
 """Built-in data transformers for tool chaining."""
 
+from functools import partial
 from typing import Any, Callable
 
 
@@ -234,7 +235,7 @@ def to_port_list(ports: list[int]) -> str:
     Returns:
         Comma-separated port string
     """
-    return ",".join(str(p) for p in sorted(set(ports)))
+    return ",".join(map(str, sorted(set(ports))))
 
 
 # Additional transforms for chain bindings
@@ -270,7 +271,7 @@ def first_network_channel(networks: list[dict[str, Any]]) -> int | None:
 def ports_to_comma_list(hosts: list[dict[str, Any]]) -> str:
     """Extract open ports from hosts and return comma-separated string."""
     ports = extract_ports(hosts)
-    return ",".join(str(p) for p in ports) if ports else "1-1000"
+    return ",".join(map(str, ports)) if ports else "1-1000"
 
 
 def hosts_to_comma_ips(hosts: list[dict[str, Any]]) -> str | None:
@@ -463,11 +464,11 @@ def detect_cms(whatweb_data: dict[str, Any]) -> str | None:
 TRANSFORMS: dict[str, Callable[..., Any]] = {
     "flatten_ips": flatten_ips,
     "filter_open": filter_open_ports,
-    "filter_up": lambda h: filter_by_state(h, "up"),
+    "filter_up": partial(filter_by_state, state="up"),
     "first": first,
     "last": last,
     "join": join,
-    "join_newline": lambda items: join(items, "\n"),
+    "join_newline": partial(join, separator="\n"),
     "unique": unique,
     "count": count,
     "to_cidr": to_cidr,
@@ -476,12 +477,12 @@ TRANSFORMS: dict[str, Callable[..., Any]] = {
     "hosts_to_ips": hosts_to_comma_ips,
     "ports_csv": ports_to_comma_list,
     # Service extractors (return list)
-    "ssh_hosts": lambda h: extract_services(h, "ssh"),
-    "http_hosts": lambda h: extract_services(h, "http"),
-    "https_hosts": lambda h: extract_services(h, "https"),
-    "ftp_hosts": lambda h: extract_services(h, "ftp"),
-    "smb_hosts": lambda h: extract_services(h, "smb"),
-    "rdp_hosts": lambda h: extract_services(h, "ms-wbt-server"),
+    "ssh_hosts": partial(extract_services, service="ssh"),
+    "http_hosts": partial(extract_services, service="http"),
+    "https_hosts": partial(extract_services, service="https"),
+    "ftp_hosts": partial(extract_services, service="ftp"),
+    "smb_hosts": partial(extract_services, service="smb"),
+    "rdp_hosts": partial(extract_services, service="ms-wbt-server"),
     # First service host (return single string)
     "first_ssh": first_ssh_host,
     "first_http": first_http_host,
@@ -493,9 +494,9 @@ TRANSFORMS: dict[str, Callable[..., Any]] = {
     "networks_bssids": networks_to_bssids,
     "first_bssid": first_network_bssid,
     "first_channel": first_network_channel,
-    "wpa_networks": lambda n: networks_by_encryption(n, "WPA"),
-    "wep_networks": lambda n: networks_by_encryption(n, "WEP"),
-    "open_networks": lambda n: networks_by_encryption(n, "OPN"),
+    "wpa_networks": partial(networks_by_encryption, encryption="WPA"),
+    "wep_networks": partial(networks_by_encryption, encryption="WEP"),
+    "open_networks": partial(networks_by_encryption, encryption="OPN"),
     # Credentials
     "creds_targets": credentials_to_targets,
     "creds_userpass": credentials_to_userpass,
@@ -510,9 +511,9 @@ TRANSFORMS: dict[str, Callable[..., Any]] = {
     "subdomains_targets": subdomains_to_targets,
     "first_subdomain": first_subdomain,
     # Vulnerability transforms
-    "critical_vulns": lambda d: extract_vulns_by_severity(d, "critical"),
-    "high_vulns": lambda d: extract_vulns_by_severity(d, "high"),
-    "medium_vulns": lambda d: extract_vulns_by_severity(d, "medium"),
+    "critical_vulns": partial(extract_vulns_by_severity, min_severity="critical"),
+    "high_vulns": partial(extract_vulns_by_severity, min_severity="high"),
+    "medium_vulns": partial(extract_vulns_by_severity, min_severity="medium"),
     # Web discovery transforms
     "extract_directories": extract_directories,
     "extract_technologies": extract_technologies,
@@ -139,6 +139,7 @@ class PreflightRunner:
         Returns:
             Monitor interface name or None if failed
         """
+        from voidwave.automation.handlers.iface import is_monitor_mode
         from voidwave.automation.handlers.monitor import AutoMonHandler
         from voidwave.tui.modals.preflight_modal import ConfirmModal
 
@@ -149,10 +150,11 @@ class PreflightRunner:
                 return None
 
         # Check if already in monitor mode
-        handler = AutoMonHandler(interface)
-        if await handler._is_monitor_mode(interface):
+        if is_monitor_mode(interface):
             return interface
 
+        handler = AutoMonHandler(interface)
+
         # Ask user to confirm
         confirm = await self.app.push_screen_wait(
             ConfirmModal(
@@ -170,6 +172,7 @@ class PreflightRunner:
 
         success = await handler.fix()
         if success:
+            self.checker.invalidate_cache()
             self.app.notify(
                 f"Monitor mode enabled: {handler.monitor_interface}",
                 severity="information"
@@ -284,6 +287,7 @@ class PreflightRunner:
         success = await handler.fix()
 
         if success:
+            self.checker.invalidate_cache()
             self.app.notify(f"{tool_name} installed successfully", severity="information")
         else:
             self.app.notify(f"Failed to install {tool_name}", severity="error")
@@ -368,6 +372,7 @@ class PreflightRunner:
         success = await handler.fix()
 
         if success and handler.dest_path:
+            self.checker.invalidate_cache()
             self.app.notify("Wordlist downloaded", severity="information")
             return str(handler.dest_path)
 
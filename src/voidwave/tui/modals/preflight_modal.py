@@ -157,6 +157,8 @@ class PreflightModal(ModalScreen[bool]):
 
         if fixed_count > 0:
             self.app.notify(f"Fixed {fixed_count} requirement(s)", severity="information")
+            # Cached check() results describe the environment before the fixes
+            self.checker.invalidate_cache()
 
         # Re-check and update UI
         new_result = await self.checker.check(self.result.action)
@@ -121,5 +121,9 @@ def mock_which():
             return f"/usr/bin/{cmd}"
         return None
 
+    from voidwave.automation.fallbacks import FallbackManager
+
+    FallbackManager.invalidate_cache()
     with patch("shutil.which", side_effect=_which) as mock:
         yield mock
+    FallbackManager.invalidate_cache()
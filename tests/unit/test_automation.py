@@ -84,6 +84,47 @@ class TestAutoCleanupHandler:
 
         assert order == ["high", "medium", "low"]
 
+    def test_pending_actions_in_execution_order(self):
+        """Pending actions should be listed by priority, FIFO within ties."""
+        from voidwave.automation.handlers.cleanup import AutoCleanupHandler
+
+        AutoCleanupHandler.clear_cleanup_stack()
+
+        AutoCleanupHandler.register_cleanup("low", lambda: None, priority=1)
+        AutoCleanupHandler.register_cleanup("first", lambda: None, priority=5)
+        AutoCleanupHandler.register_cleanup("second", lambda: None, priority=5)
+        AutoCleanupHandler.register_cleanup("high", lambda: None, priority=10)
+
+        assert AutoCleanupHandler.get_pending_actions() == [
+            "high",
+            "first",
+            "second",
+            "low",
+        ]
+
+        AutoCleanupHandler.clear_cleanup_stack()
+
+    @pytest.mark.asyncio
+    async def test_cleanup_failure_does_not_skip_siblings(self):
+        """A failing action should not prevent same-priority actions."""
+        from voidwave.automation.handlers.cleanup import AutoCleanupHandler
+
+        AutoCleanupHandler.clear_cleanup_stack()
+
+        executed = []
+
+        def boom():
+            raise RuntimeError("boom")
+
+        async def restore():
+            executed.append("restore")
+
+        AutoCleanupHandler.register_cleanup("boom", boom, priority=5)
+        AutoCleanupHandler.register_cleanup("restore", restore, priority=5)
+
+        assert not await AutoCleanupHandler.cleanup_all()
+        assert executed == ["restore"]
+
 
 class TestAutoSetupHandler:
     """Test AUTO-SETUP handler."""
@@ -117,6 +158,44 @@ class TestAutoSetupHandler:
         assert isinstance(prompt, str)
         assert len(prompt) > 0
 
+    @pytest.mark.asyncio
+    async def test_setup_certs_signs_server_cert(self, temp_dir, monkeypatch):
+        """Certificates should be generated in-process, signed by the CA."""
+        from cryptography import x509
+
+        from voidwave.automation.handlers import setup
+
+        monkeypatch.setattr(setup, "VOIDWAVE_CERTS_DIR", temp_dir)
+
+        assert await setup.AutoSetupHandler(setup_type="certs").fix()
+
+        ca = x509.load_pem_x509_certificate((temp_dir / "ca.crt").read_bytes())
+        server = x509.load_pem_x509_certificate((temp_dir / "server.crt").read_bytes())
+        server.verify_directly_issued_by(ca)
+        assert (temp_dir / "server.key").stat().st_mode & 0o077 == 0
+
+    def test_private_file_restricted_before_write(self, temp_dir, monkeypatch):
+        """An existing world-readable key file is locked down before rewriting."""
+        import os
+
+        from voidwave.automation.handlers import setup
+
+        key = temp_dir / "server.key"
+        key.write_bytes(b"old")
+        key.chmod(0o644)
+        modes = []
+        real_write = os.write
+
+        def recording_write(fd, data):
+            modes.append(os.fstat(fd).st_mode & 0o777)
+            return real_write(fd, data)
+
+        monkeypatch.setattr(setup.os, "write", recording_write)
+        setup._write_private(key, b"secret")
+
+        assert modes == [0o600]
+        assert key.read_bytes() == b"secret"
+
 
 class TestAutoDataHandler:
     """Test AUTO-DATA handler."""
@@ -141,6 +220,30 @@ class TestAutoDataHandler:
 
         assert await handler.can_fix()
 
+    @pytest.mark.asyncio
+    async def test_download_http_streams_to_dest(self, temp_dir):
+        """An in-process download lands at dest without a leftover .part file."""
+        web = pytest.importorskip("aiohttp.web")
+        from voidwave.automation.handlers.data import _download_http
+
+        async def serve(request):
+            return web.Response(body=b"a\nb\n")
+
+        app = web.Application()
+        app.router.add_get("/list.txt", serve)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        await web.TCPSite(runner, "127.0.0.1", 0).start()
+        port = runner.addresses[0][1]
+        dest = temp_dir / "list.txt"
+        try:
+            assert await _download_http(f"http://127.0.0.1:{port}/list.txt", dest)
+        finally:
+            await runner.cleanup()
+
+        assert dest.read_bytes() == b"a\nb\n"
+        assert list(temp_dir.iterdir()) == [dest]
+
     @pytest.mark.asyncio
     async def test_get_ui_prompt_known_source(self):
         """Should return detailed prompt for known sources."""
@@ -153,6 +256,173 @@ class TestAutoDataHandler:
         assert "14M" in prompt
 
 
+class TestRequirement:
+    """Test requirement status evaluation."""
+
+    def test_check_status_reports_fixability(self):
+        """An unmet requirement is fixable only when it has a fix."""
+        from voidwave.automation.engine import (
+            Requirement,
+            RequirementStatus,
+            RequirementType,
+        )
+
+        def make_req(check, fix=None):
+            return Requirement(
+                type=RequirementType.TOOL,
+                name="demo",
+                description="Demo tool",
+                check=check,
+                fix=fix,
+            )
+
+        assert make_req(lambda: True).check_status() == RequirementStatus.MET
+        assert (
+            make_req(lambda: False, fix=lambda: True).check_status()
+            == RequirementStatus.FIXABLE
+        )
+        assert make_req(lambda: 1 / 0).check_status() == RequirementStatus.MANUAL
+
+    def test_tool_checks_share_path_lookups(self, monkeypatch):
+        """Tool checks hit PATH once per tool until the session is cleared."""
+        import shutil
+
+        from voidwave.automation import requirements
+
+        lookups = []
+
+        def fake_which(name):
+            lookups.append(name)
+            return None
+
+        requirements.invalidate_tool_cache()
+        monkeypatch.setattr(shutil, "which", fake_which)
+
+        for _ in range(3):
+            assert not requirements.tool_req("voidwave-demo-tool").check()
+        assert lookups == ["voidwave-demo-tool"]
+
+        requirements.clear_session_checks()
+        requirements.tool_req("voidwave-demo-tool").check()
+        assert lookups == ["voidwave-demo-tool"] * 2
+        requirements.invalidate_tool_cache()
+
+    def test_tool_requirements_are_shared(self):
+        """Identical tool requirements resolve to one shared instance."""
+        from voidwave.automation.requirements import ATTACK_REQUIREMENTS, tool_req
+
+        assert tool_req("reaver", "Reaver", ["bully"]) is tool_req(
+            "reaver", "Reaver", ["bully"]
+        )
+        assert tool_req("reaver") is not tool_req("reaver", "Reaver")
+
+        nmap_reqs = [
+            req
+            for reqs in ATTACK_REQUIREMENTS.values()
+            for req in reqs
+            if req.name == "nmap" and req.description == "Network scanner"
+        ]
+        assert len(nmap_reqs) > 1
+        assert all(req is nmap_reqs[0] for req in nmap_reqs)
+
+    def test_attack_requirements_are_read_only(self):
+        """Action requirements are exposed as an immutable mapping of tuples."""
+        from voidwave.automation.requirements import (
+            ATTACK_REQUIREMENTS,
+            get_requirements,
+        )
+
+        with pytest.raises(TypeError):
+            ATTACK_REQUIREMENTS["demo"] = ()
+        assert isinstance(get_requirements("wps_pixie"), tuple)
+        assert get_requirements("no_such_action") == ()
+
+    def test_session_checks_follow_session_flags(self, monkeypatch):
+        """Session-backed checks read the current flag value on each call."""
+        from voidwave.automation import requirements
+
+        monkeypatch.delitem(requirements._session_checks, "interface", raising=False)
+        assert requirements.INTERFACE_REQ.check() is False
+
+        monkeypatch.setitem(requirements._session_checks, "interface", True)
+        assert requirements.INTERFACE_REQ.check() is True
+
+    def test_shodan_key_check_reads_environment(self, monkeypatch):
+        """The Shodan requirement follows SHODAN_API_KEY."""
+        from voidwave.automation.requirements import get_requirements
+
+        (key_req,) = (
+            req
+            for req in get_requirements("osint_shodan")
+            if req.name == "shodan_api_key"
+        )
+        monkeypatch.delenv("SHODAN_API_KEY", raising=False)
+        assert not key_req.check()
+
+        monkeypatch.setenv("SHODAN_API_KEY", "abc123")
+        assert key_req.check()
+
+    def test_root_check_reads_euid_once(self, monkeypatch):
+        """The root requirement asks for the effective UID only once."""
+        import os
+
+        from voidwave.automation import requirements
+
+        calls = []
+
+        def fake_geteuid():
+            calls.append(1)
+            return 0
+
+        monkeypatch.setattr(os, "geteuid", fake_geteuid)
+        requirements._check_root.cache_clear()
+        try:
+            assert requirements.ROOT_REQ.check()
+            assert requirements.ROOT_REQ.check()
+            assert len(calls) == 1
+        finally:
+            requirements._check_root.cache_clear()
+
+    def test_wordlist_check_cached_until_invalidated(self, monkeypatch):
+        """The wordlist probe runs once until the tool cache is invalidated."""
+        import os
+
+        from voidwave.automation import requirements
+
+        probed = []
+
+        def fake_exists(path):
+            probed.append(path)
+            return path.endswith("/voidwave/wordlists/rockyou.txt")
+
+        requirements.invalidate_tool_cache()
+        monkeypatch.setattr(os.path, "exists", fake_exists)
+
+        assert requirements.WORDLIST_REQ.check()
+        assert requirements.WORDLIST_REQ.check()
+        probes = len(probed)
+
+        requirements.invalidate_tool_cache()
+        assert requirements.WORDLIST_REQ.check()
+        assert len(probed) == 2 * probes
+        requirements.invalidate_tool_cache()
+
+    def test_missing_wordlist_not_cached(self, monkeypatch):
+        """A wordlist that appears after a failed check is found without reset."""
+        import os
+
+        from voidwave.automation import requirements
+
+        present = False
+        requirements.invalidate_tool_cache()
+        monkeypatch.setattr(os.path, "exists", lambda path: present)
+
+        assert not requirements.WORDLIST_REQ.check()
+        present = True
+        assert requirements.WORDLIST_REQ.check()
+        requirements.invalidate_tool_cache()
+
+
 class TestPreflightChecker:
     """Test preflight requirement checking."""
 
@@ -168,3 +438,779 @@ class TestPreflightChecker:
         assert hasattr(result, "all_met")
         assert hasattr(result, "missing")
         assert hasattr(result, "fixable")
+
+    @pytest.mark.asyncio
+    async def test_check_is_cached_per_session_state(self, monkeypatch):
+        """Repeated checks reuse results until session state changes."""
+        from voidwave.automation.engine import RequirementStatus
+        from voidwave.automation import requirements
+        from voidwave.automation.preflight import PreflightChecker
+
+        calls = []
+
+        async def fake_check_requirement(self, req):
+            calls.append(req.name)
+            return RequirementStatus.MET
+
+        monkeypatch.setattr(
+            PreflightChecker, "_check_requirement", fake_check_requirement
+        )
+        PreflightChecker.invalidate_cache()
+        checker = PreflightChecker()
+
+        first = await checker.check("wps_pixie")
+        first.fixable.append("mutated")
+        second = await checker.check("wps_pixie")
+        assert second.fixable == []
+        assert len(calls) == len(first.requirements) > 0
+
+        monkeypatch.setitem(requirements._session_checks, "target", "changed")
+        await checker.check("wps_pixie")
+        assert len(calls) == 2 * len(first.requirements)
+
+        PreflightChecker.invalidate_cache()
+
+    @pytest.mark.asyncio
+    async def test_only_blocking_checks_use_threads(self):
+        """Cheap in-process checks should run inline, blocking ones in a thread."""
+        import threading
+
+        from voidwave.automation.engine import Requirement, RequirementType
+        from voidwave.automation.preflight import PreflightChecker
+
+        threads = {}
+
+        def make_req(name, blocking):
+            def check():
+                threads[name] = threading.current_thread()
+                return True
+
+            return Requirement(
+                type=RequirementType.INPUT,
+                name=name,
+                description=name,
+                check=check,
+                blocking=blocking,
+            )
+
+        checker = PreflightChecker()
+        await checker._check_requirement(make_req("flag", False))
+        await checker._check_requirement(make_req("probe", True))
+
+        assert threads["flag"] is threading.current_thread()
+        assert threads["probe"] is not threading.current_thread()
+
+    @pytest.mark.asyncio
+    async def test_with_preflight_posts_message_and_reuses_checker(
+        self, monkeypatch
+    ):
+        """Unmet requirements should post PreflightRequired to the app."""
+        from textual.message import Message
+
+        from voidwave.automation import preflight
+        from voidwave.automation.engine import RequirementStatus
+
+        async def unmet(self, req):
+            return RequirementStatus.MANUAL
+
+        monkeypatch.setattr(preflight.PreflightChecker, "_check_requirement", unmet)
+        preflight.PreflightChecker.invalidate_cache()
+
+        class App:
+            def __init__(self):
+                self.posted = []
+
+            def post_message(self, message):
+                self.posted.append(message)
+
+        class Screen:
+            session = None
+            app = App()
+
+            @preflight.with_preflight("wps_pixie")
+            async def action_attack(self):
+                return "ran"
+
+        screen = Screen()
+        assert await screen.action_attack() is None
+        checker = preflight._CHECKERS[screen]
+        assert await screen.action_attack() is None
+
+        assert preflight._CHECKERS[screen] is checker
+        assert len(screen.app.posted) == 2
+        message = screen.app.posted[0]
+        assert isinstance(message, Message)
+        assert isinstance(message, preflight.PreflightRequired)
+        assert message.result.action == "wps_pixie"
+
+        preflight.PreflightChecker.invalidate_cache()
+
+    @pytest.mark.asyncio
+    async def test_result_cache_is_bounded(self, monkeypatch):
+        """Cached check() results are capped, dropping the oldest first."""
+        from voidwave.automation.preflight import PreflightChecker
+
+        monkeypatch.setattr(PreflightChecker, "CACHE_SIZE", 2)
+        PreflightChecker.invalidate_cache()
+        checker = PreflightChecker()
+        try:
+            for action in ("first", "second", "first", "third"):
+                await checker.check(action)
+
+            assert [key[0] for key in PreflightChecker._result_cache] == [
+                "first",
+                "third",
+            ]
+        finally:
+            PreflightChecker.invalidate_cache()
+
+    def test_check_sync_outside_event_loop(self):
+        """check_sync() should work without a running or current loop."""
+        import warnings
+
+        from voidwave.automation.preflight import PreflightChecker
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", DeprecationWarning)
+            result = PreflightChecker().check_sync("unknown_action")
+
+        assert result.action == "unknown_action"
+        assert result.all_met
+
+    @pytest.mark.asyncio
+    async def test_modal_fix_drops_cached_results(self, monkeypatch):
+        """Fixes applied from the preflight modal invalidate cached checks."""
+        from types import SimpleNamespace
+
+        from voidwave.automation.preflight import PreflightChecker
+        from voidwave.tui.modals.preflight_modal import PreflightModal
+
+        checker = PreflightChecker()
+        stale = await checker.check("creds_john")
+        stale.fixable[:] = [SimpleNamespace(name="wordlist")]
+        seen_cache = []
+
+        async def recheck(action):
+            seen_cache.append(dict(PreflightChecker._result_cache))
+            return await PreflightChecker._check(checker, action)
+
+        async def fixed(req):
+            return True
+
+        async def nothing():
+            return None
+
+        modal = SimpleNamespace(
+            result=stale,
+            checker=SimpleNamespace(
+                check=recheck, invalidate_cache=checker.invalidate_cache
+            ),
+            app=SimpleNamespace(notify=lambda *a, **k: None),
+            _try_fix=fixed,
+            dismiss=lambda value: None,
+            recompose=nothing,
+        )
+        await PreflightModal._fix_all(modal)
+
+        assert seen_cache == [{}]
+
+
+class TestFallbackManager:
+    """Test tool fallback resolution."""
+
+    def test_available_tool_resolved_lazily(self, temp_dir, monkeypatch):
+        """Only the requested chain is resolved, cached until refreshed."""
+        from voidwave.automation import fallbacks
+        from voidwave.automation.fallbacks import FallbackManager
+
+        def make_tool(name):
+            path = temp_dir / name
+            path.write_text("#!/bin/sh\n")
+            path.chmod(0o755)
+
+        make_tool("rustscan")
+        monkeypatch.setenv("PATH", str(temp_dir))
+        fallbacks.which.cache_clear()
+        lookups = []
+        real_which = fallbacks.shutil.which
+
+        def recording_which(name):
+            lookups.append(name)
+            return real_which(name)
+
+        monkeypatch.setattr(fallbacks.shutil, "which", recording_which)
+
+        try:
+            manager = FallbackManager()
+            assert lookups == []
+            info = manager.get_fallback_info("nmap")
+            assert info["using"] == "rustscan"
+            assert info["is_fallback"]
+            assert not info["primary_available"]
+            assert lookups == ["nmap", "rustscan"]
+
+            make_tool("nmap")
+            assert manager.get_available_tool("nmap") == "rustscan"
+
+            FallbackManager.invalidate_cache()
+            assert manager.get_available_tool("nmap") == "nmap"
+        finally:
+            fallbacks.which.cache_clear()
+
+    def test_which_many_uses_shared_cache(self, temp_dir, monkeypatch):
+        """which_many maps each name to its path or None via the which cache."""
+        from voidwave.automation.fallbacks import which, which_many
+
+        tool = temp_dir / "ffuf"
+        tool.write_text("#!/bin/sh\n")
+        tool.chmod(0o755)
+        (temp_dir / "dirsearch").write_text("not executable\n")
+        monkeypatch.setenv("PATH", str(temp_dir))
+        which.cache_clear()
+
+        try:
+            assert which_many(["ffuf", "dirsearch"]) == {
+                "ffuf": str(tool),
+                "dirsearch": None,
+            }
+            tool.unlink()
+            assert which_many(["ffuf"]) == {"ffuf": str(tool)}
+        finally:
+            which.cache_clear()
+
+    def test_tool_requirements_are_immutable(self):
+        """The tool requirements registry and its entries are read-only."""
+        import dataclasses
+
+        from voidwave.automation.tool_requirements import (
+            TOOL_REQUIREMENTS,
+            get_tool_requirements,
+        )
+
+        nmap = get_tool_requirements("nmap")
+        assert nmap.fallbacks == ("rustscan", "masscan")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            nmap.needs_root = False
+        with pytest.raises(TypeError):
+            TOOL_REQUIREMENTS["nmap"] = nmap
+
+    def test_tool_fallback_uses_shared_lookup_cache(self, temp_dir, monkeypatch):
+        """Tool fallback resolution reuses cached PATH lookups until cleared."""
+        from voidwave.automation.fallbacks import which
+        from voidwave.automation.tool_requirements import get_fallback_tool
+
+        tool = temp_dir / "masscan"
+        tool.write_text("#!/bin/sh\n")
+        tool.chmod(0o755)
+        monkeypatch.setenv("PATH", str(temp_dir))
+        which.cache_clear()
+
+        assert get_fallback_tool("nmap") == "masscan"
+        misses = which.cache_info().misses
+        assert get_fallback_tool("nmap") == "masscan"
+        assert which.cache_info().misses == misses
+
+        tool.unlink()
+        which.cache_clear()
+        assert get_fallback_tool("nmap") is None
+        which.cache_clear()
+
+
+class TestAutoLabelRegistry:
+    """Test AUTO-* label registry."""
+
+    def test_lazy_label_resolves_on_get(self):
+        """Lazily registered labels should import their handler on lookup."""
+        from voidwave.automation.labels import AutoLabelRegistry
+
+        registry = AutoLabelRegistry()
+        registry.register_lazy(
+            "AUTO-GUIDE", "voidwave.automation.handlers.guide:AutoGuideHandler"
+        )
+        assert registry.list_labels() == ["AUTO-GUIDE"]
+
+        from voidwave.automation.handlers.guide import AutoGuideHandler
+
+        assert registry.get("AUTO-GUIDE") is AutoGuideHandler
+        assert registry.list_labels() == ["AUTO-GUIDE"]
+
+    def test_list_labels_unique_after_direct_import(self):
+        """Importing a handler module directly must not duplicate its label."""
+        from voidwave.automation.handlers.guide import AutoGuideHandler  # noqa: F401
+        from voidwave.automation.labels import AUTO_REGISTRY
+
+        labels = AUTO_REGISTRY.list_labels()
+
+        assert "AUTO-GUIDE" in labels
+        assert len(labels) == len(set(labels))
+
+
+class TestAutoKeysHandler:
+    """Test AUTO-KEYS handler."""
+
+    def test_save_key_tightens_existing_dir(self, monkeypatch, temp_dir):
+        """An existing keys directory is made owner-only before a key lands."""
+        from voidwave.automation.handlers import keys
+
+        keys_dir = temp_dir / "keys"
+        keys_dir.mkdir(mode=0o755)
+        monkeypatch.setattr(keys, "_KEYS_DIR", keys_dir)
+
+        assert keys.AutoKeysHandler("shodan").save_key("secret")
+        assert keys_dir.stat().st_mode & 0o777 == 0o700
+        assert (keys_dir / "shodan.key").stat().st_mode & 0o777 == 0o600
+
+
+class TestAutoMonHandler:
+    """Test AUTO-MON handler."""
+
+    @pytest.mark.asyncio
+    async def test_failed_check_kill_is_retried(self, monkeypatch):
+        """A failed ``airmon-ng check kill`` is not remembered as done."""
+        from voidwave.automation.handlers import monitor
+
+        runs = []
+
+        async def fake_run(*argv):
+            runs.append(argv)
+            return 1 if argv[1] == "check" else 0
+
+        monkeypatch.setattr(monitor, "_run", fake_run)
+        monkeypatch.setattr(monitor, "_open_net_monitor", lambda: None)
+        monkeypatch.setattr(monitor, "is_monitor_mode", lambda name: True)
+        monkeypatch.setattr(monitor.AutoMonHandler, "_check_kill_done", False)
+
+        handler = monitor.AutoMonHandler("wlan0")
+        assert await handler._enable_with_airmon()
+        assert await handler._enable_with_airmon()
+
+        assert runs.count(("airmon-ng", "check", "kill")) == 2
+        assert not monitor.AutoMonHandler._check_kill_done
+
+
+class TestAutoPrivHandler:
+    """Test AUTO-PRIV handler."""
+
+    @pytest.mark.asyncio
+    async def test_run_privileged_reuses_helper(self, monkeypatch):
+        """Commands should share one helper shell and keep their own output."""
+        from voidwave.automation.handlers.privilege import AutoPrivHandler
+
+        monkeypatch.setattr(
+            AutoPrivHandler, "_escalation_prefix", staticmethod(lambda: ["env"])
+        )
+        monkeypatch.setattr("sys.stdin.isatty", lambda: False, raising=False)
+
+        try:
+            first = await AutoPrivHandler.run_privileged(
+                ["sh", "-c", "echo out; printf err >&2; exit 3"]
+            )
+            helper = AutoPrivHandler._helper
+            second = await AutoPrivHandler.run_privileged("printf 'a b'")
+
+            assert first == (3, "out\n", "err")
+            assert second == (0, "a b", "")
+            assert AutoPrivHandler._helper is helper
+        finally:
+            await AutoPrivHandler.close_helper()
+
+    def test_run_privileged_across_event_loops(self, monkeypatch):
+        """A helper left by an earlier asyncio.run() is replaced, not reused."""
+        import asyncio
+
+        from voidwave.automation.handlers.privilege import AutoPrivHandler
+
+        monkeypatch.setattr(
+            AutoPrivHandler, "_escalation_prefix", staticmethod(lambda: ["env"])
+        )
+        monkeypatch.setattr("sys.stdin.isatty", lambda: False, raising=False)
+
+        try:
+            first = asyncio.run(AutoPrivHandler.run_privileged("echo one"))
+            stale = AutoPrivHandler._helper
+            second = asyncio.run(AutoPrivHandler.run_privileged("echo two"))
+
+            assert first == (0, "one\n", "")
+            assert second == (0, "two\n", "")
+            assert AutoPrivHandler._helper is not stale
+        finally:
+            AutoPrivHandler._discard_helper()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_command_discards_helper(self, monkeypatch):
+        """A cancelled command must not leave its output for the next caller."""
+        import asyncio
+
+        from voidwave.automation.handlers.privilege import AutoPrivHandler
+
+        monkeypatch.setattr(
+            AutoPrivHandler, "_escalation_prefix", staticmethod(lambda: ["env"])
+        )
+        monkeypatch.setattr("sys.stdin.isatty", lambda: False, raising=False)
+
+        try:
+            with pytest.raises(TimeoutError):
+                await asyncio.wait_for(
+                    AutoPrivHandler.run_privileged(
+                        ["sh", "-c", "sleep 0.5; echo slow"]
+                    ),
+                    0.1,
+                )
+            assert AutoPrivHandler._helper is None
+
+            assert await AutoPrivHandler.run_privileged("echo fast") == (
+                0,
+                "fast\n",
+                "",
+            )
+        finally:
+            await AutoPrivHandler.close_helper()
+
+    @pytest.mark.asyncio
+    async def test_helper_handshake_times_out(self, monkeypatch):
+        """A helper that never answers the handshake is abandoned."""
+        from voidwave.automation.handlers import privilege
+        from voidwave.automation.handlers.privilege import AutoPrivHandler
+
+        monkeypatch.setattr(privilege, "_HELPER_START_TIMEOUT", 0.1)
+
+        assert not await AutoPrivHandler._ensure_helper(["sh", "-c", "sleep 5", "sh"])
+        assert AutoPrivHandler._helper is None
+
+
+class TestAutoInstallHandler:
+    """Test AUTO-INSTALL handler."""
+
+    def test_package_manager_probes_stop_at_first_hit(self, monkeypatch):
+        """Package managers are probed in preference order until one is found."""
+        from voidwave.automation.handlers import install
+
+        probed = []
+        second = list(install._INSTALL_ARGV)[1]
+
+        def fake_which(name):
+            probed.append(name)
+            return f"/usr/bin/{name}" if name == second else None
+
+        monkeypatch.setattr(install, "which", fake_which)
+        install._get_package_manager.cache_clear()
+        try:
+            assert install._get_package_manager() == second
+            assert probed == list(install._INSTALL_ARGV)[:2]
+        finally:
+            install._get_package_manager.cache_clear()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_installs_share_one_run(self, monkeypatch):
+        """Concurrent fixes for one package should run the installer once."""
+        import asyncio
+
+        from voidwave.automation.handlers import install
+
+        runs = []
+
+        async def fake_install(cmd):
+            runs.append(cmd)
+            await asyncio.sleep(0)
+
+        async def nothing_installed(package_manager):
+            return frozenset()
+
+        monkeypatch.setattr(install, "_run_install", fake_install)
+        monkeypatch.setattr(install, "_installed_packages", nothing_installed)
+        monkeypatch.setattr(install, "which", lambda name: None)
+
+        handlers = [
+            install.AutoInstallHandler(tool) for tool in ("airodump-ng", "aireplay-ng")
+        ]
+        for handler in handlers:
+            handler.distro, handler.package_manager = "debian", "apt"
+
+        await asyncio.gather(*(handler.fix() for handler in handlers))
+
+        assert runs == [["sudo", "apt-get", "install", "-y", "aircrack-ng"]]
+        assert install._in_progress == {}
+
+    @pytest.mark.asyncio
+    async def test_installed_tool_resolves_after_install(self, monkeypatch, temp_dir):
+        """A tool looked up as missing is found once its install finishes."""
+        from voidwave.automation.fallbacks import which
+        from voidwave.automation.handlers import install
+
+        async def fake_install(cmd):
+            tool = temp_dir / "hashcat"
+            tool.write_text("#!/bin/sh\n")
+            tool.chmod(0o755)
+
+        async def nothing_installed(package_manager):
+            return frozenset()
+
+        monkeypatch.setattr(install, "_run_install", fake_install)
+        monkeypatch.setattr(install, "_installed_packages", nothing_installed)
+        monkeypatch.setenv("PATH", str(temp_dir))
+        which.cache_clear()
+
+        handler = install.AutoInstallHandler("hashcat")
+        handler.distro, handler.package_manager = "debian", "apt"
+        try:
+            assert which("hashcat") is None
+            assert await handler.fix()
+        finally:
+            which.cache_clear()
+
+    @pytest.mark.asyncio
+    async def test_installed_package_skips_install(self, monkeypatch):
+        """A package that is already installed should not be reinstalled."""
+        from voidwave.automation.handlers import install
+
+        async def fail_install(cmd):
+            raise AssertionError("install should not run")
+
+        async def installed(package_manager):
+            return frozenset({"aircrack-ng"})
+
+        monkeypatch.setattr(install, "_run_install", fail_install)
+        monkeypatch.setattr(install, "_installed_packages", installed)
+        monkeypatch.setattr(install, "which", lambda name: None)
+
+        handler = install.AutoInstallHandler("airodump-ng")
+        handler.distro, handler.package_manager = "debian", "apt"
+
+        assert await handler.fix() is False
+
+
+class TestAutoValidateHandler:
+    """Test AUTO-VALIDATE handler."""
+
+    @pytest.mark.parametrize(
+        ("input_type", "value", "valid"),
+        [
+            ("mac", "aa:bb:cc:dd:ee:ff", True),
+            ("mac", "aa:bb:cc:dd:ee", False),
+            ("url", "HTTPS://example.com/path", True),
+            ("url", "ftp://example.com", False),
+            ("domain", "sub.example.com", True),
+            ("domain", "-bad.example", False),
+            ("domain", "a2.b-c.co.uk", True),
+            ("domain", "a." * 10000, False),
+            ("url", "http:///path", False),
+            ("port_range", "1-1000", True),
+            ("port_range", "22, 80,443", True),
+            ("port_range", "22,80,8000-9000", True),
+            ("port_range", "1000-1", False),
+            ("port_range", "22,,80", False),
+            ("port_range", "22,70000", False),
+            ("cidr", "10.0.0.0/8", True),
+            ("cidr", "0.0.0.0/0", False),
+            ("cidr", "::/0", False),
+        ],
+    )
+    def test_pattern_validators(self, input_type, value, valid):
+        """Pattern-based validators should accept and reject as expected."""
+        from voidwave.automation.handlers.validate import AutoValidateHandler
+
+        assert AutoValidateHandler.validate_input(input_type, value)[0] is valid
+
+    def test_broad_cidr_warns(self):
+        """Scopes above 65536 addresses are allowed with a warning."""
+        from voidwave.automation.handlers.validate import AutoValidateHandler
+
+        assert AutoValidateHandler.validate_input("cidr", "10.0.0.0/16") == (True, None)
+        assert AutoValidateHandler.validate_input("cidr", "10.0.0.0/15")[1] == (
+            "Very broad scope: 131,072 addresses"
+        )
+
+    def test_unknown_hash_warns(self):
+        """Unrecognised hashes are allowed with a warning."""
+        from voidwave.automation.handlers.validate import AutoValidateHandler
+
+        assert AutoValidateHandler.validate_input("hash", "0" * 32) == (True, None)
+        assert AutoValidateHandler.validate_input("hash", "xyz") == (
+            True,
+            "Unknown hash format",
+        )
+        assert AutoValidateHandler.validate_input("hash", "g" * 32)[1] is not None
+
+
+class TestAutoUpdateHandler:
+    """Test AUTO-UPDATE handler."""
+
+    @pytest.mark.asyncio
+    async def test_update_all_stale_runs_bounded_concurrently(self, monkeypatch):
+        """Stale sources should update concurrently, up to the limit."""
+        import asyncio
+
+        from voidwave.automation.handlers import update
+
+        running = 0
+        peak = 0
+
+        async def fake_fix(self):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return self.source != "exploitdb"
+
+        async def fixable(self):
+            return self.source != "wpscan-db"
+
+        monkeypatch.setattr(update.AutoUpdateHandler, "needs_update", lambda self: True)
+        monkeypatch.setattr(update.AutoUpdateHandler, "can_fix", fixable)
+        monkeypatch.setattr(update.AutoUpdateHandler, "fix", fake_fix)
+        monkeypatch.setattr(update, "_MAX_CONCURRENT_UPDATES", 2)
+
+        results = await update.AutoUpdateHandler.update_all_stale()
+
+        assert results == {
+            "nuclei-templates": True,
+            "exploitdb": False,
+            "nmap-scripts": True,
+        }
+        assert peak == 2
+
+    def test_list_sources_reads_each_timestamp_once(self, monkeypatch):
+        """list_sources should look up each source's last update once."""
+        from voidwave.automation.handlers import update
+
+        calls = []
+
+        def fake_last_update(config):
+            calls.append(config["last_update_file"])
+            return None
+
+        monkeypatch.setattr(update, "_last_update_ts", fake_last_update)
+
+        sources = update.AutoUpdateHandler.list_sources()
+
+        assert len(calls) == len(update.UPDATE_SOURCES)
+        assert all(s["needs_update"] and s["age"] == "never updated" for s in sources)
+
+    def test_last_update_cached_until_mtime_changes(self, temp_dir):
+        """Timestamp files are reread only when their mtime changes."""
+        import os
+
+        from voidwave.automation.handlers import update
+
+        stamp = temp_dir / ".updated"
+        stamp.write_text("1000")
+        config = {"last_update_file": str(stamp)}
+        first = update._last_update(config)
+
+        mtime = stamp.stat().st_mtime_ns
+        stamp.write_text("2000")
+        os.utime(stamp, ns=(mtime, mtime))
+        assert update._last_update(config) == first
+
+        os.utime(stamp, ns=(mtime + 10**9, mtime + 10**9))
+        assert update._last_update(config).timestamp() == 2000
+
+    def test_list_sources_reads_clock_once(self, monkeypatch):
+        """Every source is aged against a single clock reading."""
+        from voidwave.automation.handlers import update
+
+        now = 10 * 86400.0
+        clock_reads = []
+
+        def fake_time():
+            clock_reads.append(now)
+            return now
+
+        monkeypatch.setattr(update.time, "time", fake_time)
+        monkeypatch.setattr(
+            update, "_last_update_ts", lambda config: now - 2 * 86400 - 7200
+        )
+
+        sources = {s["name"]: s for s in update.AutoUpdateHandler.list_sources()}
+
+        assert len(clock_reads) == 1
+        assert sources["wpscan-db"]["needs_update"]
+        assert not sources["nuclei-templates"]["needs_update"]
+        assert sources["exploitdb"]["age"] == "2 days old"
+
+
+class TestSubflowManager:
+    """Test subflow acquisition and result storage."""
+
+    @pytest.mark.asyncio
+    async def test_results_stored_on_session(self, temp_dir):
+        """Completed subflows store their result in the matching session attribute."""
+        from types import SimpleNamespace
+
+        from voidwave.automation.subflows import SubflowManager, SubflowType
+
+        session = SimpleNamespace(capture_file=None, target=None)
+        manager = SubflowManager(session)
+
+        ctx = await manager.acquire("pmkid", "wpa_pmkid")
+        assert ctx.subflow_type == SubflowType.CAPTURE_PMKID
+        capture = str(temp_dir / "capture.pcapng")
+        await manager.complete(capture)
+        assert session.capture_file == capture
+
+        ctx = await manager.acquire("something_else", "recon")
+        assert ctx.subflow_type == SubflowType.ENTER_TARGET
+        await manager.complete("10.0.0.1")
+        assert session.target == "10.0.0.1"
+
+        # No attribute on the session for this result: nothing is set
+        await manager.acquire("client", "wifi_deauth")
+        await manager.complete("aa:bb:cc:dd:ee:ff")
+        assert not hasattr(session, "selected_client")
+        assert not manager.has_active_subflow()
+
+    @pytest.mark.asyncio
+    async def test_nested_subflows_complete_innermost_first(self):
+        """Subflows form a stack and managers stay weak-referenceable."""
+        import weakref
+        from types import SimpleNamespace
+
+        from voidwave.automation.subflows import SubflowManager, SubflowType
+
+        manager = SubflowManager(SimpleNamespace())
+        assert weakref.ref(manager)() is manager
+
+        await manager.acquire("target", "wpa_handshake")
+        inner = await manager.acquire("client", "wpa_handshake")
+        assert manager.current_context() is inner
+
+        done = await manager.complete("aa:bb")
+        assert done.subflow_type == SubflowType.SCAN_CLIENTS
+        assert manager.current_context().subflow_type == SubflowType.SCAN_NETWORKS
+        await manager.complete(None)
+        assert manager.current_context() is None
+        assert await manager.complete("late") is None
+
+    @pytest.mark.parametrize(
+        ("input_type", "attr"),
+        [
+            ("target", "selected_target"),
+            ("client", "selected_client"),
+            ("handshake", "capture_file"),
+            ("pmkid", "capture_file"),
+            ("wordlist", "wordlist"),
+            ("target_ip", "target"),
+        ],
+    )
+    @pytest.mark.asyncio
+    async def test_result_attribute_per_subflow(self, input_type, attr):
+        """Each storable subflow writes to its own session attribute."""
+        from types import SimpleNamespace
+
+        from voidwave.automation.subflows import SubflowManager
+
+        names = (
+            "selected_target",
+            "selected_client",
+            "capture_file",
+            "wordlist",
+            "target",
+        )
+        session = SimpleNamespace(**dict.fromkeys(names))
+        manager = SubflowManager(session)
+
+        await manager.acquire(input_type, "demo")
+        await manager.complete("result")
+
+        assert {name for name in names if getattr(session, name)} == {attr}
@@ -0,0 +1,316 @@
+"""Tests for the tool chaining system."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+HOSTS = [
+    {
+        "ip": "10.0.0.1",
+        "ports": [
+            {"port": 22, "service": "ssh", "state": "open"},
+            {"port": 80, "service": "http", "state": "open"},
+            {"port": 445, "service": "microsoft-ds", "state": "closed"},
+        ],
+    },
+    {
+        "ip": "10.0.0.2",
+        "ports": [{"port": 22, "service": "ssh", "state": "open"}],
+    },
+]
+
+
+class TestTransforms:
+    """Test named data transforms."""
+
+    @pytest.mark.parametrize(
+        ("name", "data", "expected"),
+        [
+            ("ssh_hosts", HOSTS, ["10.0.0.1:22", "10.0.0.2:22"]),
+            ("http_hosts", HOSTS, ["10.0.0.1:80"]),
+            ("ports_csv", HOSTS, "22,80"),
+            ("ports_csv", [], "1-1000"),
+            ("hosts_to_ips", HOSTS, "10.0.0.1,10.0.0.2"),
+            ("join_newline", ["a", None, "b"], "a\nb"),
+            ("to_port_list", [443, 22, 443], "22,443"),
+            (
+                "wpa_networks",
+                [{"bssid": "aa", "encryption": "WPA2"}, {"bssid": "bb"}],
+                [{"bssid": "aa", "encryption": "WPA2"}],
+            ),
+        ],
+    )
+    def test_named_transform(self, name, data, expected):
+        """Named transforms produce the documented output."""
+        from voidwave.chaining.transforms import apply_transform
+
+        assert apply_transform(name, data) == expected
+
+    def test_unknown_transform_passes_data_through(self):
+        """An unknown transform name leaves the data unchanged."""
+        from voidwave.chaining.transforms import apply_transform
+
+        assert apply_transform("no_such_transform", HOSTS) is HOSTS
+
+
+class TestResolvePath:
+    """Test JSONPath-like path resolution."""
+
+    @pytest.mark.parametrize(
+        ("path", "expected"),
+        [
+            ("[0].ip", "10.0.0.1"),
+            ("[-1].ports[0].port", 22),
+            ("[*].ip", ["10.0.0.1", "10.0.0.2"]),
+            ("[0].ports[?port>=80]", HOSTS[0]["ports"][1:]),
+            ("[1].ports[?service==ssh]", HOSTS[1]["ports"]),
+            ("[0].ports[?state!=open]", [HOSTS[0]["ports"][2]]),
+            ("[5].ip", None),
+        ],
+    )
+    def test_resolve(self, path, expected):
+        """Paths resolve keys, indexes, wildcards and filters."""
+        from voidwave.chaining.paths import resolve_path
+
+        assert resolve_path(HOSTS, path) == expected
+
+    def test_repeated_paths_parse_once(self):
+        """A path string is parsed once and reused on later resolutions."""
+        from voidwave.chaining.paths import _parse_path, resolve_path
+
+        path = "[*].ip"
+        resolve_path(HOSTS, path)
+        hits = _parse_path.cache_info().hits
+
+        assert resolve_path(HOSTS, path) == ["10.0.0.1", "10.0.0.2"]
+        assert _parse_path.cache_info().hits == hits + 1
+
+
+class TestBuiltinChains:
+    """Test the built-in chain definitions."""
+
+    def test_wordlist_paths_shared_across_modules(self):
+        """The same wordlist path is one string object in every chain module."""
+        from voidwave.chaining.builtin import credentials, recon, web, wireless
+
+        assert credentials._ROCKYOU is wireless._ROCKYOU
+        assert recon._WEB_COMMON is web._WEB_COMMON
+        step = credentials.hash_crack_chain.steps[0]
+        assert step.options["wordlist"] is wireless._ROCKYOU
+
+    def test_shared_options_are_copied_per_run(self):
+        """Steps share read-only option sets; each run gets its own copy."""
+        from voidwave.chaining.builtin.wireless import wpa_crack_chain, wpa_full_chain
+        from voidwave.chaining.executor import ChainExecutor
+        from voidwave.chaining.models import ChainStep
+
+        aircrack = wpa_crack_chain.steps[0]
+        assert aircrack.options is wpa_full_chain.steps[-1].options
+        with pytest.raises(TypeError):
+            aircrack.options["wordlist"] = "other.txt"
+
+        options = ChainExecutor()._resolve_options(aircrack)
+        options["timeout"] = 60
+        assert "timeout" not in aircrack.options
+        first, second = ChainStep(id="a", tool="x"), ChainStep(id="b", tool="x")
+        assert first.options is second.options
+
+    def test_binding_transforms_resolved_at_definition(self):
+        """Built-in bindings reference transform callables, not names."""
+        from voidwave.chaining.builtin import (
+            credentials,
+            recon,
+            scanning,
+            web,
+            wireless,
+        )
+
+        bindings = [
+            binding
+            for module in (credentials, recon, scanning, web, wireless)
+            for chain in module._CHAINS
+            for step in chain.steps
+            for binding in (step.target_binding, *step.option_bindings)
+            if binding is not None and binding.transform is not None
+        ]
+
+        assert bindings
+        assert all(callable(binding.transform) for binding in bindings)
+
+    def test_builtin_options_are_read_only(self):
+        """Built-in step options are frozen when the chain is defined."""
+        from types import MappingProxyType
+
+        from voidwave.chaining.builtin import (
+            credentials,
+            recon,
+            scanning,
+            web,
+            wireless,
+        )
+
+        steps = [
+            step
+            for module in (credentials, recon, scanning, web, wireless)
+            for chain in module._CHAINS
+            for step in chain.steps
+        ]
+
+        assert all(isinstance(step.options, MappingProxyType) for step in steps)
+
+    def test_importing_builtins_skips_settings_layer(self):
+        """Loading the chain definitions does not import settings or the DB."""
+        code = (
+            "import sys, voidwave.chaining.builtin.recon; "
+            "print(sorted(m for m in ('voidwave.config', 'voidwave.db') "
+            "if m in sys.modules))"
+        )
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+        out = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            env=env,
+            check=False,
+        )
+
+        assert out.stdout.strip() == "[]", out.stderr
+
+
+class TestChainRegistry:
+    """Test the chain registry."""
+
+    def test_register_many_matches_register(self):
+        """Bulk registration indexes chains and tags like register()."""
+        from voidwave.chaining.builtin.credentials import _CHAINS
+        from voidwave.chaining.registry import ChainRegistry
+
+        one_by_one, bulk = ChainRegistry(), ChainRegistry()
+        for chain in _CHAINS:
+            one_by_one.register(chain)
+        bulk.register_many(iter(_CHAINS))
+
+        assert bulk.list_ids() == one_by_one.list_ids()
+        assert bulk._tags == one_by_one._tags
+        assert {c.id for c in bulk.get_by_tag("bruteforce")} == {
+            "ssh_bruteforce",
+            "web_bruteforce",
+            "ftp_bruteforce",
+        }
+
+    def test_compose_builds_step_tuple(self):
+        """Composed chains prefix step ids and keep steps as a tuple."""
+        from voidwave.chaining.builtin.scanning import _CHAINS
+        from voidwave.chaining.registry import ChainRegistry
+
+        registry = ChainRegistry()
+        registry.register_many(_CHAINS)
+        first, second = _CHAINS[0], _CHAINS[1]
+        composed = registry.compose(first.id, second.id)
+
+        assert all(isinstance(chain.steps, tuple) for chain in _CHAINS)
+        assert isinstance(composed.steps, tuple)
+        assert len(composed.steps) == len(first.steps) + len(second.steps)
+        assert composed.steps[0].id == f"{first.id}.{first.steps[0].id}"
+        assert first.steps[0].id != composed.steps[0].id
+
+    def test_definition_accepts_step_list(self):
+        """Steps given as a list are stored as a tuple."""
+        from voidwave.chaining.models import ChainDefinition, ChainStep
+
+        step = ChainStep(id="scan", tool="nmap")
+        chain = ChainDefinition(id="c", name="C", description="", steps=[step])
+
+        assert chain.steps == (step,)
+
+    def test_register_plans_execution_once(self):
+        """Registration builds the execution plan that later runs reuse."""
+        from voidwave.chaining.builtin.credentials import credential_spray_chain
+        from voidwave.chaining.plan import execution_plan
+        from voidwave.chaining.registry import ChainRegistry
+
+        ChainRegistry().register(credential_spray_chain)
+        plan = credential_spray_chain._plan[-1]
+
+        assert execution_plan(credential_spray_chain) is plan
+        assert [{step.id for step in group} for group in plan] == [
+            {"discover_services"},
+            {"spray_ssh", "spray_smb"},
+        ]
+
+    def test_plan_rebuilt_when_steps_replaced(self):
+        """Replacing a chain's steps invalidates its cached plan."""
+        from voidwave.chaining.models import ChainDefinition, ChainStep
+        from voidwave.chaining.plan import ChainExecutionError, execution_plan
+        from voidwave.chaining.registry import ChainRegistry
+
+        chain = ChainDefinition(
+            id="loop",
+            name="Loop",
+            description="",
+            steps=(
+                ChainStep(id="a", tool="x", depends_on=["b"]),
+                ChainStep(id="b", tool="x", depends_on=["a"]),
+            ),
+        )
+        ChainRegistry().register(chain)
+        assert chain._plan is None
+        with pytest.raises(ChainExecutionError):
+            execution_plan(chain)
+
+        chain.steps = (ChainStep(id="a", tool="x"),)
+        assert [[s.id for s in group] for group in execution_plan(chain)] == [["a"]]
+
+    def test_plan_rebuilt_when_step_edited(self):
+        """Editing a step's dependencies in place invalidates the cached plan."""
+        from voidwave.chaining.models import ChainDefinition, ChainStep
+        from voidwave.chaining.plan import execution_plan
+
+        chain = ChainDefinition(
+            id="pair",
+            name="Pair",
+            description="",
+            steps=(ChainStep(id="a", tool="x"), ChainStep(id="b", tool="x")),
+        )
+        assert len(execution_plan(chain)) == 1
+
+        chain.steps[1].depends_on.append("a")
+        assert [[s.id for s in group] for group in execution_plan(chain)] == [
+            ["a"],
+            ["b"],
+        ]
+
+    def test_builtin_chains_registered_once(self, monkeypatch):
+        """Every built-in chain is registered in one batch, and only once."""
+        from voidwave.chaining import builtin
+        from voidwave.chaining.builtin import (
+            credentials,
+            recon,
+            register_all_builtin_chains,
+            scanning,
+            web,
+            wireless,
+        )
+        from voidwave.chaining.registry import ChainRegistry
+
+        registry = ChainRegistry()
+        monkeypatch.setattr(builtin, "chain_registry", registry)
+
+        register_all_builtin_chains()
+        modules = (credentials, recon, scanning, web, wireless)
+        expected = {chain.id for module in modules for chain in module._CHAINS}
+        assert len(expected) == 23
+        assert {chain.id for chain in builtin._all_chains()} == expected
+        assert builtin._all_chains() is builtin._all_chains()
+        assert set(registry.list_ids()) == expected
+
+        batches = []
+        monkeypatch.setattr(registry, "register_many", batches.append)
+        register_all_builtin_chains()
+        assert batches == []
+
+        registry.unregister("hash_crack")
+        register_all_builtin_chains()
+        assert batches == [[credentials.hash_crack_chain]]